@@ -1,17 +1,14 @@
 import streamlit as st
-import base64
-import os
+
+from prerender import start_prerender
+from utils.assets import get_asset_registry
 
 st.set_page_config(page_title="Job Architecture", layout="wide")
 
-def load_icon_png(path):
-    if not os.path.exists(path):
-        return ""
-    with open(path, "rb") as f:
-        return base64.b64encode(f.read()).decode("utf-8")
+# descrições dos Job Profiles pré-renderizadas em segundo plano (página Job Match)
+start_prerender()
 
-icon_path = "assets/icons/governance.png"
-icon_b64 = load_icon_png(icon_path)
+icon_b64 = get_asset_registry().b64("assets/icons/governance.png", page="Home")
 
 html = f"""
 <style>
@@ -0,0 +1,88 @@
+# benchmarks/bench_bulk_parallel.py
+# ==========================================================
+# Bulk matching throughput: single process vs process pool
+#
+#   python benchmarks/bench_bulk_parallel.py [--positions 200000] [--max-workers 8]
+#
+# Generates synthetic positions (random grade answers and KPI/competency
+# picks from the real catalogue vocabulary), runs bulk_job_match once as the
+# baseline and parallel_bulk_job_match for 1, 2, 4, ... workers, checks the
+# results are identical and reports positions/s and scaling efficiency
+# (speedup / workers). Efficiency is capped by the number of CPUs.
+# ==========================================================
+import argparse
+import os
+import random
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+import pandas as pd  # noqa: E402
+
+from match_engine import _encode_map, build_match_catalogue, bulk_job_match  # noqa: E402
+from match_parallel import DEFAULT_SHARD_SIZE, parallel_bulk_job_match  # noqa: E402
+from utils.data_store import build_data_store  # noqa: E402
+
+GRADE_FIELDS = ["leadership_type", "org_influence", "org_impact", "span_control", "geo_scope"]
+
+
+def synthetic_positions(catalogue, n: int, seed: int = 0) -> pd.DataFrame:
+    rng = random.Random(seed)
+    pairs = list(catalogue.partitions)
+    answers = list(_encode_map())
+    kpis, comps = list(catalogue.kpi_vocab), list(catalogue.comp_vocab)
+    rows = []
+    for i in range(n):
+        family, sub = rng.choice(pairs)
+        row = {f: rng.choice(answers) for f in GRADE_FIELDS}
+        row.update(
+            position_id=f"P{i:07d}", job_family=family, sub_job_family=sub,
+            kpis_selected=rng.sample(kpis, min(len(kpis), rng.randint(0, 4))),
+            competencies_selected=rng.sample(comps, min(len(comps), rng.randint(0, 4))),
+        )
+        rows.append(row)
+    return pd.DataFrame(rows)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Bulk matching: serial vs process pool")
+    parser.add_argument("--positions", type=int, default=200_000)
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--shard-size", type=int, default=DEFAULT_SHARD_SIZE)
+    parser.add_argument("--top-k", type=int, default=3)
+    args = parser.parse_args()
+
+    profiles = build_data_store().job_profile_filled
+    catalogue = build_match_catalogue(profiles)
+    positions = synthetic_positions(catalogue, args.positions)
+    print(f"{len(positions)} positions x {len(catalogue)} profiles, {os.cpu_count()} CPUs\n")
+
+    t0 = time.perf_counter()
+    expected = bulk_job_match(positions, profiles, catalogue, top_k=args.top_k)
+    serial_s = time.perf_counter() - t0
+
+    print(f"{'run':<20}{'seconds':>9}{'pos/s':>11}{'speedup':>9}{'efficiency':>12}")
+    print(f"{'bulk_job_match':<20}{serial_s:>9.2f}{len(positions) / serial_s:>11.0f}{'1.0x':>9}{'':>12}")
+
+    workers = 1
+    while workers <= args.max_workers:
+        t0 = time.perf_counter()
+        result = parallel_bulk_job_match(
+            positions, profiles, catalogue, top_k=args.top_k,
+            workers=workers, shard_size=args.shard_size,
+        )
+        elapsed = time.perf_counter() - t0
+        pd.testing.assert_frame_equal(result, expected)
+        speedup = serial_s / elapsed
+        print(
+            f"{f'{workers} workers':<20}{elapsed:>9.2f}{len(positions) / elapsed:>11.0f}"
+            f"{speedup:>8.1f}x{speedup / workers:>11.0%}"
+        )
+        workers *= 2
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+# benchmarks/bench_coalescer.py
+# ==========================================================
+# Micro-batching (match_coalescer) vs direct scoring under concurrency
+#
+#   python benchmarks/bench_coalescer.py [--clients 1,8,32,128] [--requests 4000]
+#                                        [--window-ms 0] [--k 4] [--families 0]
+#                                        [--scoring dimensions|grade]
+#
+# Simulates N concurrent sessions as N threads. Each one sends its share of
+# requests back to back and waits for every answer (closed loop), once
+# calling `rank_catalogue` directly and once going through a MatchCoalescer.
+# Forms are sampled from the real catalogue (bundle). --families N restricts
+# them to the N most populated Job Family + Sub Job Family pairs, which
+# simulates a cohort of users working on the same area.
+# Reports requests/s, latency percentiles and the mean batch size.
+# ==========================================================
+import argparse
+import sys
+import threading
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "benchmarks"))
+
+import numpy as np  # noqa: E402
+
+from bench_server import synthetic_forms  # noqa: E402
+from match_coalescer import DEFAULT_WINDOW_MS, MatchCoalescer  # noqa: E402
+from match_core import rank_catalogue  # noqa: E402
+from server import load_catalogue  # noqa: E402
+
+
+def _run_clients(call, forms: list, clients: int, k: int) -> tuple:
+    latencies, errors = [], []
+    shares = [forms[i::clients] for i in range(clients)]
+    start = threading.Barrier(clients + 1)
+
+    def client(share):
+        start.wait()
+        for form in share:
+            t0 = time.perf_counter()
+            try:
+                call(form, k)
+            except Exception as exc:  # noqa: BLE001 — só contamos
+                errors.append(exc)
+            latencies.append(time.perf_counter() - t0)
+
+    threads = [threading.Thread(target=client, args=(share,)) for share in shares]
+    for t in threads:
+        t.start()
+    start.wait()
+    t0 = time.perf_counter()
+    for t in threads:
+        t.join()
+    return time.perf_counter() - t0, latencies, errors
+
+
+def _report(label: str, elapsed: float, latencies: list, errors: list, extra: str = "") -> None:
+    ms = np.asarray(latencies) * 1000
+    print(f"  {label:<10} {len(latencies) / elapsed:9.0f}/s   p50 {np.percentile(ms, 50):6.2f}  "
+          f"p95 {np.percentile(ms, 95):6.2f}  p99 {np.percentile(ms, 99):6.2f} ms"
+          f"{'  errors ' + str(len(errors)) if errors else ''}{extra}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="match_coalescer benchmark")
+    parser.add_argument("--clients", default="1,8,32,128", help="comma-separated concurrency levels")
+    parser.add_argument("--requests", type=int, default=4000)
+    parser.add_argument("--window-ms", type=float, default=DEFAULT_WINDOW_MS)
+    parser.add_argument("--k", type=int, default=4)
+    parser.add_argument("--families", type=int, default=0, help="restrict forms to the N largest pairs")
+    parser.add_argument("--scoring", choices=["dimensions", "grade"], default="dimensions")
+    args = parser.parse_args()
+
+    catalogue, dimensions = load_catalogue(args.scoring)
+    forms = synthetic_forms(args.requests * 4)
+    if args.families:
+        sizes = sorted(catalogue.partitions.items(), key=lambda kv: kv[1][0] - kv[1][1])
+        keep = {pair for pair, _ in sizes[:args.families]}
+        forms = [f for f in forms if (f["job_family"], f["sub_job_family"]) in keep]
+    forms = forms[:args.requests]
+
+    print(f"{len(forms)} requests, k={args.k}, {args.scoring} scoring, window {args.window_ms} ms"
+          f"{f', {args.families} families' if args.families else ''}")
+    for clients in [int(c) for c in args.clients.split(",")]:
+        print(f"clients={clients}")
+        elapsed, lat, err = _run_clients(
+            lambda form, k: rank_catalogue(catalogue, form, k, dimensions), forms, clients, args.k
+        )
+        _report("direct", elapsed, lat, err)
+
+        coalescer = MatchCoalescer(catalogue, dimensions, window_ms=args.window_ms)
+        try:
+            elapsed, lat, err = _run_clients(coalescer.rank, forms, clients, args.k)
+        finally:
+            coalescer.close()
+        _report("coalesced", elapsed, lat, err, f"  mean batch {coalescer.stats()['mean_batch']:.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+# benchmarks/bench_data_loader.py
+# ==========================================================
+# Cold vs warm load of the six workbooks in data/
+#
+#   python benchmarks/bench_data_loader.py [--repeat 5]
+#
+# cold = pd.read_excel + snapshot write (empty snapshot dir)
+# warm = snapshot read (size/mtime unchanged)
+#
+#   python benchmarks/bench_data_loader.py --scale 20 --workers 4
+#
+# --scale N also writes N-times-larger copies of the workbooks to a temp
+# dir and compares serial vs process-pool ingestion (no snapshots).
+# ==========================================================
+import argparse
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+import pandas as pd  # noqa: E402
+
+from utils.data_loader import DATA_FILES, load_excel_data, read_workbook  # noqa: E402
+
+
+def _time(fn, repeat: int) -> float:
+    runs = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        runs.append(time.perf_counter() - t0)
+    return statistics.median(runs)
+
+
+def _write_scaled(data_dir: Path, out_dir: Path, scale: int) -> None:
+    for filename in DATA_FILES.values():
+        path = data_dir / filename
+        if path.exists():
+            df = pd.read_excel(path)
+            pd.concat([df] * scale, ignore_index=True).to_excel(out_dir / filename, index=False)
+
+
+def bench_parallel(data_dir: Path, scale: int, workers: int, repeat: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        scaled_dir = Path(tmp)
+        print(f"\nwriting {scale}x workbooks ...")
+        _write_scaled(data_dir, scaled_dir, scale)
+        total_mb = sum(p.stat().st_size for p in scaled_dir.iterdir()) / 1024 / 1024
+
+        serial_s = _time(lambda: load_excel_data(scaled_dir, snapshot_dir=None, workers=1), repeat)
+        parallel_s = _time(lambda: load_excel_data(scaled_dir, snapshot_dir=None, workers=workers), repeat)
+
+    print(f"{'ingestion':<34}{'size MB':>9}{'serial s':>10}{'pool s':>10}{'speedup':>9}")
+    print(
+        f"{f'{scale}x, {workers} workers':<34}{total_mb:>9.1f}"
+        f"{serial_s:>10.2f}{parallel_s:>10.2f}{serial_s / parallel_s:>8.1f}x"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Cold vs warm workbook load")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--data-dir", type=Path, default=ROOT / "data")
+    parser.add_argument("--scale", type=int, default=0, help="also benchmark parallel ingestion at N x size")
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    print(f"{'workbook':<34}{'size KB':>9}{'cold ms':>10}{'warm ms':>10}{'speedup':>9}")
+    total_cold = total_warm = 0.0
+
+    for filename in DATA_FILES.values():
+        path = args.data_dir / filename
+        if not path.exists():
+            continue
+
+        def cold():
+            with tempfile.TemporaryDirectory() as tmp:
+                read_workbook(path, Path(tmp))
+
+        with tempfile.TemporaryDirectory() as tmp:
+            snapshot_dir = Path(tmp)
+            read_workbook(path, snapshot_dir)  # prime
+            warm_s = _time(lambda: read_workbook(path, snapshot_dir), args.repeat)
+        cold_s = _time(cold, args.repeat)
+
+        total_cold += cold_s
+        total_warm += warm_s
+        print(
+            f"{filename:<34}{path.stat().st_size / 1024:>9.0f}"
+            f"{cold_s * 1000:>10.1f}{warm_s * 1000:>10.2f}{cold_s / warm_s:>8.0f}x"
+        )
+
+    print(
+        f"{'TOTAL':<34}{'':>9}{total_cold * 1000:>10.1f}{total_warm * 1000:>10.2f}"
+        f"{total_cold / total_warm:>8.0f}x"
+    )
+
+    if args.scale:
+        bench_parallel(args.data_dir, args.scale, args.workers, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+# benchmarks/bench_global_match.py
+# ==========================================================
+# Global match (match_global) vs brute force over the whole catalogue
+#
+#   python benchmarks/bench_global_match.py [--forms 300] [--k 4] [--seed 0]
+#                                           [--scoring dimensions|grade]
+#
+# Random forms answer every one of the 20 dimensions with a valid option
+# and pick 1-4 KPIs / competencies from the catalogue vocabulary. For each
+# form, the best profile of `rank_global_matches` (index + exact re-rank) is
+# compared with the best exact score over every profile. A form is a miss
+# when the global answer scores below that brute-force best.
+# Exits with status 1 when any form misses, so it doubles as a check. The
+# 20-dimension scoring (the default everywhere) is expected to have no
+# misses; the grade-hint scoring searches a log-grade axis that only
+# approximates its grade similarity and misses about 1% of forms.
+# ==========================================================
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from match_core import FORM_SCALES  # noqa: E402
+from match_engine import build_dimension_matrix, build_match_catalogue, score_candidates  # noqa: E402
+from match_global import build_neighbor_index, rank_global_matches  # noqa: E402
+from utils.data_store import build_data_store  # noqa: E402
+
+
+def random_forms(catalogue, n: int, seed: int) -> list:
+    rng = random.Random(seed)
+    kpis, comps = list(catalogue.kpi_vocab), list(catalogue.comp_vocab)
+    forms = []
+    for _ in range(n):
+        form = {dim: rng.choice(list(scale)) for dim, scale in FORM_SCALES.items()}
+        form.update(
+            job_family=None, sub_job_family=None,
+            kpis_selected=rng.sample(kpis, min(len(kpis), rng.randint(1, 4))),
+            competencies_selected=rng.sample(comps, min(len(comps), rng.randint(1, 4))),
+        )
+        forms.append(form)
+    return forms
+
+
+def check(label: str, df, catalogue, dimensions, forms: list, k: int) -> int:
+    index = build_neighbor_index(catalogue, dimensions)
+    everything = slice(0, len(catalogue))
+    misses, gaps, t_index, t_brute = 0, [], 0.0, 0.0
+    for form in forms:
+        t0 = time.perf_counter()
+        ranked = rank_global_matches(form, df, k=k, index=index, dimensions=dimensions)
+        t_index += time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        best = float(score_candidates(catalogue, everything, form, dimensions).max())
+        t_brute += time.perf_counter() - t0
+
+        gap = best - ranked[0]["score"]
+        if gap > 1e-12:
+            misses += 1
+            gaps.append(gap)
+
+    n = len(forms)
+    print(f"  {label:<10} misses {misses}/{n}"
+          f"{f'  max gap {max(gaps):.4f}' if gaps else ''}"
+          f"  global {t_index / n * 1000:.2f} ms  brute {t_brute / n * 1000:.2f} ms")
+    return misses
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="match_global recall vs brute force")
+    parser.add_argument("--forms", type=int, default=300)
+    parser.add_argument("--k", type=int, default=4)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--scoring", choices=["dimensions", "grade"], default="dimensions")
+    args = parser.parse_args()
+
+    store = build_data_store()
+    df = store.job_profile_filled
+    catalogue = build_match_catalogue(df)
+    dimensions = build_dimension_matrix(catalogue, store.level_structure, store.career_bands_levels)
+    forms = random_forms(catalogue, args.forms, args.seed)
+
+    print(f"{len(catalogue)} profiles, {len(forms)} forms, k={args.k}")
+    misses = check(args.scoring, df, catalogue, dimensions if args.scoring == "dimensions" else None,
+                   forms, args.k)
+    sys.exit(1 if misses else 0)
+
+
+if __name__ == "__main__":
+    main()
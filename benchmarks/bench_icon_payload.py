@@ -0,0 +1,64 @@
+# benchmarks/bench_icon_payload.py
+# ==========================================================
+# Payload of the rendered HTML pages: inline SVG icons vs sprite
+#
+#   python benchmarks/bench_icon_payload.py [--samples 50]
+#
+# For the Job Match description (page 5) and the profile comparison with
+# 1, 2 and 3 profiles (page 3), prints the page size with the sprite
+# (`utils.icons.IconSprite`), what the same page would weigh with every icon
+# inlined (the previous markup) and the bytes saved. Sizes are UTF-8 bytes,
+# averaged over --samples profiles of the real dataset.
+# ==========================================================
+import argparse
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+import numpy as np  # noqa: E402
+
+from html_renderer import DESCRIPTION_ICONS, render_job_description, render_profile_comparison  # noqa: E402
+from utils.data_store import build_data_store  # noqa: E402
+from utils.icons import IconSprite  # noqa: E402
+
+
+def _row(label: str, pages: list) -> None:
+    sprite, inline = np.mean([p[0] for p in pages]), np.mean([p[1] for p in pages])
+    print(f"{label:<28} {inline:10.0f} {sprite:10.0f} {inline - sprite:10.0f} {100 * (inline - sprite) / inline:7.1f}%")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="icon payload report")
+    parser.add_argument("--samples", type=int, default=50)
+    args = parser.parse_args()
+
+    df = build_data_store().job_profile
+    rng = np.random.default_rng(0)
+    picks = rng.choice(len(df), size=(args.samples, 3), replace=True)
+
+    print(f"{'page':<28} {'inline B':>10} {'sprite B':>10} {'saved B':>10} {'saved':>8}")
+
+    icons = DESCRIPTION_ICONS.report()
+    pages = []
+    for i in picks[:, 0]:
+        size = len(render_job_description(df.iloc[i], 100).encode("utf-8"))
+        pages.append((size, size - icons["sprite_bytes"] + icons["inline_bytes"]))
+    _row("Job Match description", pages)
+
+    for n in (1, 2, 3):
+        pages = []
+        for row in picks:
+            sprite = IconSprite()
+            size = len(render_profile_comparison([df.iloc[i].to_dict() for i in row[:n]], sprite).encode("utf-8"))
+            r = sprite.report()
+            pages.append((size, size - r["sprite_bytes"] + r["inline_bytes"]))
+        _row(f"Profile comparison x{n}", pages)
+
+    r = sprite.report()
+    print(f"\nicons per 3-profile page: {r['uses']} uses of {r['symbols']} symbols")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,216 @@
+# benchmarks/bench_match_engine.py
+# ==========================================================
+# Match engine scaling: synthetic Job Profile catalogues from 1k to 1M rows
+#
+#   python benchmarks/bench_match_engine.py [--sizes 1000 10000 100000 1000000]
+#                                           [--queries 500] [--json PATH]
+#
+# For each catalogue size:
+#   build   — build_match_catalogue (time, then tracemalloc peak in a second
+#             untimed build, + catalogue array bytes)
+#   query   — compute_job_match end to end, p50/p95/p99/max latency
+#   stages  — the same queries split into partition lookup, scoring,
+#             top-k selection and row materialization (mean per query)
+#
+# Synthetic catalogues follow the real data's shape: Zipf-skewed Job Family
+# and Sub Job Family sizes, grades 2-21, comma-separated KPI / competency
+# strings. Every number is also written as JSON for release-over-release
+# comparison, to .cache/bench/match_engine.json unless --json names a file.
+# ==========================================================
+import argparse
+import json
+import platform
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+import numpy as np  # noqa: E402
+import pandas as pd  # noqa: E402
+
+from match_engine import (  # noqa: E402
+    _encode_map,
+    _top_indices,
+    build_match_catalogue,
+    compute_job_match,
+    score_candidates,
+)
+
+N_FAMILIES = 15
+SUBS_PER_FAMILY = 8
+KPI_VOCAB = [f"KPI {i:03d} delivery / quality target" for i in range(300)]
+COMP_VOCAB = [
+    "Communication", "Collaboration", "Analytical Thinking", "Technical Expertise",
+    "Leadership", "Innovation", "Strategic Thinking", "Customer Orientation",
+    "Drives Engagement", "Collaborates", "Self-development", "Resourcefulness",
+    "Decision Quality", "Manages Complexity",
+]
+GRADE_FIELDS = ["leadership_type", "org_influence", "org_impact", "span_control", "geo_scope"]
+
+DEFAULT_REPORT = ROOT / ".cache" / "bench" / "match_engine.json"
+
+
+def _zipf(n: int, s: float = 1.1) -> np.ndarray:
+    w = 1.0 / np.arange(1, n + 1) ** s
+    return w / w.sum()
+
+
+def synthetic_catalogue(rows: int, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    fam = rng.choice(N_FAMILIES, size=rows, p=_zipf(N_FAMILIES))
+    sub = rng.choice(SUBS_PER_FAMILY, size=rows, p=_zipf(SUBS_PER_FAMILY, 0.8))
+    grade = np.clip(np.rint(rng.normal(11, 3, size=rows)), 2, 21).astype(int)
+
+    n_kpi = rng.integers(0, 4, size=rows)
+    kpi_idx = rng.integers(0, len(KPI_VOCAB), size=(rows, 3))
+    comp_idx = rng.integers(0, len(COMP_VOCAB), size=(rows, 3))
+    kpis = [", ".join(KPI_VOCAB[j] for j in kpi_idx[i, :n_kpi[i]]) for i in range(rows)]
+
+    return pd.DataFrame({
+        "Job Family": [f"Family {f:02d}" for f in fam],
+        "Sub Job Family": [f"Family {f:02d} / Sub {s}" for f, s in zip(fam, sub)],
+        "Full Job Code": [f"JC{i:07d}" for i in range(rows)],
+        "Job Profile": [f"Profile {i}" for i in range(rows)],
+        "Global Grade": grade,
+        "Specific parameters / KPIs": kpis,
+        "Competencies 1": [COMP_VOCAB[j] for j in comp_idx[:, 0]],
+        "Competencies 2": [COMP_VOCAB[j] for j in comp_idx[:, 1]],
+        "Competencies 3": [COMP_VOCAB[j] for j in comp_idx[:, 2]],
+    })
+
+
+def synthetic_forms(catalogue, n: int, seed: int = 1) -> list:
+    rng = random.Random(seed)
+    pairs = list(catalogue.partitions)
+    weights = [stop - start for start, stop in catalogue.partitions.values()]
+    answers = list(_encode_map())
+    forms = []
+    for family, sub in rng.choices(pairs, weights=weights, k=n):
+        form = {f: rng.choice(answers) for f in GRADE_FIELDS}
+        form.update(
+            job_family=family, sub_job_family=sub,
+            kpis_selected=rng.sample(KPI_VOCAB, rng.randint(0, 4)),
+            competencies_selected=rng.sample(COMP_VOCAB, rng.randint(1, 4)),
+        )
+        forms.append(form)
+    return forms
+
+
+def _percentiles(samples: list) -> dict:
+    ms = np.asarray(samples) * 1000
+    return {
+        "p50_ms": float(np.percentile(ms, 50)),
+        "p95_ms": float(np.percentile(ms, 95)),
+        "p99_ms": float(np.percentile(ms, 99)),
+        "max_ms": float(ms.max()),
+        "mean_ms": float(ms.mean()),
+    }
+
+
+def bench_size(rows: int, queries: int) -> dict:
+    df = synthetic_catalogue(rows)
+
+    t0 = time.perf_counter()
+    catalogue = build_match_catalogue(df)
+    build_s = time.perf_counter() - t0
+
+    # segunda construção só para memória: tracemalloc distorce o tempo
+    tracemalloc.start()
+    build_match_catalogue(df)
+    _, build_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    array_bytes = sum(
+        getattr(catalogue, name).nbytes
+        for name in ("row_order", "grade", "grade_missing", "kpi_bits", "kpi_count", "comp_bits", "comp_count")
+    )
+
+    forms = synthetic_forms(catalogue, queries)
+    compute_job_match(forms[0], df, catalogue=catalogue)  # aquece caches
+
+    end_to_end = []
+    for form in forms:
+        t0 = time.perf_counter()
+        compute_job_match(form, df, catalogue=catalogue)
+        end_to_end.append(time.perf_counter() - t0)
+
+    stages = {"partition": [], "score": [], "top_k": [], "row": []}
+    candidates = []
+    for form in forms:
+        t0 = time.perf_counter()
+        part = catalogue.partition(form["job_family"], form["sub_job_family"])
+        t1 = time.perf_counter()
+        scores = score_candidates(catalogue, part, form)
+        t2 = time.perf_counter()
+        top = _top_indices(scores, 1)
+        t3 = time.perf_counter()
+        catalogue.row(part.start + int(top[0]))
+        t4 = time.perf_counter()
+        for name, dt in zip(stages, (t1 - t0, t2 - t1, t3 - t2, t4 - t3)):
+            stages[name].append(dt)
+        candidates.append(part.stop - part.start)
+
+    return {
+        "rows": rows,
+        "partitions": len(catalogue.partitions),
+        "candidates_per_query": {
+            "mean": float(np.mean(candidates)),
+            "max": int(np.max(candidates)),
+        },
+        "build": {
+            "seconds": build_s,
+            "peak_traced_mb": build_peak / 1024 / 1024,
+            "catalogue_arrays_mb": array_bytes / 1024 / 1024,
+            "profiles_frame_mb": df.memory_usage(deep=True).sum() / 1024 / 1024,
+        },
+        "query": _percentiles(end_to_end),
+        "stages_mean_ms": {name: statistics.fmean(v) * 1000 for name, v in stages.items()},
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Match engine scaling benchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument("--queries", type=int, default=500)
+    parser.add_argument("--json", type=Path, default=DEFAULT_REPORT,
+                        help=f"write results to this file (default: {DEFAULT_REPORT.relative_to(ROOT)})")
+    args = parser.parse_args()
+
+    print(
+        f"{'rows':>9}{'build s':>9}{'peak MB':>9}{'arr MB':>8}{'cand':>8}"
+        f"{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}  stages ms (partition/score/top_k/row)"
+    )
+    results = []
+    for rows in args.sizes:
+        r = bench_size(rows, args.queries)
+        results.append(r)
+        b, q, s = r["build"], r["query"], r["stages_mean_ms"]
+        print(
+            f"{rows:>9}{b['seconds']:>9.2f}{b['peak_traced_mb']:>9.1f}{b['catalogue_arrays_mb']:>8.1f}"
+            f"{r['candidates_per_query']['mean']:>8.0f}"
+            f"{q['p50_ms']:>9.3f}{q['p95_ms']:>9.3f}{q['p99_ms']:>9.3f}  "
+            + " / ".join(f"{v:.3f}" for v in s.values())
+        )
+
+    report = {
+        "benchmark": "match_engine",
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "machine": platform.machine(),
+        "queries": args.queries,
+        "results": results,
+    }
+    args.json.parent.mkdir(parents=True, exist_ok=True)
+    args.json.write_text(json.dumps(report, indent=2))
+    print(f"\nwrote {args.json}")
+
+
+if __name__ == "__main__":
+    main()
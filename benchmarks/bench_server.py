@@ -0,0 +1,163 @@
+# benchmarks/bench_server.py
+# ==========================================================
+# Load generator for server.py (localhost, keep-alive)
+#
+#   python benchmarks/bench_server.py [--connections 16] [--requests 4000]
+#                                     [--endpoint match|top|batch] [--batch-size 50]
+#                                     [--url http://127.0.0.1:8765] [--coalesce]
+#
+# Without --url it starts `server.py --port 0` as a child process (same
+# --workers / --executor) and stops it at the end. Each connection sends
+# its share of requests back to back over one keep-alive socket.
+# Reports requests/s, forms/s and latency percentiles (p50/p95/p99/max).
+# ==========================================================
+import argparse
+import asyncio
+import json
+import random
+import subprocess
+import sys
+import time
+from pathlib import Path
+from urllib.parse import urlparse
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+import numpy as np  # noqa: E402
+
+from match_core import _encode_map, load_bundle  # noqa: E402
+from server import load_catalogue  # noqa: E402
+
+GRADE_FIELDS = ["leadership_type", "org_influence", "org_impact", "span_control", "geo_scope"]
+PATHS = {"match": "/match", "top": "/match/top", "batch": "/match/batch"}
+
+
+def synthetic_forms(n: int, seed: int = 0) -> list:
+    loaded = load_bundle()
+    catalogue = loaded[0] if loaded else load_catalogue()[0]
+    rng = random.Random(seed)
+    pairs = list(catalogue.partitions)
+    answers = [a for a in _encode_map() if a != "Choose option"]
+    kpis, comps = list(catalogue.kpi_vocab), list(catalogue.comp_vocab)
+    forms = []
+    for _ in range(n):
+        family, sub = rng.choice(pairs)
+        form = {f: rng.choice(answers) for f in GRADE_FIELDS}
+        form.update(
+            job_family=family, sub_job_family=sub,
+            kpis_selected=rng.sample(kpis, min(len(kpis), rng.randint(0, 4))),
+            competencies_selected=rng.sample(comps, min(len(comps), rng.randint(1, 4))),
+        )
+        forms.append(form)
+    return forms
+
+
+def _request(host: str, path: str, payload: dict) -> bytes:
+    body = json.dumps(payload).encode("utf-8")
+    return (
+        f"POST {path} HTTP/1.1\r\nHost: {host}\r\nContent-Type: application/json\r\n"
+        f"Content-Length: {len(body)}\r\n\r\n"
+    ).encode("latin-1") + body
+
+
+async def _read_response(reader: asyncio.StreamReader) -> int:
+    status = int((await reader.readline()).split()[1])
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        if name.lower() == "content-length":
+            length = int(value)
+    await reader.readexactly(length)
+    return status
+
+
+async def _client(host: str, port: int, requests: list, latencies: list, errors: list) -> None:
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        for raw in requests:
+            t0 = time.perf_counter()
+            writer.write(raw)
+            await writer.drain()
+            status = await _read_response(reader)
+            latencies.append(time.perf_counter() - t0)
+            if status != 200:
+                errors.append(status)
+    finally:
+        writer.close()
+
+
+async def run_load(host: str, port: int, raws: list, connections: int) -> tuple:
+    latencies, errors = [], []
+    shares = [raws[i::connections] for i in range(connections)]
+    t0 = time.perf_counter()
+    await asyncio.gather(*(_client(host, port, share, latencies, errors) for share in shares if share))
+    return time.perf_counter() - t0, latencies, errors
+
+
+def _start_server(args) -> tuple:
+    proc = subprocess.Popen(
+        [sys.executable, str(ROOT / "server.py"), "--port", "0",
+         "--workers", str(args.workers), "--executor", args.executor]
+        + (["--coalesce"] if args.coalesce else []),
+        stdout=subprocess.PIPE, text=True, cwd=ROOT,
+    )
+    line = proc.stdout.readline()  # "listening on http://host:port"
+    if not line.startswith("listening on"):
+        proc.kill()
+        raise RuntimeError(f"server did not start: {line!r}")
+    return proc, urlparse(line.split()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="server.py load generator")
+    parser.add_argument("--url", help="existing server (default: start one)")
+    parser.add_argument("--connections", type=int, default=16)
+    parser.add_argument("--requests", type=int, default=4000)
+    parser.add_argument("--endpoint", choices=list(PATHS), default="match")
+    parser.add_argument("--batch-size", type=int, default=50)
+    parser.add_argument("--k", type=int, default=5)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--executor", choices=["thread", "process"], default="thread")
+    parser.add_argument("--coalesce", action="store_true", help="start the server with --coalesce")
+    args = parser.parse_args()
+
+    proc = None
+    if args.url:
+        url = urlparse(args.url)
+    else:
+        proc, url = _start_server(args)
+
+    try:
+        per_request = args.batch_size if args.endpoint == "batch" else 1
+        forms = synthetic_forms(args.requests * per_request)
+        path = PATHS[args.endpoint]
+        raws = []
+        for i in range(args.requests):
+            if args.endpoint == "batch":
+                payload = {"forms": forms[i * per_request:(i + 1) * per_request]}
+            else:
+                payload = {"form": forms[i], "k": args.k}
+            raws.append(_request(url.hostname, path, payload))
+
+        elapsed, latencies, errors = asyncio.run(run_load(url.hostname, url.port, raws, args.connections))
+    finally:
+        if proc is not None:
+            proc.terminate()
+            proc.wait()
+
+    ms = np.asarray(latencies) * 1000
+    print(f"{args.endpoint} x{args.requests} over {args.connections} connections "
+          f"({'coalesced' if args.coalesce else f'{args.executor} executor, {args.workers} workers'})")
+    print(f"  requests/s   {len(latencies) / elapsed:10.0f}")
+    print(f"  forms/s      {len(latencies) * per_request / elapsed:10.0f}")
+    print(f"  p50 / p95 / p99 / max ms   {np.percentile(ms, 50):.2f} / {np.percentile(ms, 95):.2f} / "
+          f"{np.percentile(ms, 99):.2f} / {ms.max():.2f}")
+    print(f"  errors       {len(errors):10d}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+# benchmarks/bench_streaming.py
+# ==========================================================
+# Peak RSS: eager pd.read_excel vs iter_excel_batches
+#
+#   python benchmarks/bench_streaming.py [--scale 50] [--batch-size 1000]
+#
+# Writes an N-times-larger copy of a workbook and, for each path, runs a
+# fresh interpreter that reads it and counts profiles per Job Family.
+# Peak RSS is the child's VmHWM, reset after imports where Linux allows it
+# (otherwise ru_maxrss, imports included); base = RSS after imports.
+# ==========================================================
+import argparse
+import json
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+CHILD = r"""
+import json, resource, sys, time
+from pathlib import Path
+sys.path.insert(0, sys.argv[1])
+import pandas as pd
+from utils.data_loader import iter_excel_batches
+
+mode, path, batch_size, column = sys.argv[2], sys.argv[3], int(sys.argv[4]), sys.argv[5]
+
+
+def peak_kb():
+    # VmHWM pode ser zerado (Linux); senão cai no ru_maxrss do processo
+    try:
+        for line in open("/proc/self/status"):
+            if line.startswith("VmHWM:"):
+                return int(line.split()[1])
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def current_kb():
+    try:
+        for line in open("/proc/self/status"):
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1])
+    except OSError:
+        pass
+    return peak_kb()
+
+
+base_kb = current_kb()
+try:
+    with open("/proc/self/clear_refs", "w") as f:
+        f.write("5")  # zera o high-water mark: o pico medido é só o da leitura
+except OSError:
+    pass
+
+t0 = time.perf_counter()
+counts, rows = {}, 0
+if mode == "eager":
+    df = pd.read_excel(path)
+    counts = df[column].value_counts().to_dict()
+    rows = len(df)
+else:
+    for batch in iter_excel_batches(Path(path), batch_size=batch_size):
+        for k, v in batch[column].value_counts().items():
+            counts[k] = counts.get(k, 0) + v
+        rows += len(batch)
+elapsed = time.perf_counter() - t0
+
+print(json.dumps({
+    "rows": rows,
+    "groups": len(counts),
+    "seconds": elapsed,
+    "base_kb": base_kb,
+    "peak_kb": peak_kb(),
+}))
+"""
+
+
+def run(mode: str, path: Path, batch_size: int, column: str) -> dict:
+    out = subprocess.run(
+        [sys.executable, "-c", CHILD, str(ROOT), mode, str(path), str(batch_size), column],
+        check=True, capture_output=True, text=True,
+    )
+    return json.loads(out.stdout)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Peak RSS of eager vs streaming workbook reads")
+    parser.add_argument("--workbook", default="Job Profile.xlsx")
+    parser.add_argument("--column", default="Job Family")
+    parser.add_argument("--scale", type=int, default=50)
+    parser.add_argument("--batch-size", type=int, default=1000)
+    args = parser.parse_args()
+
+    sys.path.insert(0, str(ROOT))
+    import pandas as pd
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / args.workbook
+        df = pd.read_excel(ROOT / "data" / args.workbook)
+        pd.concat([df] * args.scale, ignore_index=True).to_excel(path, index=False)
+        size_mb = path.stat().st_size / 1024 / 1024
+        print(f"{args.workbook} x{args.scale}: {len(df) * args.scale} rows, {size_mb:.1f} MB")
+
+        print(f"{'path':<12}{'rows':>10}{'seconds':>10}{'base MB':>10}{'peak MB':>10}{'delta MB':>10}")
+        for mode in ("eager", "streaming"):
+            r = run(mode, path, args.batch_size, args.column)
+            print(
+                f"{mode:<12}{r['rows']:>10}{r['seconds']:>10.2f}{r['base_kb'] / 1024:>10.1f}"
+                f"{r['peak_kb'] / 1024:>10.1f}{(r['peak_kb'] - r['base_kb']) / 1024:>10.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,255 @@
+# cli.py
+# ==========================================================
+# CLI — match, bulk e consulta de perfis sem Streamlit
+#
+#   python cli.py match form.json [--k 5] [--all-families] [--format json|csv|html]
+#   python cli.py bulk positions.csv [--top-k 3] [--workers 4] [--format csv|json]
+#   (match e bulk: --scoring dimensions|grade, padrão dimensions, como no app)
+#   python cli.py lookup JOB_CODE [JOB_CODE ...] [--format json|csv|html]
+#
+# `-` lê o formulário/posições do stdin; --output grava num arquivo
+# (padrão: stdout). Só os módulos do subcomando são importados.
+# ==========================================================
+import argparse
+import contextlib
+import json
+import os
+import sys
+from typing import Any, Dict, List
+
+
+def _open_output(path: str | None):
+    if not path or path == "-":
+        return contextlib.nullcontext(sys.stdout)  # não fecha o stdout
+    return open(path, "w", encoding="utf-8", newline="")
+
+
+def _write_records(records: List[Dict[str, Any]], fmt: str, out) -> None:
+    from match_core import PROFILE_FIELDS
+
+    if fmt == "json":
+        json.dump(records, out, ensure_ascii=False, indent=2, default=str)
+        out.write("\n")
+    else:
+        import csv
+
+        fields = list(records[0]) if records else PROFILE_FIELDS
+        writer = csv.DictWriter(out, fieldnames=fields, lineterminator="\n")
+        writer.writeheader()
+        writer.writerows(records)
+
+
+def _load_store():
+    from utils.data_store import get_data_store
+
+    return get_data_store()
+
+
+# ==========================================================
+# SUBCOMANDOS
+# ==========================================================
+def _rank_from_bundle(form: Dict[str, Any], args: argparse.Namespace):
+    """Ranking pelo bundle pré-compilado (sem pandas), ou None se não houver um válido."""
+    from match_core import load_bundle, rank_catalogue
+
+    loaded = load_bundle()
+    if loaded is None:
+        return None
+    catalogue, dimensions = loaded
+    if args.scoring == "dimensions" and dimensions is None:
+        return None
+    return rank_catalogue(catalogue, form, k=args.k,
+                          dimensions=dimensions if args.scoring == "dimensions" else None)
+
+
+def _rank_from_workbooks(form: Dict[str, Any], args: argparse.Namespace):
+    """Ranking a partir dos workbooks (pandas); também regrava o bundle."""
+    from match_engine import (
+        compile_match_bundle,
+        get_dimension_matrix,
+        get_match_catalogue,
+        rank_job_matches,
+    )
+
+    store = _load_store()
+    df_profiles = store.job_profile_filled
+    catalogue = get_match_catalogue(df_profiles, store.version)
+    dimensions = get_dimension_matrix(
+        catalogue, store.version, store.level_structure, store.career_bands_levels
+    )
+    try:
+        compile_match_bundle(catalogue, dimensions)
+    except OSError:
+        pass  # disco read-only: segue sem bundle
+    if args.scoring != "dimensions":
+        dimensions = None
+
+    if args.all_families:
+        from match_global import get_neighbor_index, rank_global_matches
+
+        return rank_global_matches(
+            form, df_profiles, k=args.k,
+            index=get_neighbor_index(catalogue, store.version, dimensions), dimensions=dimensions,
+        )
+    return rank_job_matches(form, df_profiles, k=args.k, catalogue=catalogue, dimensions=dimensions)
+
+
+def cmd_match(args: argparse.Namespace) -> int:
+    from match_core import profile_record
+
+    source = sys.stdin if args.form == "-" else open(args.form, encoding="utf-8")
+    with source:
+        form = json.load(source)
+    form.setdefault("kpis_selected", [])
+    form.setdefault("competencies_selected", [])
+    if args.all_families:
+        form.setdefault("job_family", "")
+        form.setdefault("sub_job_family", "")
+
+    # caminho rápido: bundle .npz, sem importar pandas (não vale para o modo global
+    # nem para o HTML, que precisa da linha completa do perfil)
+    ranked = None
+    if not args.all_families and args.format != "html":
+        ranked = _rank_from_bundle(form, args)
+    if ranked is None:
+        ranked = _rank_from_workbooks(form, args)
+
+    if not ranked:
+        print("No Job Profiles match the selected Job Family + Sub Job Family.", file=sys.stderr)
+        return 1
+
+    with _open_output(args.output) as out:
+        if args.format == "html":
+            from html_renderer import render_job_description
+
+            out.write(render_job_description(ranked[0]["row"], ranked[0]["score_pct"]))
+        else:
+            records = [
+                {"rank": i + 1, **profile_record(r["row"]),
+                 "score": round(r["score"], 6), "score_pct": r["score_pct"]}
+                for i, r in enumerate(ranked)
+            ]
+            _write_records(records, args.format, out)
+    return 0
+
+
+def cmd_bulk(args: argparse.Namespace) -> int:
+    import pandas as pd
+
+    from match_engine import get_dimension_matrix, get_match_catalogue
+
+    positions = pd.read_csv(sys.stdin if args.positions == "-" else args.positions)
+    store = _load_store()
+    df_profiles = store.job_profile_filled
+    catalogue = get_match_catalogue(df_profiles, store.version)
+    dimensions = None
+    if args.scoring == "dimensions":
+        dimensions = get_dimension_matrix(
+            catalogue, store.version, store.level_structure, store.career_bands_levels
+        )
+
+    if args.workers > 1:
+        from match_parallel import parallel_bulk_job_match
+
+        result = parallel_bulk_job_match(positions, df_profiles, catalogue, args.top_k, args.workers,
+                                         dimensions=dimensions)
+    else:
+        from match_engine import bulk_job_match
+
+        result = bulk_job_match(positions, df_profiles, catalogue, args.top_k, dimensions=dimensions)
+
+    with _open_output(args.output) as out:
+        if args.format == "json":
+            result.to_json(out, orient="records", force_ascii=False, indent=2)
+            out.write("\n")
+        else:
+            result.to_csv(out, index=False)
+    return 0
+
+
+def cmd_lookup(args: argparse.Namespace) -> int:
+    from match_core import profile_record
+
+    store = _load_store()
+    df_profiles = store.job_profile_filled
+    codes = df_profiles["Full Job Code"].astype(str).str.strip()
+
+    rows = []
+    for code in args.codes:
+        hits = df_profiles[codes == code.strip()]
+        if hits.empty:
+            print(f"Job code not found: {code}", file=sys.stderr)
+            continue
+        rows.append(hits.iloc[0])
+    if not rows:
+        return 1
+
+    with _open_output(args.output) as out:
+        if args.format == "html":
+            from html_renderer import render_job_description
+
+            out.write("\n".join(render_job_description(row, 100) for row in rows))
+        else:
+            _write_records([profile_record(row) for row in rows], args.format, out)
+    return 0
+
+
+# ==========================================================
+# ARGUMENTOS
+# ==========================================================
+def _positive_int(value: str) -> int:
+    try:
+        n = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}") from None
+    if n < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {n}")
+    return n
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="cli.py", description="Job Architecture — headless matching and lookups")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("match", help="best Job Profiles for one form (JSON with the Job Match fields)")
+    p.add_argument("form", help="form JSON file, or - for stdin")
+    p.add_argument("--k", type=_positive_int, default=5, help="number of profiles to return")
+    p.add_argument("--all-families", action="store_true", help="ignore the Job Family filter")
+    p.add_argument("--scoring", choices=["dimensions", "grade"], default="dimensions",
+                   help="level component: all 20 dimensions (as in the app) or the grade hint")
+    p.add_argument("--format", choices=["json", "csv", "html"], default="json")
+    p.add_argument("--output", "-o")
+    p.set_defaults(func=cmd_match)
+
+    p = sub.add_parser("bulk", help="level many positions from a CSV")
+    p.add_argument("positions", help="positions CSV, or - for stdin")
+    p.add_argument("--top-k", type=_positive_int, default=3)
+    p.add_argument("--workers", type=int, default=1, help="processes (>1 uses match_parallel)")
+    p.add_argument("--scoring", choices=["dimensions", "grade"], default="dimensions",
+                   help="same as in match; dimensions reads the 20 form columns when present")
+    p.add_argument("--format", choices=["csv", "json"], default="csv")
+    p.add_argument("--output", "-o")
+    p.set_defaults(func=cmd_bulk)
+
+    p = sub.add_parser("lookup", help="Job Profiles by Full Job Code")
+    p.add_argument("codes", nargs="+")
+    p.add_argument("--format", choices=["json", "csv", "html"], default="json")
+    p.add_argument("--output", "-o")
+    p.set_defaults(func=cmd_lookup)
+
+    return parser
+
+
+def main(argv: List[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    try:
+        return args.func(args)
+    except BrokenPipeError:
+        # saída cortada no pipeline (ex.: `| head`): encerra em silêncio
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,32 +1,26 @@
 # html_renderer.py
 import html
-import os
+import threading
+from collections import OrderedDict
 import pandas as pd
-from typing import Dict
+from typing import Any, Dict, List, Tuple
+
+from utils.icons import IconSprite
 
 # ---------------------------------------------------------
-# Carrega SVG
+# Ícone (assets/icons/sig) de cada seção
 # ---------------------------------------------------------
-def load_svg(svg_name: str) -> str:
-    path = os.path.join("assets", "icons", "sig", svg_name)
-    if not os.path.exists(path):
-        return ""
-    with open(path, "r", encoding="utf-8") as f:
-        svg = f.read()
-        svg = svg.replace('<?xml version="1.0" encoding="utf-8"?>', '')
-        return svg
-
-ICONS_SVG: Dict[str, str] = {
-    "Sub Job Family Description": load_svg("Hierarchy.svg"),
-    "Job Profile Description": load_svg("Content_Book_Phone.svg"),
-    "Career Band Description": load_svg("File_Clipboard_Text.svg"),
-    "Role Description": load_svg("Shopping_Business_Target.svg"),
-    "Grade Differentiator": load_svg("User_Add.svg"),
-    "Qualifications": load_svg("Edit_Pencil.svg"),
-    "Specific parameters / KPIs": load_svg("Graph_Bar.svg"),
-    "Competencies 1": load_svg("Setting_Cog.svg"),
-    "Competencies 2": load_svg("Setting_Cog.svg"),
-    "Competencies 3": load_svg("Setting_Cog.svg"),
+SECTION_ICONS: Dict[str, str] = {
+    "Sub Job Family Description": "Hierarchy.svg",
+    "Job Profile Description": "Content_Book_Phone.svg",
+    "Career Band Description": "File_Clipboard_Text.svg",
+    "Role Description": "Shopping_Business_Target.svg",
+    "Grade Differentiator": "User_Add.svg",
+    "Qualifications": "Edit_Pencil.svg",
+    "Specific parameters / KPIs": "Graph_Bar.svg",
+    "Competencies 1": "Setting_Cog.svg",
+    "Competencies 2": "Setting_Cog.svg",
+    "Competencies 3": "Setting_Cog.svg",
 }
 
 SECTIONS_ORDER = [
@@ -44,29 +38,9 @@ SECTIONS_ORDER = [
 
 
 # =====================================================================
-# FUNÇÃO PRINCIPAL
+# TEMPLATES PRÉ-COMPILADOS (montados uma vez, na importação)
 # =====================================================================
-def render_job_description(best_match_row: pd.Series, final_score: float) -> str:
-
-    def safe_get(col):
-        try:
-            val = best_match_row.get(col, "")
-            if pd.isna(val):
-                return ""
-            return str(val)
-        except:
-            return ""
-
-    job_title = html.escape(safe_get("Job Profile"))
-    gg = html.escape(safe_get("Global Grade"))
-    jf = html.escape(safe_get("Job Family"))
-    sf = html.escape(safe_get("Sub Job Family"))
-    cp = html.escape(safe_get("Career Path"))
-    fc = html.escape(safe_get("Full Job Code"))
-
-    out = []
-
-    out.append("""
+_STYLE = """
 <style>
 body {
     background: #ffffff !important;
@@ -157,17 +131,17 @@ html, body {
 }
 
 </style>
-""")
+"""
 
-    # topo
-    out.append("<div class='job-card'>")
-
-    out.append(f"""
+# cabeçalho partido na pílula do score: só o número muda a cada match
+_HEADER_BEFORE_PILL = """
         <div class="job-title">{job_title}</div>
 
         <div class="job-subtitle">
             GG {gg} • Job Match
-            <span class="pill">{final_score}%</span>
+            <span class="pill">"""
+
+_HEADER_AFTER_PILL = """%</span>
         </div>
 
         <div class="meta-card">
@@ -176,23 +150,324 @@ html, body {
             <b>Career Path:</b> {cp}<br>
             <b>Full Job Code:</b> {fc}
         </div>
-    """)
+    """
+
+# ícones da descrição: um <symbol> por arquivo, referenciado por <use> nas seções
+DESCRIPTION_ICONS = IconSprite()
+
+# ícone + título de cada seção já resolvidos; falta só o texto do perfil
+_SECTION_SHELLS = [
+    (
+        f"""
+            <div class="section-box">
+                <div class="section-title">
+                    {DESCRIPTION_ICONS.use(SECTION_ICONS[sec])} {html.escape(sec)}
+                </div>
+                <div class="section-line"></div>
+                <div class="section-text">""",
+        sec,
+    )
+    for sec in SECTIONS_ORDER
+]
+_SECTION_CLOSE = """</div>
+            </div>
+        """
+_ICON_SHEET = DESCRIPTION_ICONS.sheet()
+
+# início do documento, igual para todos os perfis
+_DESCRIPTION_PREFIX = "\n".join([_STYLE, _ICON_SHEET, "<div class='job-card'>", ""])
+
+
+def _safe_get(row: pd.Series, col: str) -> str:
+    try:
+        val = row.get(col, "")
+        if pd.isna(val):
+            return ""
+        return str(val)
+    except:
+        return ""
+
+
+# campos do cabeçalho de cada perfil: nome no fragmento → coluna
+HEADER_FIELDS: Dict[str, str] = {
+    "job_title": "Job Profile",
+    "gg": "Global Grade",
+    "jf": "Job Family",
+    "sf": "Sub Job Family",
+    "cp": "Career Path",
+    "fc": "Full Job Code",
+}
+
+
+def profile_fragment(row: Any) -> Dict[str, Any]:
+    """
+    Conteúdo de um perfil já escapado, comum aos templates das duas páginas
+    (descrição do Job Match e comparação).
+    """
+    return {
+        "fields": {key: html.escape(_safe_get(row, col)) for key, col in HEADER_FIELDS.items()},
+        "sections": [html.escape(_safe_get(row, sec)) for sec in SECTIONS_ORDER],
+    }
+
+
+def description_parts(row: Any) -> Tuple[str, str]:
+    """
+    Corpo da descrição do perfil antes e depois do número da pílula — tudo o
+    que não depende do score nem é igual para todos os perfis (ver
+    `render_job_description`).
+    """
+    fragment = profile_fragment(row)
+    fields = fragment["fields"]
+
+    head = _HEADER_BEFORE_PILL.format(job_title=fields["job_title"], gg=fields["gg"])
+    after = [
+        _HEADER_AFTER_PILL.format(jf=fields["jf"], sf=fields["sf"], cp=fields["cp"], fc=fields["fc"]),
+        "</div>",
+    ]
+    after.extend(
+        shell + text + _SECTION_CLOSE for (shell, _), text in zip(_SECTION_SHELLS, fragment["sections"])
+    )
+    return head, "\n".join(after)
+
+
+# =====================================================================
+# CACHE POR PERFIL (Full Job Code + versão do dataset)
+# =====================================================================
+RENDER_CACHE_SIZE = 1024
+
+_render_cache: "OrderedDict[tuple, Tuple[str, str]]" = OrderedDict()
+_render_cache_lock = threading.Lock()
+
+
+def _cached_parts(row: pd.Series, version: str) -> Tuple[str, str]:
+    code = _safe_get(row, "Full Job Code")
+    if not code:
+        return description_parts(row)
+    key = (version, code)
+    with _render_cache_lock:
+        parts = _render_cache.get(key)
+        if parts is not None:
+            _render_cache.move_to_end(key)
+            return parts
+    parts = description_parts(row)
+    with _render_cache_lock:
+        _render_cache[key] = parts
+        _render_cache.move_to_end(key)
+        while len(_render_cache) > RENDER_CACHE_SIZE:
+            _render_cache.popitem(last=False)
+    return parts
+
+
+def warm_render_cache(row: Any, version: str) -> None:
+    """Coloca o corpo do perfil no cache de `version` (ver prerender.py)."""
+    _cached_parts(row, version)
+
+
+def clear_render_cache() -> None:
+    with _render_cache_lock:
+        _render_cache.clear()
+
+
+# =====================================================================
+# FUNÇÃO PRINCIPAL
+# =====================================================================
+def render_job_description(best_match_row: pd.Series, final_score: float,
+                           version: str | None = None) -> str:
+    """
+    Descrição completa do perfil em HTML, com o score na pílula.
+
+    Com `version` (ex.: `DataStore.version`), o corpo do perfil fica em cache
+    por Full Job Code + versão (aquecido no boot por prerender.py) e cada
+    chamada só insere o score.
+    """
+    head, after = _cached_parts(best_match_row, version) if version else description_parts(best_match_row)
+    return f"{_DESCRIPTION_PREFIX}{head}{final_score}{after}"
+
+
+# =====================================================================
+# COMPARAÇÃO DE PERFIS (página Job Profile Description)
+# =====================================================================
+def render_profile_comparison(profiles: List[Dict[str, Any]], icons: IconSprite | None = None) -> str:
+    """
+    Até 3 perfis lado a lado (página Job Profile Description), seção a seção.
+
+    Os ícones entram como sprite: cada SVG uma vez no documento, não uma vez
+    por seção por perfil. Passe `icons` para ler `icons.report()` depois.
+    """
+    icons = icons if icons is not None else IconSprite()
+    fragments = [profile_fragment(p) for p in profiles]
+    n = len(profiles)
+
+    html_code = f"""
+<html>
+<head>
+<meta charset="UTF-8">
+
+<style>
+
+html, body {{
+    margin: 0;
+    padding: 0;
+    height: 100%;
+    overflow: hidden;
+    font-family: 'Segoe UI', sans-serif;
+}}
+
+#viewport {{
+    height: 100vh;
+    display: flex;
+    flex-direction: column;
+    overflow: hidden;
+}}
+
+/* GRID PERFEITAMENTE DISTRIBUÍDO (FULL WIDTH) */
+.grid-top {{
+    display: grid;
+    grid-template-columns: repeat({n}, 1fr);
+    gap: 24px;
+    width: 100%;
+}}
+
+.grid-desc {{
+    display: grid;
+    grid-template-columns: repeat({n}, 1fr);
+    gap: 28px;
+    width: 100%;
+}}
+
+/* CARD SUPERIOR → AGORA FUNDO SAND1 */
+.card-top {{
+    background: #f5f3ee;
+    border-radius: 16px;
+    padding: 22px 24px;
+    box-shadow: none;
+    border: 1px solid #e3e1dd;
+}}
+
+.title {{
+    font-size: 20px;
+    font-weight: 700;
+    line-height: 1.25;
+}}
+
+.gg {{
+    color: #145efc;
+    font-size: 16px;
+    font-weight: 700;
+    margin-top: 6px;
+}}
+
+.meta {{
+    background: white;
+    padding: 14px;
+    margin-top: 14px;
+    border-radius: 12px;
+    box-shadow: 0 2px 8px rgba(0,0,0,0.06);
+    font-size: 14px;
+}}
+
+/* SCROLL AREA */
+#scroll-area {{
+    flex: 1;
+    overflow-y: auto;
+    padding: 20px 4px 32px 4px;
+}}
+
+/* SECTION PERFEITAMENTE ALINHADA POR LINHAS */
+.row {{
+    display: contents;
+}}
+
+.section-box {{
+    padding-bottom: 28px;
+}}
+
+.section-title {{
+    font-size: 16px;
+    font-weight: 700;
+    display: flex;
+    align-items: center;
+    gap: 6px;
+}}
+
+.section-line {{
+    height: 1px;
+    background: #e8e6e1;
+    width: 100%;
+    margin: 8px 0 14px 0;
+}}
+
+.section-text {{
+    font-size: 14px;
+    line-height: 1.45;
+    white-space: pre-wrap;
+}}
+
+.icon-inline {{
+    width: 20px;
+    height: 20px;
+}}
+</style>
+
+</head>
+
+<body>
+
+<div id="viewport">
+
+    <div id="top-area">
+        <div class="grid-top">
+    """
+
+    # Top Cards
+    for fragment in fragments:
+        f = fragment["fields"]
+        html_code += f"""
+        <div class="card-top">
+            <div class="title">{f["job_title"]}</div>
+            <div class="gg">GG {f["gg"]}</div>
+
+            <div class="meta">
+                <b>Job Family:</b> {f["jf"]}<br>
+                <b>Sub Job Family:</b> {f["sf"]}<br>
+                <b>Career Path:</b> {f["cp"]}<br>
+                <b>Full Job Code:</b> {f["fc"]}
+            </div>
+        </div>
+        """
 
-    out.append("</div>")
+    html_code += """
+        </div>
+    </div>
 
-    # seções completas (mesmo se vazias!)
-    for sec in SECTIONS_ORDER:
-        raw_text = safe_get(sec)
-        icon_svg = ICONS_SVG.get(sec, "")
+    <div id="scroll-area">
+        <div class="grid-desc">
+    """
 
-        out.append(f"""
+    for i, sec in enumerate(SECTIONS_ORDER):
+        html_code += "<div class='row'>"
+        for fragment in fragments:
+            html_code += f"""
             <div class="section-box">
                 <div class="section-title">
-                    {icon_svg} {html.escape(sec)}
+                    <span class="icon-inline">{icons.use(SECTION_ICONS[sec])}</span>
+                    {html.escape(sec)}
                 </div>
                 <div class="section-line"></div>
-                <div class="section-text">{html.escape(raw_text)}</div>
+                <div class="section-text">{fragment["sections"][i]}</div>
             </div>
-        """)
+            """
+        html_code += "</div>"
+
+    html_code += """
+        </div>
+    </div>
+
+</div>
+"""
+    html_code += icons.sheet()
+    html_code += """
 
-    return "\n".join(out)
+</body></html>
+"""
+    return html_code
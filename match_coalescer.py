@@ -0,0 +1,239 @@
+# match_coalescer.py
+# ==========================================================
+# MICRO-BATCHING — junta pedidos de match simultâneos num só scoring
+# ==========================================================
+import queue
+import sys
+import threading
+import time
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Any, Dict, List, Tuple
+
+from match_core import (
+    DimensionMatrix,
+    MatchCatalogue,
+    _score_pct,
+    _top_indices,
+    score_form_batch,
+)
+from utils.instrumentation import start_trace
+
+# espera extra por companhia depois do 1º pedido do lote. 0 = leva só o que já
+# está na fila: enquanto um lote é pontuado o próximo se forma sozinho, e no
+# benchmark (benchmarks/bench_coalescer.py) qualquer espera fixa custou mais
+# latência do que rendeu em vazão
+DEFAULT_WINDOW_MS = 0.0
+DEFAULT_MAX_BATCH = 256
+# teto de pares (formulário, perfil) por passe de scoring — limita a memória em catálogos grandes
+MAX_BATCH_CELLS = 1 << 20
+
+
+class MatchCoalescer:
+    """
+    Fila única na frente do motor de match.
+
+    `submit(form, k)` devolve um Future. Uma thread de fundo pega o 1º pedido,
+    junta os que já estão na fila (e os que chegarem em até `window_ms`),
+    até `max_batch`, e pontua o lote inteiro num só passe
+    (`match_core.score_form_batch`), mesmo com Job Families diferentes. Cada Future recebe o mesmo
+    resultado de `match_core.rank_catalogue` para o seu formulário.
+
+    Um pedido sozinho espera no máximo `window_ms` a mais; com carga, o custo
+    fixo por chamada (Python, alocação, ufuncs) é dividido pelo lote.
+    Tudo roda numa thread só: o NumPy solta o GIL nas contas, então as
+    sessões do Streamlit seguem respondendo enquanto um lote é pontuado.
+    Um erro num pedido vai só para o Future dele; a thread segue viva. Depois
+    de `close()`, pedidos pendentes e novos falham com RuntimeError.
+    """
+
+    def __init__(self, catalogue: MatchCatalogue, dimensions: DimensionMatrix | None = None,
+                 window_ms: float = DEFAULT_WINDOW_MS, max_batch: int = DEFAULT_MAX_BATCH):
+        self.catalogue = catalogue
+        self.dimensions = dimensions
+        self.window = window_ms / 1000.0
+        self.max_batch = max_batch
+        self.batches = 0
+        self.requests = 0
+        self.largest_batch = 0
+        self._queue: "queue.SimpleQueue[Tuple[Dict[str, Any], int, Future] | None]" = queue.SimpleQueue()
+        self._closed = False
+        self._close_lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, name="match-coalescer", daemon=True)
+        self._thread.start()
+
+    # ------------------------------------------------------
+    # API
+    # ------------------------------------------------------
+    def submit(self, form_inputs: Dict[str, Any], k: int = 1) -> Future:
+        future: Future = Future()
+        with self._close_lock:
+            if self._closed:
+                future.set_exception(RuntimeError("match coalescer is closed"))
+            else:
+                self._queue.put((form_inputs, k, future))
+        return future
+
+    def rank(self, form_inputs: Dict[str, Any], k: int = 1,
+             timeout: float | None = None) -> List[Dict[str, Any]]:
+        """
+        Bloqueia até o lote do pedido ser pontuado; mesmo formato de `rank_catalogue`.
+        Com `timeout`, desiste do pedido (TimeoutError) se ele não sair a tempo.
+        """
+        future = self.submit(form_inputs, k)
+        try:
+            return future.result(timeout)
+        except FutureTimeoutError:
+            future.cancel()  # a thread pula o pedido quando chegar nele
+            raise
+
+    def close(self) -> None:
+        """Pontua o que já está na fila, para a thread e falha o que sobrar."""
+        with self._close_lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._queue.put(None)
+        self._thread.join()
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is not None:
+                self._fail(item[2], RuntimeError("match coalescer is closed"))
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "batches": self.batches,
+            "requests": self.requests,
+            "largest_batch": self.largest_batch,
+            "mean_batch": self.requests / self.batches if self.batches else 0.0,
+        }
+
+    # ------------------------------------------------------
+    # THREAD DE FUNDO
+    # ------------------------------------------------------
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            batch = [item]
+            deadline = time.perf_counter() + self.window
+            while len(batch) < self.max_batch:
+                remaining = deadline - time.perf_counter()
+                try:
+                    item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    self._process_safely(batch)
+                    return
+                batch.append(item)
+            self._process_safely(batch)
+
+    def _process_safely(self, batch: List[Tuple[Dict[str, Any], int, Future]]) -> None:
+        # pedidos cancelados (timeout em `rank`) saem do lote
+        batch = [item for item in batch if item[2].set_running_or_notify_cancel()]
+        if not batch:
+            return
+        try:
+            self._process(batch)
+        except BaseException as exc:  # nunca deixa um Future sem resposta nem derruba a thread
+            for _, _, future in batch:
+                self._fail(future, exc)
+
+    @staticmethod
+    def _fail(future: Future, exc: BaseException) -> None:
+        if not future.done():
+            future.set_exception(exc)
+
+    def _process(self, batch: List[Tuple[Dict[str, Any], int, Future]]) -> None:
+        self.batches += 1
+        self.requests += len(batch)
+        self.largest_batch = max(self.largest_batch, len(batch))
+
+        trace = start_trace("match_coalescer", batch=len(batch))
+        pending, cells = [], 0
+        for form, k, future in batch:
+            try:
+                part = self.catalogue.partition(form["job_family"], form["sub_job_family"])
+            except (KeyError, TypeError) as exc:  # formulário incompleto / chave inválida
+                self._fail(future, exc)
+                continue
+            if part is None:
+                future.set_result([])
+                continue
+            if pending and cells + (part.stop - part.start) > MAX_BATCH_CELLS:
+                self._score(pending)
+                pending, cells = [], 0
+            pending.append((form, k, future, part))
+            cells += part.stop - part.start
+        if pending:
+            self._score(pending)
+        if trace:
+            trace.mark("score_top_k", rows=len(batch))
+            trace.finish()
+
+    def _score(self, pending: List[Tuple[Dict[str, Any], int, Future, slice]]) -> None:
+        try:
+            scores, offsets = score_form_batch(
+                self.catalogue, [p for _, _, _, p in pending], [f for f, _, _, _ in pending], self.dimensions
+            )
+        except Exception:
+            # algum formulário inválido no lote: pontua um a um para isolar o erro
+            if len(pending) > 1:
+                for entry in pending:
+                    self._score([entry])
+            else:
+                self._fail(pending[0][2], sys.exc_info()[1])
+            return
+
+        for (_, k, future, part), lo, hi in zip(pending, offsets[:-1], offsets[1:]):
+            try:
+                ranked = self._ranked(scores[lo:hi], k, part)
+            except Exception as exc:  # ex.: `k` inválido — só este pedido falha
+                self._fail(future, exc)
+            else:
+                future.set_result(ranked)
+
+    def _ranked(self, form_scores, k: int, part: slice) -> List[Dict[str, Any]]:
+        top = _top_indices(form_scores, k)
+        if len(top) == 0:  # k <= 0
+            return []
+        max_score = float(form_scores[top[0]])
+        return [
+            {
+                "row": self.catalogue.row(part.start + int(i)),
+                "score": float(form_scores[i]),
+                "score_pct": _score_pct(float(form_scores[i]), max_score),
+            }
+            for i in top
+        ]
+
+
+# ==========================================================
+# INSTÂNCIA DO PROCESSO (uma por versão do dataset)
+# ==========================================================
+_coalescers: Dict[str, MatchCoalescer] = {}
+_coalescers_lock = threading.Lock()
+
+
+def get_match_coalescer(catalogue: MatchCatalogue, version: str,
+                        dimensions: DimensionMatrix | None = None) -> MatchCoalescer:
+    """
+    Coalescer compartilhado pelas sessões para uma versão do dataset. O da
+    versão anterior é fechado: quem ainda o usava recebe RuntimeError (nunca
+    fica esperando para sempre) e pode pontuar direto.
+    """
+    coalescer = _coalescers.get(version)
+    if coalescer is None or coalescer.catalogue is not catalogue or coalescer.dimensions is not dimensions:
+        with _coalescers_lock:
+            coalescer = _coalescers.get(version)
+            if coalescer is None or coalescer.catalogue is not catalogue or coalescer.dimensions is not dimensions:
+                for old in _coalescers.values():
+                    old.close()
+                _coalescers.clear()  # só a versão corrente fica em memória
+                coalescer = _coalescers[version] = MatchCoalescer(catalogue, dimensions)
+    return coalescer
@@ -0,0 +1,660 @@
+# match_core.py
+# ==========================================================
+# NÚCLEO DO MATCH — só NumPy (sem pandas)
+#
+# Codificação do formulário, catálogo em arrays e scoring vetorizado.
+# match_engine (ingestão com pandas) monta o catálogo a partir dos
+# workbooks; processos curtos (CLI, workers) podem carregar o mesmo
+# catálogo de um bundle .npz pré-compilado, sem importar pandas.
+# ==========================================================
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+
+
+# ==========================================================
+# CODIFICAÇÃO DO FORMULÁRIO
+# ==========================================================
+def _encode_map() -> Dict[str, int]:
+    return {
+        "Choose option": 0,
+
+        # JOB CATEGORY
+        "Executive": 5, "Manager": 4, "Professional": 3,
+        "Technical Support": 2, "Business Support": 2, "Production": 1,
+
+        # GEOGRAPHIC SCOPE
+        "Local": 1, "Regional": 2, "Multi-country": 3, "Global": 4,
+
+        # ORG IMPACT
+        "Team": 1, "Department / Subfunction": 2,
+        "Function": 3, "Business Unit": 4, "Enterprise-wide": 5,
+
+        # SPAN OF CONTROL
+        "No direct reports": 1, "Supervises team": 2, "Leads professionals": 3,
+        "Leads multiple teams": 4, "Leads managers": 5,
+
+        # NATURE OF WORK
+        "Process-oriented": 1, "Analysis-oriented": 2,
+        "Specialist": 3, "Leadership-driven": 4,
+
+        # FINANCIAL IMPACT
+        "No impact": 1, "Cost center impact": 2,
+        "Department-level impact": 3, "Business Unit impact": 4,
+        "Company-wide impact": 5,
+
+        # STAKEHOLDERS
+        "Internal team": 1, "Cross-functional": 2,
+        "External vendors": 3, "Customers": 4, "Regulatory/Authorities": 5,
+
+        # DECISION TYPE
+        "Procedural": 1, "Operational": 2, "Tactical": 3, "Strategic": 4,
+
+        # DECISION HORIZON
+        "Daily": 1, "Weekly": 2, "Monthly": 3,
+        "Annual": 4, "Multi-year": 5,
+
+        # AUTONOMY
+        "Close supervision": 1, "Regular guidance": 2, "Independent": 3,
+        "Sets direction for others": 4, "Defines strategy": 5,
+
+        # PROBLEM SOLVING
+        "Routine/Standardized": 1, "Moderate": 2,
+        "Complex": 3, "Ambiguous/Novel": 4, "Organization-level": 5,
+
+        # KNOWLEDGE DEPTH
+        "Entry-level knowledge": 1, "Applied knowledge": 2,
+        "Advanced expertise": 3, "Recognized expert": 4, "Thought leader": 5,
+
+        # OPERATIONAL COMPLEXITY
+        "Stable operations": 1, "Some variability": 2,
+        "Complex operations": 3, "High-variability environment": 4,
+
+        # INFLUENCE
+        "Team": 1, "Cross-team": 2, "Multi-function": 3,
+        "External vendors/clients": 4, "Industry-level influence": 5,
+
+        # SPECIALIZATION LEVEL
+        "Generalist": 1, "Specialist": 2, "Deep Specialist": 3,
+
+        # INNOVATION RESPONSIBILITY
+        "Execution": 1,
+        "Incremental improvements": 2,
+        "Major improvements": 3,
+        "Innovation leadership": 4,
+
+        # LEADERSHIP TYPE
+        "None": 1, "Team Lead": 2, "Supervisor": 3,
+        "Manager": 4, "Senior Manager": 5, "Director": 6,
+
+        # ORGANIZATIONAL INFLUENCE
+        "Team": 1, "Department": 2,
+        "Business Unit": 3, "Function": 4, "Enterprise-wide": 5,
+
+        # EDUCATION
+        "High School": 1, "Technical Degree": 2, "Bachelor’s": 3,
+        "Post-graduate": 4, "Master’s": 5, "Doctorate": 6,
+
+        # EXPERIENCE
+        "< 2 years": 1, "2–5 years": 2, "5–10 years": 3,
+        "10–15 years": 4, "15+ years": 5,
+    }
+
+
+def _enc(x: Any, emap: Dict[str, int]) -> int:
+    return emap.get(x, 0)
+
+
+def _is_missing(x: Any) -> bool:
+    """None ou NaN (equivalente a pd.isna para escalares)."""
+    return x is None or (isinstance(x, float) and x != x)
+
+
+# pesos da nota final
+W_GRADE, W_KPI, W_COMP = 0.5, 0.3, 0.2
+
+
+# as 20 perguntas ordinais do formulário: código de cada opção, por pergunta.
+# O mapa plano de `_encode_map` (usado pela estimativa de grade) perde as
+# opções repetidas entre perguntas — "Specialist" em Nature of Work e em
+# Specialization Level, "Function"/"Business Unit" em Org Impact e em
+# Organizational Influence —, então as dimensões usam estes mapas.
+FORM_SCALES: Dict[str, Dict[str, int]] = {
+    "job_category": {
+        "Executive": 5, "Manager": 4, "Professional": 3,
+        "Technical Support": 2, "Business Support": 2, "Production": 1,
+    },
+    "geo_scope": {"Local": 1, "Regional": 2, "Multi-country": 3, "Global": 4},
+    "org_impact": {
+        "Team": 1, "Department / Subfunction": 2,
+        "Function": 3, "Business Unit": 4, "Enterprise-wide": 5,
+    },
+    "span_control": {
+        "No direct reports": 1, "Supervises team": 2, "Leads professionals": 3,
+        "Leads multiple teams": 4, "Leads managers": 5,
+    },
+    "nature_work": {
+        "Process-oriented": 1, "Analysis-oriented": 2,
+        "Specialist": 3, "Leadership-driven": 4,
+    },
+    "financial_impact": {
+        "No impact": 1, "Cost center impact": 2,
+        "Department-level impact": 3, "Business Unit impact": 4,
+        "Company-wide impact": 5,
+    },
+    "stakeholder_complexity": {
+        "Internal team": 1, "Cross-functional": 2,
+        "External vendors": 3, "Customers": 4, "Regulatory/Authorities": 5,
+    },
+    "decision_type": {"Procedural": 1, "Operational": 2, "Tactical": 3, "Strategic": 4},
+    "decision_horizon": {
+        "Daily": 1, "Weekly": 2, "Monthly": 3,
+        "Annual": 4, "Multi-year": 5,
+    },
+    "autonomy": {
+        "Close supervision": 1, "Regular guidance": 2, "Independent": 3,
+        "Sets direction for others": 4, "Defines strategy": 5,
+    },
+    "problem_solving": {
+        "Routine/Standardized": 1, "Moderate": 2,
+        "Complex": 3, "Ambiguous/Novel": 4, "Organization-level": 5,
+    },
+    "knowledge_depth": {
+        "Entry-level knowledge": 1, "Applied knowledge": 2,
+        "Advanced expertise": 3, "Recognized expert": 4, "Thought leader": 5,
+    },
+    "operational_complexity": {
+        "Stable operations": 1, "Some variability": 2,
+        "Complex operations": 3, "High-variability environment": 4,
+    },
+    "influence_level": {
+        "Team": 1, "Cross-team": 2, "Multi-function": 3,
+        "External vendors/clients": 4, "Industry-level influence": 5,
+    },
+    "education": {
+        "High School": 1, "Technical Degree": 2, "Bachelor’s": 3,
+        "Post-graduate": 4, "Master’s": 5, "Doctorate": 6,
+    },
+    "experience": {
+        "< 2 years": 1, "2–5 years": 2, "5–10 years": 3,
+        "10–15 years": 4, "15+ years": 5,
+    },
+    "specialization_level": {"Generalist": 1, "Specialist": 2, "Deep Specialist": 3},
+    "innovation_resp": {
+        "Execution": 1, "Incremental improvements": 2,
+        "Major improvements": 3, "Innovation leadership": 4,
+    },
+    "leadership_type": {
+        "None": 1, "Team Lead": 2, "Supervisor": 3,
+        "Manager": 4, "Senior Manager": 5, "Director": 6,
+    },
+    "org_influence": {
+        "Team": 1, "Department": 2,
+        "Business Unit": 3, "Function": 4, "Enterprise-wide": 5,
+    },
+}
+
+# maior código de cada escala
+FORM_DIMENSIONS: Dict[str, int] = {dim: max(scale.values()) for dim, scale in FORM_SCALES.items()}
+
+# peso de cada dimensão na distância (todas iguais por padrão)
+DIMENSION_WEIGHTS: Dict[str, float] = {d: 1.0 for d in FORM_DIMENSIONS}
+
+
+
+# ==========================================================
+# CATÁLOGO EM ARRAYS
+# ==========================================================
+if hasattr(np, "bitwise_count"):
+    def _popcount(bits: np.ndarray) -> np.ndarray:
+        """Bits ligados por bitset (soma na última dimensão)."""
+        return np.bitwise_count(bits).sum(axis=-1, dtype=np.int64)
+else:  # numpy < 2.0
+    _BYTE_POPCOUNT = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+    def _popcount(bits: np.ndarray) -> np.ndarray:
+        """Bits ligados por bitset (soma na última dimensão)."""
+        as_bytes = np.ascontiguousarray(bits).view(np.uint8).reshape(bits.shape[:-1] + (-1,))
+        return _BYTE_POPCOUNT[as_bytes].sum(axis=-1, dtype=np.int64)
+
+
+@dataclass(frozen=True)
+class MatchCatalogue:
+    """
+    Arrays pré-computados de um DataFrame de Job Profiles (uma vez por dataset).
+
+    Os arrays estão ordenados por (Job Family, Sub Job Family), mantendo a
+    ordem original dentro de cada par: `partitions[(família, sub)]` é a faixa
+    contígua [início, fim) do par e a posição i corresponde a
+    `profiles.iloc[row_order[i]]`. Cópias só com os arrays (ex.: workers de
+    match_parallel, bundle pré-compilado) têm `profiles=None`; as do bundle
+    trazem em `columns` as colunas de saída, na ordem do catálogo.
+    """
+
+    profiles: Any              # DataFrame de origem, ou None
+    row_order: np.ndarray
+    partitions: Dict[tuple, tuple]
+    grade: np.ndarray          # float; NaN só quando o próprio dado é NaN
+    grade_missing: np.ndarray  # True → similaridade neutra (0.5)
+    kpi_vocab: Dict[str, int]
+    kpi_bits: np.ndarray       # uint64 (perfis x palavras)
+    kpi_count: np.ndarray
+    comp_vocab: Dict[str, int]
+    comp_bits: np.ndarray
+    comp_count: np.ndarray
+    columns: Dict[str, np.ndarray] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return len(self.grade)
+
+    def partition(self, job_family: Any, sub_job_family: Any) -> slice | None:
+        """Faixa do par (Job Family, Sub Job Family) ou None se não houver perfis."""
+        span = self.partitions.get((job_family, sub_job_family))
+        return slice(*span) if span else None
+
+    def row(self, position: int) -> Any:
+        """
+        Linha original do perfil na posição `position` do catálogo (Series);
+        sem `profiles`, um dict com as colunas de `columns`.
+        """
+        if self.profiles is None:
+            return {col: values[position].item() for col, values in self.columns.items()}
+        return self.profiles.iloc[int(self.row_order[position])]
+
+    def families(self) -> List[str]:
+        """Job Families (ordenadas), como no dropdown da página de Job Match."""
+        return sorted({fam for fam, _ in self.partitions if not _is_missing(fam)})
+
+    def sub_families(self, job_family: Any) -> List[str]:
+        """Sub Job Families (ordenadas) de uma Job Family."""
+        return sorted({
+            sub for fam, sub in self.partitions
+            if fam == job_family and not _is_missing(sub)
+        })
+
+
+@dataclass(frozen=True)
+class DimensionMatrix:
+    """
+    Valor esperado (0-1) de cada dimensão do formulário para cada perfil.
+
+    Linhas na ordem do catálogo; NaN quando o perfil não tem grade (a
+    similaridade fica neutra, como em `_grade_similarity`). `expected_sq`
+    guarda os quadrados para que a distância seja só produtos matriz-vetor.
+    """
+
+    catalogue: MatchCatalogue
+    expected: np.ndarray     # (perfis x dimensões)
+    expected_sq: np.ndarray
+    missing: np.ndarray      # True → similaridade neutra (0.5)
+
+
+
+# ==========================================================
+# SCORING VETORIZADO
+# ==========================================================
+def _user_dimensions(form_inputs: Dict[str, Any]) -> tuple[np.ndarray, np.ndarray]:
+    """Respostas normalizadas (0-1) + pesos; dimensões sem resposta ficam com peso 0."""
+    values = np.zeros(len(FORM_DIMENSIONS))
+    weights = np.zeros(len(FORM_DIMENSIONS))
+    for j, (dim, top) in enumerate(FORM_DIMENSIONS.items()):
+        code = _enc(form_inputs.get(dim), FORM_SCALES[dim])
+        if code > 0:
+            values[j] = (code - 1) / (top - 1)
+            weights[j] = DIMENSION_WEIGHTS[dim]
+    return values, weights
+
+
+def _dimension_similarity(dims: DimensionMatrix, positions: slice | np.ndarray,
+                          form_inputs: Dict[str, Any]) -> np.ndarray:
+    """
+    1 - distância euclidiana ponderada (normalizada 0-1) entre as respostas
+    e o perfil esperado: Σw(e-u)² = E²·w - 2·E·(w·u) + Σw·u².
+    """
+    u, w = _user_dimensions(form_inputs)
+    total = w.sum()
+    missing = dims.missing[positions]
+    if total == 0:
+        return np.full(len(missing), 0.5)
+
+    sq = _weighted_sq_distance(dims.expected[positions], dims.expected_sq[positions], u[None, :], w[None, :])
+    sim = 1.0 - np.sqrt(np.maximum(sq, 0.0) / total)
+    return np.where(missing, 0.5, sim)
+
+
+def _weighted_sq_distance(expected: np.ndarray, expected_sq: np.ndarray,
+                          u: np.ndarray, w: np.ndarray) -> np.ndarray:
+    """
+    Σw(e-u)² = E²·w - 2·E·(w·u) + Σw·u² na última dimensão, com broadcasting:
+    u e w têm uma linha por perfil, uma só linha (o mesmo formulário para
+    todos) ou formam uma grade (posições x 1 x dimensões) contra os perfis.
+
+    Soma dimensão a dimensão em vez de `@`: gemv e gemm do BLAS somam em ordens
+    diferentes, e a nota de um formulário sozinho tem que ser idêntica (bit a bit)
+    à do mesmo formulário dentro de um lote — senão empates trocam de ordem.
+    """
+    wu = w * u
+    shape = np.broadcast_shapes(expected.shape[:-1], u.shape[:-1])
+    sq = np.zeros(shape)
+    cross = np.zeros(shape)
+    for j in range(expected.shape[-1]):
+        sq += w[..., j] * expected_sq[..., j]
+        cross += wu[..., j] * expected[..., j]
+    return sq - 2.0 * cross + (wu * u).sum(axis=-1)
+
+
+def _user_grade_hint(form_inputs: Dict[str, Any], emap: Dict[str, int]) -> float:
+    """Estimar um "nível" do usuário a partir de sinais de senioridade."""
+    return (
+        _enc(form_inputs["leadership_type"], emap) + _enc(form_inputs["org_influence"], emap) +
+        _enc(form_inputs["org_impact"], emap) + _enc(form_inputs["span_control"], emap) +
+        _enc(form_inputs["geo_scope"], emap)
+    ) / 5.0
+
+
+def _grade_similarity(user_grade: float | np.ndarray, grade: np.ndarray,
+                      missing: np.ndarray) -> np.ndarray:
+    """Similaridade 0-1 pela proximidade de grade (0.5 se o perfil não tem grade; aceita broadcasting)."""
+    with np.errstate(invalid="ignore"):
+        gap = np.abs(grade - user_grade)
+        denom = np.maximum(np.maximum(grade, user_grade), 1.0)
+        sim = np.maximum(0.0, 1.0 - gap / denom)
+    sim = np.where(np.isnan(sim), 0.0, sim)  # mesmo resultado de max(0.0, nan) no escalar
+    return np.where(missing, 0.5, sim)
+
+
+def _user_bits(selected: List[str], vocab: Dict[str, int], words: int) -> tuple[np.ndarray, int]:
+    """Bitset da seleção do usuário + nº de termos distintos (inclusive fora do vocabulário)."""
+    user = set(selected)
+    mask = np.zeros(words, dtype=np.uint64)
+    for item in user:
+        b = vocab.get(item)
+        if b is not None:
+            mask[b >> 6] |= np.uint64(1) << np.uint64(b & 63)
+    return mask, len(user)
+
+
+def _jaccard_bits(mask: np.ndarray, n_user: int | np.ndarray, bits: np.ndarray,
+                  count: np.ndarray) -> np.ndarray:
+    """
+    Jaccard |A∩B| / (|A| + |B| - |A∩B|) entre bitset(s) do usuário e os perfis.
+
+    mask (palavras,) → (perfis,); mask (usuários, 1, palavras) com n_user
+    (usuários, 1) → matriz (usuários x perfis).
+    """
+    inter = _popcount(bits & mask)
+    union = n_user + count - inter
+    out = np.zeros(inter.shape, dtype=float)
+    np.divide(inter, union, out=out, where=union > 0)
+    return out
+
+
+def _jaccard(selected: List[str], vocab: Dict[str, int], bits: np.ndarray,
+             count: np.ndarray) -> np.ndarray:
+    """Jaccard entre a seleção do usuário e cada bitset."""
+    mask, n_user = _user_bits(selected, vocab, bits.shape[1])
+    return _jaccard_bits(mask, n_user, bits, count)
+
+
+def score_candidates(catalogue: MatchCatalogue, positions: slice | np.ndarray,
+                     form_inputs: Dict[str, Any],
+                     dimensions: DimensionMatrix | None = None) -> np.ndarray:
+    """
+    Nota final (0-1) de cada perfil em `positions` para um formulário.
+
+    Com um slice (ex.: `catalogue.partition(...)`) os arrays são views, sem cópia.
+    Com `dimensions`, o componente de nível usa as 20 dimensões do formulário
+    em vez da estimativa de grade feita com cinco delas.
+    """
+    if dimensions is not None:
+        grade_sim = _dimension_similarity(dimensions, positions, form_inputs)
+    else:
+        user_grade = _user_grade_hint(form_inputs, _encode_map())
+        grade_sim = _grade_similarity(
+            user_grade, catalogue.grade[positions], catalogue.grade_missing[positions]
+        )
+    kpi_score = _jaccard(
+        form_inputs["kpis_selected"], catalogue.kpi_vocab,
+        catalogue.kpi_bits[positions], catalogue.kpi_count[positions],
+    )
+    comp_score = _jaccard(
+        form_inputs["competencies_selected"], catalogue.comp_vocab,
+        catalogue.comp_bits[positions], catalogue.comp_count[positions],
+    )
+
+    # Combinação ponderada: alinhamento de nível + aderência a KPIs/competências
+    return W_GRADE * grade_sim + W_KPI * kpi_score + W_COMP * comp_score
+
+
+def _best_index(scores: np.ndarray) -> int:
+    """
+    Índice da maior nota. Havendo empate, reproduz a escolha de
+    `sort_values(ascending=False).iloc[0]` (quicksort, não estável) para que
+    o perfil devolvido seja o mesmo da implementação linha a linha.
+    """
+    best = int(np.argmax(scores))
+    if np.count_nonzero(scores == scores[best]) > 1:
+        best = len(scores) - 1 - int(scores[::-1].argsort(kind="quicksort")[-1])
+    return best
+
+
+def _top_indices(scores: np.ndarray, k: int) -> np.ndarray:
+    """
+    Índices das k maiores notas, em ordem decrescente, via seleção parcial
+    (argpartition) — sem ordenar o array inteiro. Empates: menor índice
+    primeiro, exceto o 1º lugar, que é sempre o de `_best_index`.
+    """
+    n = len(scores)
+    k = min(k, n)
+    if k <= 0:
+        return np.empty(0, dtype=np.intp)
+    if k == 1:
+        return np.array([_best_index(scores)])
+
+    if k < n:
+        top = np.argpartition(-scores, k - 1)[:k]
+        # a seleção parcial pode cortar no meio de um empate: completa com os menores índices
+        kth = scores[top].min()
+        top = np.concatenate([np.flatnonzero(scores > kth), np.flatnonzero(scores == kth)])[:k]
+    else:
+        top = np.arange(n)
+    top = top[np.lexsort((top, -scores[top]))]
+
+    best = _best_index(scores)
+    if top[0] != best:
+        top = np.concatenate([[best], top[top != best]])[:k]
+    return top
+
+
+def _score_pct(score: float, max_score: float) -> int:
+    return int(round((score / max_score) * 100)) if max_score > 0 else 60
+
+
+def _user_bits_matrix(selections: List[List[str]], vocab: Dict[str, int],
+                      words: int) -> tuple[np.ndarray, np.ndarray]:
+    masks = np.zeros((len(selections), words), dtype=np.uint64)
+    n_user = np.zeros(len(selections), dtype=np.int64)
+    for i, selected in enumerate(selections):
+        masks[i], n_user[i] = _user_bits(selected, vocab, words)
+    return masks, n_user
+
+
+def score_form_batch(catalogue: MatchCatalogue, parts: List[slice], forms: List[Dict[str, Any]],
+                     dimensions: DimensionMatrix | None = None) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Notas de m formulários, cada um contra a sua partição, num só passe.
+
+    Os pares (formulário, perfil) de todos os formulários viram um único vetor
+    (cada formulário ocupa `scores[offsets[i]:offsets[i + 1]]`), então o custo
+    fixo das operações NumPy é pago uma vez por lote, e não por formulário.
+    Cada fatia é idêntica, bit a bit, a `score_candidates(catalogue, parts[i], forms[i])`.
+    """
+    emap = _encode_map()
+    lengths = np.array([p.stop - p.start for p in parts], dtype=np.intp)
+    offsets = np.concatenate([[0], np.cumsum(lengths)])
+    owner = np.repeat(np.arange(len(forms)), lengths)
+    starts = np.array([p.start for p in parts], dtype=np.intp)
+    positions = np.arange(offsets[-1]) + np.repeat(starts - offsets[:-1], lengths)
+
+    if dimensions is not None:
+        u, w = map(np.asarray, zip(*(_user_dimensions(f) for f in forms)))
+        u, w = u[owner], w[owner]
+        total = w.sum(axis=1)
+        sq = _weighted_sq_distance(dimensions.expected[positions], dimensions.expected_sq[positions], u, w)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            sim = 1.0 - np.sqrt(np.maximum(sq, 0.0) / total)
+        grade_sim = np.where(dimensions.missing[positions] | (total == 0), 0.5, sim)
+    else:
+        user_grade = np.array([_user_grade_hint(f, emap) for f in forms])
+        grade_sim = _grade_similarity(
+            user_grade[owner], catalogue.grade[positions], catalogue.grade_missing[positions]
+        )
+    kpi_masks, n_kpi = _user_bits_matrix([f["kpis_selected"] for f in forms], catalogue.kpi_vocab,
+                                         catalogue.kpi_bits.shape[1])
+    comp_masks, n_comp = _user_bits_matrix([f["competencies_selected"] for f in forms], catalogue.comp_vocab,
+                                           catalogue.comp_bits.shape[1])
+    kpi_score = _jaccard_bits(
+        kpi_masks[owner], n_kpi[owner], catalogue.kpi_bits[positions], catalogue.kpi_count[positions]
+    )
+    comp_score = _jaccard_bits(
+        comp_masks[owner], n_comp[owner], catalogue.comp_bits[positions], catalogue.comp_count[positions]
+    )
+    return W_GRADE * grade_sim + W_KPI * kpi_score + W_COMP * comp_score, offsets
+
+
+def rank_catalogue(catalogue: MatchCatalogue, form_inputs: Dict[str, Any], k: int = 5,
+                   dimensions: DimensionMatrix | None = None) -> List[Dict[str, Any]]:
+    """
+    Os `k` perfis mais aderentes da Job Family + Sub Job Family do formulário.
+
+    Mesma nota e mesma ordem de `match_engine.rank_job_matches`, sem pandas:
+    `row` é um dict quando o catálogo veio de um bundle.
+    """
+    part = catalogue.partition(form_inputs["job_family"], form_inputs["sub_job_family"])
+    if part is None:
+        return []
+    scores = score_candidates(catalogue, part, form_inputs, dimensions)
+    top = _top_indices(scores, k)
+    if len(top) == 0:  # k <= 0
+        return []
+    max_score = float(scores[top[0]])
+    return [
+        {
+            "row": catalogue.row(part.start + i),
+            "score": float(scores[i]),
+            "score_pct": _score_pct(float(scores[i]), max_score),
+        }
+        for i in top
+    ]
+
+
+# colunas do perfil expostas fora do app (CLI, servidor, bundle)
+PROFILE_FIELDS = ["Full Job Code", "Job Profile", "Job Family", "Sub Job Family", "Career Path", "Global Grade"]
+
+
+def profile_record(row: Any) -> Dict[str, Any]:
+    """PROFILE_FIELDS de uma linha (Series ou dict do bundle) como tipos JSON."""
+    record = {}
+    for col in PROFILE_FIELDS:
+        value = row.get(col, None)
+        if hasattr(value, "item"):
+            value = value.item()
+        record[col] = None if _is_missing(value) else value
+    return record
+
+
+# ==========================================================
+# BUNDLE PRÉ-COMPILADO (.npz)
+# ==========================================================
+# Arrays do catálogo (+ matriz de dimensões + colunas de saída) num único
+# .npz sem pickle. Vale enquanto os workbooks de origem tiverem o mesmo
+# tamanho/mtime gravados em "signature".
+DATA_DIR = Path(__file__).parent / "data"
+BUNDLE_PATH = Path(__file__).parent / ".cache" / "bundle" / "match_core.npz"
+BUNDLE_FORMAT = 1
+BUNDLE_SOURCES = ("Job Profile.xlsx", "Level Structure.xlsx", "Career Bands & Levels.xlsx")
+
+_ARRAY_FIELDS = ("row_order", "grade", "grade_missing", "kpi_bits", "kpi_count", "comp_bits", "comp_count")
+
+
+def source_signature(data_dir: Path = DATA_DIR) -> np.ndarray:
+    """(tamanho, mtime_ns) de cada workbook de origem; -1 se não existir."""
+    sig = []
+    for filename in BUNDLE_SOURCES:
+        try:
+            st = os.stat(data_dir / filename)
+            sig.append((st.st_size, st.st_mtime_ns))
+        except OSError:
+            sig.append((-1, -1))
+    return np.asarray(sig, dtype=np.int64)
+
+
+def _terms(vocab: Dict[str, int]) -> np.ndarray:
+    """Vocabulário {termo: bit} → array de termos na ordem dos bits."""
+    return np.asarray(sorted(vocab, key=vocab.get), dtype=str)
+
+
+def save_bundle(path: Path, catalogue: MatchCatalogue, dimensions: DimensionMatrix | None = None,
+                signature: np.ndarray | None = None) -> None:
+    """Grava o catálogo em `path` (escrita atômica)."""
+    keys = list(catalogue.partitions)
+    payload = {name: getattr(catalogue, name) for name in _ARRAY_FIELDS}
+    payload.update(
+        format=np.asarray(BUNDLE_FORMAT),
+        signature=source_signature() if signature is None else signature,
+        kpi_terms=_terms(catalogue.kpi_vocab),
+        comp_terms=_terms(catalogue.comp_vocab),
+        part_family=np.asarray([str(f) for f, _ in keys], dtype=str),
+        part_sub=np.asarray([str(s) for _, s in keys], dtype=str),
+        part_bounds=np.asarray([catalogue.partitions[key] for key in keys], dtype=np.int64).reshape(-1, 2),
+        column_names=np.asarray(list(catalogue.columns), dtype=str),
+    )
+    for i, values in enumerate(catalogue.columns.values()):
+        payload[f"column_{i}"] = values
+    if dimensions is not None:
+        payload.update(dims_expected=dimensions.expected, dims_missing=dimensions.missing)
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.stem}.{os.getpid()}.tmp.npz")
+    np.savez_compressed(tmp, **payload)
+    os.replace(tmp, path)
+
+
+def load_bundle(path: Path = BUNDLE_PATH, data_dir: Path | None = DATA_DIR,
+                ) -> Tuple[MatchCatalogue, DimensionMatrix | None] | None:
+    """
+    (catálogo, dimensões) do bundle, ou None se ele não existir, for de
+    outro formato ou estiver desatualizado em relação aos workbooks de
+    `data_dir` (`data_dir=None` pula essa verificação).
+    """
+    try:
+        with np.load(path, allow_pickle=False) as z:
+            if int(z["format"]) != BUNDLE_FORMAT:
+                return None
+            if data_dir is not None and not np.array_equal(z["signature"], source_signature(data_dir)):
+                return None
+
+            arrays = {name: z[name] for name in _ARRAY_FIELDS}
+            partitions = {
+                (fam, sub): (int(start), int(stop))
+                for fam, sub, (start, stop) in zip(z["part_family"].tolist(), z["part_sub"].tolist(), z["part_bounds"])
+            }
+            columns = {name: z[f"column_{i}"] for i, name in enumerate(z["column_names"].tolist())}
+            catalogue = MatchCatalogue(
+                profiles=None,
+                partitions=partitions,
+                kpi_vocab={t: i for i, t in enumerate(z["kpi_terms"].tolist())},
+                comp_vocab={t: i for i, t in enumerate(z["comp_terms"].tolist())},
+                columns=columns,
+                **arrays,
+            )
+            dimensions = None
+            if "dims_expected" in z.files:
+                expected = z["dims_expected"]
+                dimensions = DimensionMatrix(catalogue, expected, expected ** 2, z["dims_missing"])
+    except (OSError, KeyError, ValueError):
+        return None
+    return catalogue, dimensions
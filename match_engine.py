@@ -1,147 +1,383 @@
 # match_engine.py
+import threading
+from pathlib import Path
+
+import numpy as np
 import pandas as pd
 from typing import Dict, Any, List, Optional
 
+from match_core import (  # noqa: F401 — núcleo sem pandas, reexportado aqui
+    BUNDLE_PATH,
+    DIMENSION_WEIGHTS,
+    FORM_DIMENSIONS,
+    FORM_SCALES,
+    W_COMP,
+    W_GRADE,
+    W_KPI,
+    DimensionMatrix,
+    PROFILE_FIELDS,
+    MatchCatalogue,
+    _best_index,
+    _dimension_similarity,
+    _enc,
+    _encode_map,
+    _grade_similarity,
+    _jaccard,
+    _jaccard_bits,
+    _popcount,
+    _score_pct,
+    _top_indices,
+    _user_bits,
+    _user_bits_matrix,
+    _user_dimensions,
+    _user_grade_hint,
+    _weighted_sq_distance,
+    save_bundle,
+    score_candidates,
+)
+from utils.instrumentation import Trace, start_trace
+
 
 # ==========================================================
 # HELPERS
 # ==========================================================
-def _encode_map() -> Dict[str, int]:
-    return {
-        "Choose option": 0,
-
-        # JOB CATEGORY
-        "Executive": 5, "Manager": 4, "Professional": 3,
-        "Technical Support": 2, "Business Support": 2, "Production": 1,
-
-        # GEOGRAPHIC SCOPE
-        "Local": 1, "Regional": 2, "Multi-country": 3, "Global": 4,
+def _clean_list(x: Any) -> List[str]:
+    if pd.isna(x):
+        return []
+    return [i.strip() for i in str(x).split(",") if i.strip()]
 
-        # ORG IMPACT
-        "Team": 1, "Department / Subfunction": 2,
-        "Function": 3, "Business Unit": 4, "Enterprise-wide": 5,
 
-        # SPAN OF CONTROL
-        "No direct reports": 1, "Supervises team": 2, "Leads professionals": 3,
-        "Leads multiple teams": 4, "Leads managers": 5,
+def _grade_from_row(row: Any) -> Optional[float]:
+    """Try to extract a numeric grade/level from the profile row."""
+    gg = None
+    try:
+        gg = float(row.get("Global Grade"))
+    except Exception:
+        gg = None
 
-        # NATURE OF WORK
-        "Process-oriented": 1, "Analysis-oriented": 2,
-        "Specialist": 3, "Leadership-driven": 4,
+    if gg:
+        return gg
 
-        # FINANCIAL IMPACT
-        "No impact": 1, "Cost center impact": 2,
-        "Department-level impact": 3, "Business Unit impact": 4,
-        "Company-wide impact": 5,
+    # fallback: try career level if it is numeric-ish
+    try:
+        cl = float(row.get("Career Level"))
+        return cl
+    except Exception:
+        return None
 
-        # STAKEHOLDERS
-        "Internal team": 1, "Cross-functional": 2,
-        "External vendors": 3, "Customers": 4, "Regulatory/Authorities": 5,
 
-        # DECISION TYPE
-        "Procedural": 1, "Operational": 2, "Tactical": 3, "Strategic": 4,
+# ==========================================================
+# CATÁLOGO VETORIZADO
+# ==========================================================
+REQUIRED_COLUMNS = {
+    "Job Family",
+    "Sub Job Family",
+    "Specific parameters / KPIs",
+    "Competencies 1",
+    "Competencies 2",
+    "Competencies 3",
+    "Global Grade",
+}
+
+def _check_columns(df_profiles: pd.DataFrame) -> None:
+    missing = REQUIRED_COLUMNS - set(df_profiles.columns)
+    if missing:
+        raise ValueError(f"Missing columns in Job Profile dataset: {', '.join(sorted(missing))}")
 
-        # DECISION HORIZON
-        "Daily": 1, "Weekly": 2, "Monthly": 3,
-        "Annual": 4, "Multi-year": 5,
 
-        # AUTONOMY
-        "Close supervision": 1, "Regular guidance": 2, "Independent": 3,
-        "Sets direction for others": 4, "Defines strategy": 5,
+def _intern(lists: List[List[str]]) -> Dict[str, int]:
+    """Vocabulário {termo: bit}, na ordem em que os termos aparecem."""
+    vocab: Dict[str, int] = {}
+    for items in lists:
+        for item in items:
+            vocab.setdefault(item, len(vocab))
+    return vocab
 
-        # PROBLEM SOLVING
-        "Routine/Standardized": 1, "Moderate": 2,
-        "Complex": 3, "Ambiguous/Novel": 4, "Organization-level": 5,
 
-        # KNOWLEDGE DEPTH
-        "Entry-level knowledge": 1, "Applied knowledge": 2,
-        "Advanced expertise": 3, "Recognized expert": 4, "Thought leader": 5,
+def _bitsets(lists: List[List[str]], vocab: Dict[str, int]) -> np.ndarray:
+    """Uma linha de palavras uint64 por perfil; bit b ligado ↔ termo b presente."""
+    words = max(1, (len(vocab) + 63) // 64)
+    bits = np.zeros((len(lists), words), dtype=np.uint64)
+    for i, items in enumerate(lists):
+        for item in items:
+            b = vocab[item]
+            bits[i, b >> 6] |= np.uint64(1) << np.uint64(b & 63)
+    return bits
 
-        # OPERATIONAL COMPLEXITY
-        "Stable operations": 1, "Some variability": 2,
-        "Complex operations": 3, "High-variability environment": 4,
 
-        # INFLUENCE
-        "Team": 1, "Cross-team": 2, "Multi-function": 3,
-        "External vendors/clients": 4, "Industry-level influence": 5,
+def _partition_index(families: np.ndarray, subs: np.ndarray) -> tuple[np.ndarray, Dict[tuple, tuple]]:
+    """Ordem estável agrupando por (família, sub) + faixa [início, fim) de cada par."""
+    groups: Dict[tuple, List[int]] = {}
+    for i, key in enumerate(zip(families.tolist(), subs.tolist())):
+        groups.setdefault(key, []).append(i)
 
-        # SPECIALIZATION LEVEL
-        "Generalist": 1, "Specialist": 2, "Deep Specialist": 3,
+    order, partitions, start = [], {}, 0
+    for key, rows in groups.items():
+        order.extend(rows)
+        partitions[key] = (start, start + len(rows))
+        start += len(rows)
+    return np.asarray(order, dtype=np.intp), partitions
 
-        # INNOVATION RESPONSIBILITY
-        "Execution": 1,
-        "Incremental improvements": 2,
-        "Major improvements": 3,
-        "Innovation leadership": 4,
 
-        # LEADERSHIP TYPE
-        "None": 1, "Team Lead": 2, "Supervisor": 3,
-        "Manager": 4, "Senior Manager": 5, "Director": 6,
+def build_match_catalogue(df_profiles: pd.DataFrame) -> MatchCatalogue:
+    """
+    Pré-computa grade, KPIs e competências de todos os perfis.
 
-        # ORGANIZATIONAL INFLUENCE
-        "Team": 1, "Department": 2,
-        "Business Unit": 3, "Function": 4, "Enterprise-wide": 5,
+    Os textos de KPIs/competências são quebrados uma única vez aqui; cada
+    perfil guarda seus termos como um bitset de largura fixa.
+    """
+    _check_columns(df_profiles)
+
+    order, partitions = _partition_index(
+        df_profiles["Job Family"].to_numpy(dtype=object),
+        df_profiles["Sub Job Family"].to_numpy(dtype=object),
+    )
+    df_sorted = df_profiles.iloc[order]
+
+    grade_cols = [c for c in ("Global Grade", "Career Level") if c in df_sorted.columns]
+    grades = [_grade_from_row(r) for r in df_sorted[grade_cols].to_dict("records")]
+    grade_missing = np.array([g is None for g in grades], dtype=bool)
+    grade = np.array([np.nan if g is None else g for g in grades], dtype=float)
+
+    kpi_lists = df_sorted["Specific parameters / KPIs"].apply(_clean_list).tolist()
+    comp_lists = (
+        df_sorted["Competencies 1"].fillna("") + "," +
+        df_sorted["Competencies 2"].fillna("") + "," +
+        df_sorted["Competencies 3"].fillna("")
+    ).apply(_clean_list).tolist()
+
+    kpi_vocab, comp_vocab = _intern(kpi_lists), _intern(comp_lists)
+    kpi_bits, comp_bits = _bitsets(kpi_lists, kpi_vocab), _bitsets(comp_lists, comp_vocab)
+
+    return MatchCatalogue(
+        profiles=df_profiles,
+        row_order=order,
+        partitions=partitions,
+        grade=grade,
+        grade_missing=grade_missing,
+        kpi_vocab=kpi_vocab,
+        kpi_bits=kpi_bits,
+        kpi_count=_popcount(kpi_bits),
+        comp_vocab=comp_vocab,
+        comp_bits=comp_bits,
+        comp_count=_popcount(comp_bits),
+    )
+
+
+_catalogues: Dict[str, MatchCatalogue] = {}
+_catalogues_lock = threading.Lock()
+
+
+def get_match_catalogue(df_profiles: pd.DataFrame, version: str) -> MatchCatalogue:
+    """Catálogo do processo para uma versão do dataset (ex.: DataStore.version)."""
+    cat = _catalogues.get(version)
+    if cat is None:
+        with _catalogues_lock:
+            cat = _catalogues.get(version)
+            if cat is None:
+                cat = build_match_catalogue(df_profiles)
+                _catalogues.clear()  # só a versão corrente fica em memória
+                _catalogues[version] = cat
+    return cat
 
-        # EDUCATION
-        "High School": 1, "Technical Degree": 2, "Bachelor’s": 3,
-        "Post-graduate": 4, "Master’s": 5, "Doctorate": 6,
 
-        # EXPERIENCE
-        "< 2 years": 1, "2–5 years": 2, "5–10 years": 3,
-        "10–15 years": 4, "15+ years": 5,
-    }
+# ==========================================================
+# DIMENSÕES DO FORMULÁRIO — VALORES ESPERADOS POR PERFIL
+# ==========================================================
+# Career Band Name (Career Bands & Levels) → opção de "Job Category" do formulário
+_BAND_CATEGORY = {
+    "Executive": "Executive",
+    "Management": "Manager",
+    "Professional": "Professional",
+    "Client Management and Sales": "Professional",
+    "Technical Support": "Technical Support",
+    "Business Support": "Business Support",
+    "Production/Manual Labor": "Production",
+}
+
+
+def _band_names(career_bands_levels: pd.DataFrame) -> Dict[str, str]:
+    """{código da banda: nome} — linhas de banda são as que não têm nível/grade (ex.: "M")."""
+    names = {}
+    if {"Career Band/Level/Grade", "Career Band Name"} <= set(career_bands_levels.columns):
+        for code, name in zip(career_bands_levels["Career Band/Level/Grade"],
+                              career_bands_levels["Career Band Name"]):
+            if isinstance(code, str) and isinstance(name, str) and code.strip().isalpha():
+                names[code.strip()] = name.strip()
+    return names
+
+
+def build_dimension_matrix(catalogue: MatchCatalogue, level_structure: pd.DataFrame,
+                           career_bands_levels: pd.DataFrame) -> DimensionMatrix:
+    """
+    Deriva, uma vez por dataset, o perfil "esperado" de cada Job Profile.
 
+    - Level Structure dá a faixa de grades da arquitetura e a Career Band de
+      cada (Career Path, Global Grade);
+    - Job Category vem do nome da banda (Career Bands & Levels);
+    - as demais dimensões crescem linearmente com a posição da grade na faixa.
+    """
+    profiles = catalogue.profiles.iloc[catalogue.row_order]
+    grade = np.where(catalogue.grade_missing, np.nan, catalogue.grade)
+
+    grades = pd.to_numeric(level_structure.get("Global Grade"), errors="coerce").dropna()
+    g_min, g_max = (grades.min(), grades.max()) if len(grades) else (np.nanmin(grade), np.nanmax(grade))
+    pos = np.clip((grade - g_min) / max(g_max - g_min, 1.0), 0.0, 1.0)
+
+    # Career Band de cada perfil via (Career Path, Global Grade)
+    band_of = {}
+    if {"Career Path", "Global Grade", "Career Band"} <= set(level_structure.columns):
+        for path, g, band in zip(level_structure["Career Path"], level_structure["Global Grade"],
+                                 level_structure["Career Band"]):
+            band_of[(str(path).strip(), pd.to_numeric(g, errors="coerce"))] = str(band).strip()
+    names = _band_names(career_bands_levels)
+    paths = profiles["Career Path"].astype(str).str.strip() if "Career Path" in profiles else None
+
+    # 1 + (top - 1) * pos em cada escala, já normalizado para 0-1
+    expected = np.repeat(pos[:, None], len(FORM_DIMENSIONS), axis=1)
+
+    if paths is not None:
+        j = list(FORM_DIMENSIONS).index("job_category")
+        top = FORM_DIMENSIONS["job_category"]
+        for i, (path, g) in enumerate(zip(paths, grade)):
+            category = _BAND_CATEGORY.get(names.get(band_of.get((path, g), ""), ""))
+            if category is not None:
+                expected[i, j] = (FORM_SCALES["job_category"][category] - 1) / (top - 1)
+
+    missing = np.isnan(expected).any(axis=1)
+    expected = np.where(np.isnan(expected), 0.0, expected)
+    return DimensionMatrix(catalogue, expected, expected ** 2, missing)
+
+
+_dimensions: Dict[str, DimensionMatrix] = {}
+
+
+def get_dimension_matrix(catalogue: MatchCatalogue, version: str, level_structure: pd.DataFrame,
+                         career_bands_levels: pd.DataFrame) -> DimensionMatrix:
+    """DimensionMatrix do processo para uma versão do dataset (ex.: DataStore.version)."""
+    dims = _dimensions.get(version)
+    if dims is None or dims.catalogue is not catalogue:
+        with _catalogues_lock:
+            dims = _dimensions.get(version)
+            if dims is None or dims.catalogue is not catalogue:
+                dims = build_dimension_matrix(catalogue, level_structure, career_bands_levels)
+                _dimensions.clear()  # só a versão corrente fica em memória
+                _dimensions[version] = dims
+    return dims
 
-def _enc(x: Any, emap: Dict[str, int]) -> int:
-    return emap.get(x, 0)
 
+# ==========================================================
+# BUNDLE PARA O NÚCLEO SEM PANDAS (match_core.load_bundle)
+# ==========================================================
+# colunas de saída guardadas no bundle (CLI / servidor sem DataFrame)
+BUNDLE_COLUMNS = PROFILE_FIELDS
 
-def _clean_list(x: Any) -> List[str]:
-    if pd.isna(x):
-        return []
-    return [i.strip() for i in str(x).split(",") if i.strip()]
 
+def compile_match_bundle(catalogue: MatchCatalogue, dimensions: DimensionMatrix | None = None,
+                         path: Path = BUNDLE_PATH) -> Path:
+    """
+    Pré-compila catálogo (+ dimensões) para `match_core.load_bundle`.
 
-def _overlap(a: List[str], b: List[str]) -> float:
-    """Jaccard similarity between two lists."""
-    sa, sb = set(a), set(b)
-    if not sa and not sb:
-        return 0.0
-    return len(sa & sb) / len(sa | sb)
+    Colunas numéricas ficam numéricas; as demais viram texto ("" para NaN).
+    """
+    profiles = catalogue.profiles.iloc[catalogue.row_order]
+    columns = {}
+    for col in BUNDLE_COLUMNS:
+        if col not in profiles.columns:
+            continue
+        values = profiles[col]
+        if pd.api.types.is_numeric_dtype(values):
+            columns[col] = values.to_numpy()
+        else:
+            columns[col] = values.fillna("").astype(str).to_numpy(dtype=str)
+
+    bundled = MatchCatalogue(**{**catalogue.__dict__, "columns": columns})
+    save_bundle(path, bundled, dimensions)
+    return path
 
 
-def _grade_from_row(row: Any) -> Optional[float]:
-    """Try to extract a numeric grade/level from the profile row."""
-    gg = None
-    try:
-        gg = float(row.get("Global Grade"))
-    except Exception:
-        gg = None
+# ==========================================================
+# PUBLIC: MAIN MATCH FUNCTION
+# ==========================================================
+def rank_job_matches(form_inputs: Dict[str, Any], df_profiles: pd.DataFrame, k: int = 5,
+                     catalogue: MatchCatalogue | None = None,
+                     dimensions: DimensionMatrix | None = None) -> List[Dict[str, Any]]:
+    """
+    Os `k` perfis mais aderentes da Job Family + Sub Job Family escolhidas.
 
-    if gg:
-        return gg
+    Mesmas entradas de `compute_job_match`. Retorna uma lista (vazia se não
+    houver perfis), do melhor para o pior, com:
+        {"row": Series, "score": float (0-1), "score_pct": int (relativo ao 1º)}
+    O 1º item é sempre o mesmo perfil devolvido por `compute_job_match`
+    (sem `dimensions`; ver `get_dimension_matrix`).
 
-    # fallback: try career level if it is numeric-ish
+    Com algum sink ativo (utils.instrumentation), cada chamada registra o
+    tempo e o nº de linhas de cada etapa.
+    """
+    trace = start_trace("rank_job_matches", k=k)
     try:
-        cl = float(row.get("Career Level"))
-        return cl
-    except Exception:
-        return None
-
+        return _rank_job_matches(form_inputs, df_profiles, k, catalogue, dimensions, trace)
+    finally:
+        if trace:
+            trace.finish()
+
+
+def _rank_job_matches(form_inputs: Dict[str, Any], df_profiles: pd.DataFrame, k: int,
+                      catalogue: MatchCatalogue | None, dimensions: DimensionMatrix | None,
+                      trace: Trace | None) -> List[Dict[str, Any]]:
+    _check_columns(df_profiles)
+    if dimensions is not None:
+        catalogue = dimensions.catalogue
+
+    if catalogue is None:
+        # sem catálogo: pré-processa só os perfis da mesma Job Family + Sub Job Family
+        df_filtered = df_profiles[
+            (df_profiles["Job Family"] == form_inputs["job_family"]) &
+            (df_profiles["Sub Job Family"] == form_inputs["sub_job_family"])
+        ]
+        if df_filtered.empty:
+            if trace:
+                trace.mark("catalogue", rows=0)
+            return []
+        catalogue = build_match_catalogue(df_filtered)
+        if trace:
+            trace.mark("catalogue", rows=len(df_filtered))
+
+    # 1) HARD FILTER: faixa contígua do par no catálogo (O(1), sem cópia)
+    part = catalogue.partition(form_inputs["job_family"], form_inputs["sub_job_family"])
+    if trace:
+        trace.mark("filter", rows=0 if part is None else part.stop - part.start)
+    if part is None:
+        return []
 
-def _normalized_grade_similarity(user_grade: float, profile_grade: Optional[float]) -> float:
-    """Similarity 0-1 based on grade proximity."""
-    if profile_grade is None or user_grade is None:
-        return 0.5  # neutral if missing
-    gap = abs(profile_grade - user_grade)
-    denom = max(profile_grade, user_grade, 1.0)
-    return max(0.0, 1.0 - gap / denom)
+    # 2) Score de todos os candidatos de uma vez
+    scores = score_candidates(catalogue, part, form_inputs, dimensions)
+    if trace:
+        trace.mark("score", rows=len(scores))
 
+    # 3) Top-k por seleção parcial
+    top = _top_indices(scores, k)
+    if trace:
+        trace.mark("top_k", rows=len(top))
+    if len(top) == 0:  # k <= 0
+        return []
 
-# ==========================================================
-# PUBLIC: MAIN MATCH FUNCTION
-# ==========================================================
-def compute_job_match(form_inputs: Dict[str, Any], df_profiles: pd.DataFrame) -> Dict[str, Any] | None:
+    max_score = float(scores[top[0]])
+    ranked = [
+        {
+            "row": catalogue.row(part.start + i),
+            "score": float(scores[i]),
+            "score_pct": _score_pct(float(scores[i]), max_score),
+        }
+        for i in top
+    ]
+    if trace:
+        trace.mark("rows", rows=len(ranked))
+    return ranked
+
+
+def compute_job_match(form_inputs: Dict[str, Any], df_profiles: pd.DataFrame,
+                      catalogue: MatchCatalogue | None = None) -> Dict[str, Any] | None:
     """
     form_inputs: dicionário vindo da UI (5_Job_Match.py) com:
       - job_family, sub_job_family
@@ -161,99 +397,262 @@ def compute_job_match(form_inputs: Dict[str, Any], df_profiles: pd.DataFrame) ->
                  "Grade Differentiator", "Qualifications",
                  "Specific parameters / KPIs", "Competencies 1", "Competencies 2", "Competencies 3"
 
+    catalogue: MatchCatalogue já construído para `df_profiles` (ver
+               get_match_catalogue). Sem ele, só os perfis da Sub Job Family
+               escolhida são pré-processados nesta chamada.
+
     Retorna:
         {"row": best_row (Series), "score_pct": int} ou None.
     """
+    ranked = rank_job_matches(form_inputs, df_profiles, k=1, catalogue=catalogue)
+    if not ranked:
+        return None
+    return {"row": ranked[0]["row"], "score_pct": ranked[0]["score_pct"]}
 
-    required_cols = {
-        "Job Family",
-        "Sub Job Family",
-        "Specific parameters / KPIs",
-        "Competencies 1",
-        "Competencies 2",
-        "Competencies 3",
-        "Global Grade",
-    }
-    missing = required_cols - set(df_profiles.columns)
-    if missing:
-        raise ValueError(f"Missing columns in Job Profile dataset: {', '.join(sorted(missing))}")
 
-    emap = _encode_map()
+# ==========================================================
+# BULK: NIVELAMENTO DE MUITAS POSIÇÕES DE UMA VEZ
+# ==========================================================
+# campos do formulário que efetivamente entram na nota
+BULK_REQUIRED_FIELDS = [
+    "job_family", "sub_job_family",
+    "leadership_type", "org_influence", "org_impact", "span_control", "geo_scope",
+    "kpis_selected", "competencies_selected",
+]
 
-    job_family = form_inputs["job_family"]
-    sub_job_family = form_inputs["sub_job_family"]
+# teto de células (posições x perfis x palavras) por bloco — limita a memória
+BULK_BLOCK_CELLS = 1 << 22
 
-    # 1) HARD FILTER: mesma Job Family + Sub Job Family
-    df_filtered = df_profiles[
-        (df_profiles["Job Family"] == job_family) &
-        (df_profiles["Sub Job Family"] == sub_job_family)
-    ].copy()
 
-    if df_filtered.empty:
-        return None
+def _selection(x: Any) -> List[str]:
+    """Multiselect vindo de um DataFrame: lista pronta ou texto separado por vírgulas."""
+    if isinstance(x, (list, tuple, set, np.ndarray)):
+        return list(x)
+    return _clean_list(x)
 
-    # 2) User signature (numérico) — mesmo que a versão unificada
-    user_sig = {
-        "cat": _enc(form_inputs["job_category"], emap),
-        "geo": _enc(form_inputs["geo_scope"], emap),
-        "impact": _enc(form_inputs["org_impact"], emap),
-        "span": _enc(form_inputs["span_control"], emap),
-        "nature": _enc(form_inputs["nature_work"], emap),
-        "finimp": _enc(form_inputs["financial_impact"], emap),
-        "stake": _enc(form_inputs["stakeholder_complexity"], emap),
-        "dtype": _enc(form_inputs["decision_type"], emap),
-        "dhoriz": _enc(form_inputs["decision_horizon"], emap),
-
-        "auto": _enc(form_inputs["autonomy"], emap),
-        "ps": _enc(form_inputs["problem_solving"], emap),
-        "kdepth": _enc(form_inputs["knowledge_depth"], emap),
-        "opcomp": _enc(form_inputs["operational_complexity"], emap),
-        "infl": _enc(form_inputs["influence_level"], emap),
-
-        "edu": _enc(form_inputs["education"], emap),
-        "exp": _enc(form_inputs["experience"], emap),
-        "spec": _enc(form_inputs["specialization_level"], emap),
-        "innov": _enc(form_inputs["innovation_resp"], emap),
-        "lead": _enc(form_inputs["leadership_type"], emap),
-        "orginf": _enc(form_inputs["org_influence"], emap),
-    }
 
-    kpis_selected = form_inputs["kpis_selected"]
-    competencies_selected = form_inputs["competencies_selected"]
+def positions_dimensions(positions: pd.DataFrame) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Respostas (0-1) e pesos das 20 dimensões, uma linha por posição — como
+    `_user_dimensions`; colunas ausentes contam como dimensão sem resposta.
+    """
+    values = np.zeros((len(positions), len(FORM_DIMENSIONS)))
+    weights = np.zeros((len(positions), len(FORM_DIMENSIONS)))
+    for j, (dim, top) in enumerate(FORM_DIMENSIONS.items()):
+        if dim not in positions.columns:
+            continue
+        code = positions[dim].map(FORM_SCALES[dim]).fillna(0).to_numpy(dtype=float)
+        answered = code > 0
+        values[:, j] = np.where(answered, (code - 1) / (top - 1), 0.0)
+        weights[:, j] = np.where(answered, DIMENSION_WEIGHTS[dim], 0.0)
+    return values, weights
+
+
+def _dimension_block(dimensions: DimensionMatrix, part: slice, u: np.ndarray, w: np.ndarray) -> np.ndarray:
+    """`_dimension_similarity` de m posições contra uma partição: matriz (m x perfis)."""
+    total = w.sum(axis=1)[:, None]
+    sq = _weighted_sq_distance(dimensions.expected[part][None], dimensions.expected_sq[part][None],
+                               u[:, None, :], w[:, None, :])
+    with np.errstate(invalid="ignore", divide="ignore"):
+        sim = 1.0 - np.sqrt(np.maximum(sq, 0.0) / total)
+    return np.where(dimensions.missing[part][None, :] | (total == 0), 0.5, sim)
+
+
+def score_block(catalogue: MatchCatalogue, part: slice, user_grade: np.ndarray,
+                kpi_masks: np.ndarray, n_kpi: np.ndarray,
+                comp_masks: np.ndarray, n_comp: np.ndarray,
+                dimensions: DimensionMatrix | None = None,
+                user_dims: tuple[np.ndarray, np.ndarray] | None = None) -> np.ndarray:
+    """
+    Notas de m posições contra os perfis de uma partição: matriz (m x perfis).
 
-    # 3) KPIs / Competências da base
-    df_filtered["__kpis_list"] = df_filtered["Specific parameters / KPIs"].apply(_clean_list)
+    Mesma conta de `score_candidates`, linha a linha idêntica. Com
+    `dimensions`, o componente de nível usa `user_dims` (respostas, pesos de
+    `positions_dimensions`) em vez de `user_grade`.
+    """
+    if dimensions is not None:
+        grade_sim = _dimension_block(dimensions, part, *user_dims)
+    else:
+        grade_sim = _grade_similarity(
+            user_grade[:, None], catalogue.grade[part][None, :], catalogue.grade_missing[part][None, :]
+        )
+    kpi_score = _jaccard_bits(
+        kpi_masks[:, None, :], n_kpi[:, None], catalogue.kpi_bits[part], catalogue.kpi_count[part]
+    )
+    comp_score = _jaccard_bits(
+        comp_masks[:, None, :], n_comp[:, None], catalogue.comp_bits[part], catalogue.comp_count[part]
+    )
+    return W_GRADE * grade_sim + W_KPI * kpi_score + W_COMP * comp_score
+
+
+def _top_k_rows(scores: np.ndarray, k: int) -> np.ndarray:
+    """`_top_indices` aplicado a cada linha; só linhas com empate relevante saem do caminho vetorizado."""
+    m, n = scores.shape
+    k = min(k, n)
+    cand = np.argpartition(-scores, k - 1, axis=1)[:, :k] if k < n else np.tile(np.arange(n), (m, 1))
+    vals = np.take_along_axis(scores, cand, axis=1)
+    top = np.take_along_axis(cand, np.lexsort((cand, -vals), axis=1), axis=1)
+
+    # empate no 1º lugar (desempate legado) ou na fronteira do k (seleção parcial ambígua)
+    best_val, kth_val = vals.max(axis=1), vals.min(axis=1)
+    tied = (
+        ((scores == best_val[:, None]).sum(axis=1) > 1) |
+        ((scores >= kth_val[:, None]).sum(axis=1) > k)
+    )
+    for i in np.flatnonzero(tied):
+        top[i] = _top_indices(scores[i], k)
+    return top
+
+
+def read_positions(positions: pd.DataFrame | str) -> pd.DataFrame:
+    """Posições em lote (DataFrame ou caminho de CSV), validando as colunas usadas."""
+    if not isinstance(positions, pd.DataFrame):
+        positions = pd.read_csv(positions)
+
+    missing = set(BULK_REQUIRED_FIELDS) - set(positions.columns)
+    if missing:
+        raise ValueError(f"Missing columns in positions: {', '.join(sorted(missing))}")
+    return positions
 
-    df_filtered["__comp_list"] = (
-        df_filtered["Competencies 1"].fillna("") + "," +
-        df_filtered["Competencies 2"].fillna("") + "," +
-        df_filtered["Competencies 3"].fillna("")
-    ).apply(_clean_list)
 
-    # 4) Global Grade numérico para penalidade
-    df_filtered["__gg_num"] = pd.to_numeric(df_filtered["Global Grade"], errors="coerce")
+def bulk_top_k(catalogue: MatchCatalogue, positions: pd.DataFrame,
+               top_k: int = 3, dimensions: DimensionMatrix | None = None) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Núcleo numérico do lote: para cada posição, as posições no catálogo dos
+    top_k perfis (-1 = sem perfil) e as respectivas notas (NaN = sem perfil).
+
+    Só usa os arrays do catálogo (não toca em `catalogue.profiles`). Com
+    `dimensions`, a nota é a de `rank_job_matches(..., dimensions=...)`.
+    """
+    trace = start_trace("bulk_top_k", top_k=top_k, dimensions=dimensions is not None)
+    try:
+        return _bulk_top_k(catalogue, positions, top_k, dimensions, trace)
+    finally:
+        if trace:
+            trace.finish()
+
 
-    # Estimar um "nível" do usuário a partir de sinais de senioridade
-    user_grade_hint = (
-        user_sig["lead"] + user_sig["orginf"] + user_sig["impact"] + user_sig["span"] + user_sig["geo"]
+def _bulk_top_k(catalogue: MatchCatalogue, positions: pd.DataFrame, top_k: int,
+                dimensions: DimensionMatrix | None, trace: Trace | None) -> tuple[np.ndarray, np.ndarray]:
+    n = len(positions)
+    emap = _encode_map()
+    user_grade = sum(
+        positions[f].map(emap).fillna(0).to_numpy(dtype=float)
+        for f in ("leadership_type", "org_influence", "org_impact", "span_control", "geo_scope")
     ) / 5.0
+    user_u, user_w = positions_dimensions(positions) if dimensions is not None else (None, None)
+    kpi_sel = [_selection(x) for x in positions["kpis_selected"].tolist()]
+    comp_sel = [_selection(x) for x in positions["competencies_selected"].tolist()]
+
+    top_pos = np.full((n, max(top_k, 1)), -1, dtype=np.intp)
+    top_score = np.full((n, max(top_k, 1)), np.nan)
+
+    groups: Dict[tuple, List[int]] = {}
+    for i, key in enumerate(zip(positions["job_family"].tolist(), positions["sub_job_family"].tolist())):
+        groups.setdefault(key, []).append(i)
+    if trace:
+        trace.mark("parse", rows=n)
+
+    words = catalogue.kpi_bits.shape[1] + catalogue.comp_bits.shape[1]
+    for key, rows in groups.items():
+        part = catalogue.partition(*key)
+        if part is None:
+            continue
+        n_prof = part.stop - part.start
+        block = max(1, BULK_BLOCK_CELLS // (n_prof * words))
+        k = min(top_k, n_prof)
+
+        for b in range(0, len(rows), block):
+            idx = np.asarray(rows[b:b + block])
+            kpi_masks, n_kpi = _user_bits_matrix([kpi_sel[i] for i in idx], catalogue.kpi_vocab,
+                                                 catalogue.kpi_bits.shape[1])
+            comp_masks, n_comp = _user_bits_matrix([comp_sel[i] for i in idx], catalogue.comp_vocab,
+                                                   catalogue.comp_bits.shape[1])
+            user_dims = (user_u[idx], user_w[idx]) if dimensions is not None else None
+            scores = score_block(catalogue, part, user_grade[idx], kpi_masks, n_kpi, comp_masks, n_comp,
+                                 dimensions, user_dims)
+            top = _top_k_rows(scores, k)
+            top_pos[idx, :k] = part.start + top
+            top_score[idx, :k] = np.take_along_axis(scores, top, axis=1)
+
+    if trace:
+        trace.mark("score_top_k", rows=n)
+    return top_pos, top_score
+
+
+def catalogue_output_columns(catalogue: MatchCatalogue) -> Dict[str, np.ndarray]:
+    """Full Job Code / Job Profile / Global Grade na ordem do catálogo (saída do lote)."""
+    def column(col: str) -> np.ndarray:
+        if col not in catalogue.profiles.columns:
+            return np.full(len(catalogue), None, dtype=object)
+        return catalogue.profiles[col].to_numpy(dtype=object)[catalogue.row_order]
 
-    scores: List[float] = []
-    for _, row in df_filtered.iterrows():
-        profile_grade = _grade_from_row(row)
-        grade_sim = _normalized_grade_similarity(user_grade_hint, profile_grade)
+    return {
+        "code": column("Full Job Code"),
+        "title": column("Job Profile"),
+        "grade": column("Global Grade"),
+    }
 
-        kpi_score = _overlap(kpis_selected, row["__kpis_list"])
-        comp_score = _overlap(competencies_selected, row["__comp_list"])
 
-        # Combinação ponderada: alinhamento de nível + aderência a KPIs/competências
-        final_score = 0.5 * grade_sim + 0.3 * kpi_score + 0.2 * comp_score
-        scores.append(final_score)
+def bulk_result_frame(positions: pd.DataFrame, top_pos: np.ndarray, top_score: np.ndarray,
+                      top_k: int, columns: Dict[str, np.ndarray]) -> pd.DataFrame:
+    """Monta a tabela de resultado do lote (ver `bulk_job_match`)."""
+    found = top_pos[:, 0] >= 0
+    best = np.where(found, top_pos[:, 0], 0)
+    best_score = top_score[:, 0]
+    codes = columns["code"]
+
+    out = {
+        "position_id": positions["position_id"].to_numpy() if "position_id" in positions.columns
+        else positions.index.to_numpy(),
+        "job_family": positions["job_family"].to_numpy(),
+        "sub_job_family": positions["sub_job_family"].to_numpy(),
+        "best_job_code": np.where(found, codes[best], None),
+        "best_job_profile": np.where(found, columns["title"][best], None),
+        "best_global_grade": np.where(found, columns["grade"][best], None),
+        "score": best_score,
+        # mesma regra de compute_job_match: nota relativa ao melhor (100) ou 60 se tudo zero
+        "score_pct": pd.Series(np.where(best_score > 0, 100, 60), dtype="Int64").where(found),
+    }
+    for r in range(1, top_k):
+        has = top_pos[:, r] >= 0
+        out[f"runner_up_{r}_job_code"] = np.where(has, codes[np.where(has, top_pos[:, r], 0)], None)
+        out[f"runner_up_{r}_score"] = top_score[:, r]
 
-    df_filtered["__match_score"] = scores
-    best = df_filtered.sort_values("__match_score", ascending=False).iloc[0]
+    return pd.DataFrame(out)
 
-    max_score = float(df_filtered["__match_score"].max())
-    score_pct = int(round((float(best["__match_score"]) / max_score) * 100)) if max_score > 0 else 60
 
-    return {"row": best, "score_pct": score_pct}
+def bulk_job_match(positions: pd.DataFrame | str, df_profiles: pd.DataFrame,
+                   catalogue: MatchCatalogue | None = None, top_k: int = 3,
+                   dimensions: DimensionMatrix | None = None) -> pd.DataFrame:
+    """
+    Nivelamento em lote: uma linha por posição (ex.: extração do HRIS).
+
+    positions: DataFrame (ou caminho de um CSV) com as mesmas chaves do
+               formulário de `compute_job_match`, uma posição por linha.
+               kpis_selected / competencies_selected podem ser listas ou
+               textos separados por vírgula. Uma coluna opcional
+               "position_id" é repassada ao resultado (senão, o índice).
+
+    As posições são agrupadas por (Job Family, Sub Job Family) e cada grupo é
+    pontuado em blocos matriciais contra a partição do catálogo. O melhor
+    perfil de cada linha é o mesmo de `rank_job_matches` com as mesmas
+    `dimensions` (sem elas, o de `compute_job_match`); com `dimensions`, as
+    colunas das 20 dimensões do formulário também são lidas (as ausentes
+    ficam sem resposta).
+
+    Retorna um DataFrame com position_id, job_family, sub_job_family,
+    best_job_code, best_job_profile, best_global_grade, score, score_pct e,
+    para r = 1..top_k-1, runner_up_{r}_job_code / runner_up_{r}_score.
+    Posições sem perfis na Sub Job Family ficam com best_job_code vazio.
+    """
+    if top_k < 1:
+        raise ValueError(f"top_k must be at least 1, got {top_k}")
+    positions = read_positions(positions)
+    if dimensions is not None:
+        catalogue = dimensions.catalogue
+    if catalogue is None:
+        catalogue = build_match_catalogue(df_profiles)
+
+    top_pos, top_score = bulk_top_k(catalogue, positions, top_k, dimensions)
+    return bulk_result_frame(positions, top_pos, top_score, top_k, catalogue_output_columns(catalogue))
@@ -0,0 +1,238 @@
+# match_global.py
+# ==========================================================
+# MATCH GLOBAL — vizinhos mais próximos em todas as Job Families
+# ==========================================================
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, List
+
+import numpy as np
+import pandas as pd
+from sklearn.neighbors import NearestNeighbors
+
+from match_engine import (
+    DIMENSION_WEIGHTS,
+    FORM_DIMENSIONS,
+    W_COMP,
+    W_GRADE,
+    W_KPI,
+    DimensionMatrix,
+    MatchCatalogue,
+    _check_columns,
+    _encode_map,
+    _score_pct,
+    _top_indices,
+    _user_dimensions,
+    _user_grade_hint,
+    build_match_catalogue,
+    score_candidates,
+)
+
+# vizinhos buscados no índice antes do re-ranking exato (por posição pedida)
+CANDIDATES_PER_RESULT = 10
+MIN_CANDIDATES = 100
+
+
+# ==========================================================
+# ESPAÇO DE FEATURES
+# ==========================================================
+# Cada perfil/formulário vira [nível | KPIs | competências]:
+#   - nível = grade em log: a similaridade do motor (1 - gap / maior grade) só
+#     depende da razão entre as grades, isto é, da distância em log;
+#   - com `dimensions` (scoring pelas 20 dimensões), nível = o perfil esperado
+#     de cada dimensão (as respostas, no formulário), escalado por
+#     √(peso / Σpesos): a distância ao quadrado no bloco é a mesma d² que a
+#     nota exata usa — o índice procura no mesmo espaço do re-ranking;
+#   - KPIs e competências como one-hot normalizado (L2), de modo que a
+#     distância euclidiana ao quadrado seja 2 - 2·cosseno;
+#   - blocos escalados pelos pesos da nota (W_GRADE, W_KPI, W_COMP).
+# A distância no espaço só serve para achar candidatos; a ordem final
+# usa a nota exata de score_candidates.
+_SCALE_GRADE = np.sqrt(W_GRADE)
+_SCALE_KPI = np.sqrt(W_KPI / 2)
+_SCALE_COMP = np.sqrt(W_COMP / 2)
+_DIM_WEIGHTS = np.array([DIMENSION_WEIGHTS[d] for d in FORM_DIMENSIONS])
+_SCALE_DIMS = np.sqrt(W_GRADE * _DIM_WEIGHTS / _DIM_WEIGHTS.sum())
+
+
+def _bits_to_dense(bits: np.ndarray, size: int) -> np.ndarray:
+    """Bitsets uint64 (n x palavras) → matriz 0/1 (n x size)."""
+    as_bytes = np.ascontiguousarray(bits).view(np.uint8)
+    return np.unpackbits(as_bytes, axis=1, bitorder="little")[:, :size].astype(float)
+
+
+def _unit_rows(m: np.ndarray) -> np.ndarray:
+    """
+    Linhas normalizadas (L2) + uma coluna que marca o conjunto vazio: um
+    perfil sem KPIs fica tão longe de uma seleção quanto um perfil sem KPI
+    em comum (Jaccard 0 nos dois casos), e não a meio caminho.
+    """
+    norm = np.linalg.norm(m, axis=1, keepdims=True)
+    unit = np.divide(m, norm, out=np.zeros_like(m), where=norm > 0)
+    return np.hstack([unit, (norm == 0).astype(float)])
+
+
+def _log_grade(grade: np.ndarray | float) -> np.ndarray:
+    return np.log(np.maximum(grade, 1.0))
+
+
+def _level_block(catalogue: MatchCatalogue, dimensions: DimensionMatrix | None) -> np.ndarray:
+    if dimensions is not None:
+        # perfil sem grade: vai para a mediana de cada dimensão (a nota exata trata como neutro)
+        expected = np.where(dimensions.missing[:, None], np.nan, dimensions.expected)
+        fill = np.nanmedian(expected, axis=0) if (~dimensions.missing).any() else np.zeros(expected.shape[1])
+        return _SCALE_DIMS * np.where(np.isnan(expected), fill, expected)
+
+    grade = np.where(catalogue.grade_missing, np.nan, catalogue.grade)
+    # grade ausente: vai para a mediana (a nota exata trata como neutra)
+    fill = np.nanmedian(grade) if np.isfinite(grade).any() else 1.0
+    grade = np.where(np.isnan(grade), fill, grade)
+    return _SCALE_GRADE * _log_grade(grade)[:, None]
+
+
+def profile_features(catalogue: MatchCatalogue, dimensions: DimensionMatrix | None = None) -> np.ndarray:
+    """Matriz (perfis x features) na ordem do catálogo."""
+    return np.hstack([
+        _level_block(catalogue, dimensions),
+        _SCALE_KPI * _unit_rows(_bits_to_dense(catalogue.kpi_bits, len(catalogue.kpi_vocab))),
+        _SCALE_COMP * _unit_rows(_bits_to_dense(catalogue.comp_bits, len(catalogue.comp_vocab))),
+    ])
+
+
+def _one_hot(selected: List[str], vocab: Dict[str, int]) -> np.ndarray:
+    v = np.zeros(len(vocab))
+    for item in set(selected):
+        b = vocab.get(item)
+        if b is not None:
+            v[b] = 1.0
+    return v
+
+
+def form_features(catalogue: MatchCatalogue, form_inputs: Dict[str, Any],
+                  dimensions: DimensionMatrix | None = None) -> np.ndarray:
+    """Vetor do formulário no mesmo espaço de `profile_features`."""
+    if dimensions is not None:
+        level = _SCALE_DIMS * _user_dimensions(form_inputs)[0]
+    else:
+        level = [_SCALE_GRADE * _log_grade(_user_grade_hint(form_inputs, _encode_map()))]
+    kpi = _one_hot(form_inputs["kpis_selected"], catalogue.kpi_vocab)
+    comp = _one_hot(form_inputs["competencies_selected"], catalogue.comp_vocab)
+    return np.hstack([
+        level,
+        _SCALE_KPI * _unit_rows(kpi[None, :])[0],
+        _SCALE_COMP * _unit_rows(comp[None, :])[0],
+    ])
+
+
+def answers_all_dimensions(form_inputs: Dict[str, Any]) -> bool:
+    """
+    True se o formulário responde às 20 dimensões. Com alguma sem resposta a
+    nota exata ignora essa dimensão, o que um espaço de features fixo não
+    reproduz — o match global então pontua o catálogo inteiro.
+    """
+    return bool(_user_dimensions(form_inputs)[1].all())
+
+
+# ==========================================================
+# ÍNDICE
+# ==========================================================
+@dataclass(frozen=True)
+class NeighborIndex:
+    """
+    NearestNeighbors sobre todos os perfis de um catálogo.
+
+    Busca exaustiva (`algorithm="brute"`): com ~300 features (grade + one-hot
+    de KPIs e competências) uma árvore (BallTree/KDTree) não poda quase nada
+    e visita todos os perfis do mesmo jeito, só que mais devagar. A consulta é
+    linear no nº de perfis — um produto matriz-vetor, ~0,5 ms para 825 perfis.
+    """
+
+    catalogue: MatchCatalogue
+    model: NearestNeighbors
+    dimensions: DimensionMatrix | None = None  # espaço das 20 dimensões (ver ESPAÇO DE FEATURES)
+
+    def query(self, form_inputs: Dict[str, Any], n: int) -> np.ndarray:
+        """Posições (no catálogo) dos `n` perfis mais próximos do formulário."""
+        n = min(n, len(self.catalogue))
+        if n <= 0:
+            return np.empty(0, dtype=np.intp)
+        x = form_features(self.catalogue, form_inputs, self.dimensions)[None, :]
+        return self.model.kneighbors(x, n_neighbors=n, return_distance=False)[0]
+
+
+def build_neighbor_index(catalogue: MatchCatalogue, dimensions: DimensionMatrix | None = None) -> NeighborIndex:
+    model = NearestNeighbors(algorithm="brute")
+    model.fit(profile_features(catalogue, dimensions))
+    return NeighborIndex(catalogue=catalogue, model=model, dimensions=dimensions)
+
+
+_indexes: Dict[str, NeighborIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_neighbor_index(catalogue: MatchCatalogue, version: str,
+                       dimensions: DimensionMatrix | None = None) -> NeighborIndex:
+    """
+    Índice do processo para uma versão do dataset (ex.: DataStore.version).
+    Passe as mesmas `dimensions` usadas em `rank_global_matches`.
+    """
+    def stale(index: NeighborIndex | None) -> bool:
+        return index is None or index.catalogue is not catalogue or index.dimensions is not dimensions
+
+    index = _indexes.get(version)
+    if stale(index):
+        with _indexes_lock:
+            index = _indexes.get(version)
+            if stale(index):
+                index = build_neighbor_index(catalogue, dimensions)
+                _indexes.clear()  # só a versão corrente fica em memória
+                _indexes[version] = index
+    return index
+
+
+# ==========================================================
+# PUBLIC
+# ==========================================================
+def rank_global_matches(form_inputs: Dict[str, Any], df_profiles: pd.DataFrame, k: int = 5,
+                        catalogue: MatchCatalogue | None = None,
+                        index: NeighborIndex | None = None,
+                        dimensions: DimensionMatrix | None = None) -> List[Dict[str, Any]]:
+    """
+    Como `rank_job_matches`, mas sem o filtro de Job Family + Sub Job Family.
+
+    O índice devolve os vizinhos mais próximos do formulário em todo o
+    catálogo; esses candidatos são re-ranqueados pela nota exata do motor.
+    job_family / sub_job_family do formulário são ignorados. O índice tem que
+    ter sido construído com as mesmas `dimensions` da nota, para buscar no
+    espaço que ela usa; se não foi, ou se o formulário deixa alguma dimensão
+    sem resposta, todo o catálogo é pontuado.
+    """
+    _check_columns(df_profiles)
+    if index is None:
+        index = build_neighbor_index(catalogue or build_match_catalogue(df_profiles), dimensions)
+    catalogue = index.catalogue
+
+    exhaustive = index.dimensions is not dimensions or (
+        dimensions is not None and not answers_all_dimensions(form_inputs)
+    )
+    if exhaustive:
+        candidates = np.arange(len(catalogue))
+    else:
+        candidates = index.query(form_inputs, max(MIN_CANDIDATES, CANDIDATES_PER_RESULT * k))
+    if len(candidates) == 0:
+        return []
+    candidates = np.sort(candidates)  # empates: mesma ordem do catálogo
+
+    scores = score_candidates(catalogue, candidates, form_inputs, dimensions)
+    top = _top_indices(scores, k)
+    if len(top) == 0:  # k <= 0
+        return []
+    max_score = float(scores[top[0]])
+    return [
+        {
+            "row": catalogue.row(int(candidates[i])),
+            "score": float(scores[i]),
+            "score_pct": _score_pct(float(scores[i]), max_score),
+        }
+        for i in top
+    ]
@@ -0,0 +1,149 @@
+# match_parallel.py
+# ==========================================================
+# BULK MATCH EM PARALELO — shards de posições num pool de processos
+# ==========================================================
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import fields
+from multiprocessing import shared_memory
+from typing import Any, Dict, Iterator, List
+
+import numpy as np
+import pandas as pd
+
+from match_engine import (
+    BULK_REQUIRED_FIELDS,
+    FORM_DIMENSIONS,
+    DimensionMatrix,
+    MatchCatalogue,
+    build_match_catalogue,
+    bulk_result_frame,
+    bulk_top_k,
+    catalogue_output_columns,
+    read_positions,
+)
+
+# posições por tarefa: grande o bastante para diluir o IPC, pequeno para balancear
+DEFAULT_SHARD_SIZE = 20_000
+
+# arrays do catálogo publicados em memória compartilhada
+_SHARED_ARRAYS = ("row_order", "grade", "grade_missing", "kpi_bits", "kpi_count", "comp_bits", "comp_count")
+
+
+# ==========================================================
+# MEMÓRIA COMPARTILHADA
+# ==========================================================
+def _publish(catalogue: MatchCatalogue,
+             dimensions: DimensionMatrix | None = None) -> tuple[shared_memory.SharedMemory, List[tuple]]:
+    """Copia os arrays do catálogo (e da matriz de dimensões) para um único bloco de memória compartilhada."""
+    arrays = {name: getattr(catalogue, name) for name in _SHARED_ARRAYS}
+    if dimensions is not None:
+        arrays.update(dims_expected=dimensions.expected, dims_missing=dimensions.missing)
+
+    specs, offset = [], 0
+    for name, arr in arrays.items():
+        offset = (offset + 63) // 64 * 64  # alinhamento de 64 bytes
+        specs.append((name, arr.dtype.str, arr.shape, offset))
+        offset += arr.nbytes
+
+    shm = shared_memory.SharedMemory(create=True, size=max(offset, 1))
+    for (name, dtype, shape, off) in specs:
+        dst = np.ndarray(shape, dtype=dtype, buffer=shm.buf, offset=off)
+        dst[...] = arrays[name]
+    return shm, specs
+
+
+# estado de cada worker (preenchido uma vez pelo initializer)
+_worker_shm: shared_memory.SharedMemory | None = None
+_worker_catalogue: MatchCatalogue | None = None
+_worker_dimensions: DimensionMatrix | None = None
+
+
+def _init_worker(shm_name: str, specs: List[tuple], meta: Dict[str, Any]) -> None:
+    global _worker_shm, _worker_catalogue, _worker_dimensions
+    _worker_shm = shared_memory.SharedMemory(name=shm_name)
+    arrays = {
+        name: np.ndarray(shape, dtype=dtype, buffer=_worker_shm.buf, offset=off)
+        for (name, dtype, shape, off) in specs
+    }
+    for arr in arrays.values():
+        arr.flags.writeable = False
+    expected, missing = arrays.pop("dims_expected", None), arrays.pop("dims_missing", None)
+    _worker_catalogue = MatchCatalogue(profiles=None, **arrays, **meta)
+    if expected is not None:
+        _worker_dimensions = DimensionMatrix(_worker_catalogue, expected, expected ** 2, missing)
+
+
+def _score_shard(args: tuple) -> tuple[np.ndarray, np.ndarray]:
+    shard, top_k = args
+    return bulk_top_k(_worker_catalogue, shard, top_k, _worker_dimensions)
+
+
+# ==========================================================
+# API
+# ==========================================================
+def iter_bulk_job_match(positions: pd.DataFrame | str, df_profiles: pd.DataFrame,
+                        catalogue: MatchCatalogue | None = None, top_k: int = 3,
+                        workers: int | None = None,
+                        shard_size: int = DEFAULT_SHARD_SIZE,
+                        dimensions: DimensionMatrix | None = None) -> Iterator[pd.DataFrame]:
+    """
+    `bulk_job_match` em paralelo, devolvendo um DataFrame por shard, em ordem.
+
+    Os arrays do catálogo vão uma única vez para memória compartilhada; cada
+    worker se conecta a ela ao subir, e cada tarefa leva só as colunas usadas
+    das posições do seu shard. `workers=None` usa um processo por CPU; com um
+    worker só (ou um único shard) tudo roda no próprio processo. `dimensions`
+    (matriz do mesmo catálogo) vai junto para a memória compartilhada.
+    """
+    if top_k < 1:
+        raise ValueError(f"top_k must be at least 1, got {top_k}")
+    positions = read_positions(positions)
+    if dimensions is not None:
+        catalogue = dimensions.catalogue
+    if catalogue is None:
+        catalogue = build_match_catalogue(df_profiles)
+
+    columns = catalogue_output_columns(catalogue)
+    workers = workers or os.cpu_count() or 1
+    starts = range(0, max(len(positions), 1), shard_size)  # entrada vazia: um shard vazio
+
+    if workers < 2 or len(starts) < 2:
+        for start in starts:
+            shard = positions.iloc[start:start + shard_size]
+            top_pos, top_score = bulk_top_k(catalogue, shard, top_k, dimensions)
+            yield bulk_result_frame(shard, top_pos, top_score, top_k, columns)
+        return
+
+    shm, specs = _publish(catalogue, dimensions)
+    meta = {
+        f.name: getattr(catalogue, f.name)
+        for f in fields(MatchCatalogue)
+        if f.name not in _SHARED_ARRAYS and f.name != "profiles"
+    }
+    used = [c for c in positions.columns if c in BULK_REQUIRED_FIELDS or c in FORM_DIMENSIONS]
+    try:
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(starts)),
+            initializer=_init_worker,
+            initargs=(shm.name, specs, meta),
+        ) as pool:
+            tasks = ((positions.iloc[s:s + shard_size][used], top_k) for s in starts)
+            # map preserva a ordem: o shard i sai antes do i+1, mesmo que termine depois
+            for start, (top_pos, top_score) in zip(starts, pool.map(_score_shard, tasks)):
+                shard = positions.iloc[start:start + shard_size]
+                yield bulk_result_frame(shard, top_pos, top_score, top_k, columns)
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def parallel_bulk_job_match(positions: pd.DataFrame | str, df_profiles: pd.DataFrame,
+                            catalogue: MatchCatalogue | None = None, top_k: int = 3,
+                            workers: int | None = None,
+                            shard_size: int = DEFAULT_SHARD_SIZE,
+                            dimensions: DimensionMatrix | None = None) -> pd.DataFrame:
+    """Mesmo resultado de `bulk_job_match`, calculado em shards paralelos."""
+    frames = list(iter_bulk_job_match(positions, df_profiles, catalogue, top_k, workers, shard_size,
+                                      dimensions))
+    return pd.concat(frames, ignore_index=True)
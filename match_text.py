@@ -0,0 +1,162 @@
+# match_text.py
+# ==========================================================
+# MATCH POR TEXTO LIVRE — TF-IDF sobre as descrições dos perfis
+# ==========================================================
+import pickle
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+from match_engine import _score_pct, _top_indices
+from utils.data_loader import write_atomic
+
+# colunas concatenadas em um único documento por perfil
+TEXT_COLUMNS = [
+    "Role Description",
+    "Job Profile Description",
+    "Qualifications",
+    "Grade Differentiator",
+]
+
+TEXT_INDEX_DIR = Path(__file__).parent / ".cache" / "tfidf"
+TEXT_INDEX_FORMAT = 1
+
+
+@dataclass(frozen=True)
+class TextIndex:
+    """
+    Matriz TF-IDF (perfis x termos, CSR, linhas L2-normalizadas) + vetorizador.
+
+    A linha i corresponde a `profiles.iloc[i]`. Como as linhas e a consulta são
+    normalizadas, o produto escalar já é a similaridade de cosseno.
+    """
+
+    profiles: pd.DataFrame | None
+    vectorizer: TfidfVectorizer
+    matrix: sparse.csr_matrix
+
+    def scores(self, text: str) -> np.ndarray:
+        """Similaridade (0-1) do texto com cada perfil."""
+        query = self.vectorizer.transform([text])
+        return np.asarray((self.matrix @ query.T).todense()).ravel()
+
+
+def _documents(df_profiles: pd.DataFrame) -> pd.Series:
+    missing = set(TEXT_COLUMNS) - set(df_profiles.columns)
+    if missing:
+        raise ValueError(f"Missing columns in Job Profile dataset: {', '.join(sorted(missing))}")
+    text = df_profiles[TEXT_COLUMNS].fillna("").astype(str)
+    return text.agg("\n".join, axis=1)
+
+
+def build_text_index(df_profiles: pd.DataFrame) -> TextIndex:
+    vectorizer = TfidfVectorizer(
+        strip_accents="unicode",
+        stop_words="english",
+        ngram_range=(1, 2),
+        min_df=1,
+        sublinear_tf=True,
+        dtype=np.float32,
+    )
+    matrix = vectorizer.fit_transform(_documents(df_profiles)).tocsr()
+    return TextIndex(profiles=df_profiles, vectorizer=vectorizer, matrix=matrix)
+
+
+# ==========================================================
+# CACHE EM DISCO (uma entrada por versão do dataset)
+# ==========================================================
+def _index_path(version: str, cache_dir: Path) -> Path:
+    return cache_dir / f"tfidf_{version}.pkl"
+
+
+def _read_index(version: str, cache_dir: Path) -> TextIndex | None:
+    try:
+        with open(_index_path(version, cache_dir), "rb") as f:
+            payload = pickle.load(f)
+        if payload.get("format") != TEXT_INDEX_FORMAT:
+            return None
+        return TextIndex(profiles=None, vectorizer=payload["vectorizer"], matrix=payload["matrix"])
+    except Exception:
+        # cache ausente, corrompido ou de outra versão do sklearn → reconstrói
+        return None
+
+
+def _write_index(index: TextIndex, version: str, cache_dir: Path) -> None:
+    """Grava o índice; falhas de escrita (disco read-only) são ignoradas."""
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        for old in cache_dir.glob("tfidf_*.pkl"):
+            old.unlink(missing_ok=True)  # só a versão corrente fica em disco
+        payload = {"format": TEXT_INDEX_FORMAT, "vectorizer": index.vectorizer, "matrix": index.matrix}
+        write_atomic(_index_path(version, cache_dir), pickle.dumps(payload, protocol=pickle.HIGHEST_PROTOCOL))
+    except OSError:
+        pass
+
+
+_indexes: Dict[str, TextIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_text_index(df_profiles: pd.DataFrame, version: str,
+                   cache_dir: Path | None = TEXT_INDEX_DIR) -> TextIndex:
+    """
+    Índice TF-IDF do processo para uma versão do dataset (ex.: DataStore.version).
+
+    Ordem de busca: memória → disco (`cache_dir`) → fit sobre `df_profiles`.
+    `cache_dir=None` desliga o cache em disco.
+    """
+    index = _indexes.get(version)
+    if index is None:
+        with _indexes_lock:
+            index = _indexes.get(version)
+            if index is None:
+                index = _read_index(version, cache_dir) if cache_dir else None
+                if index is None or index.matrix.shape[0] != len(df_profiles):
+                    index = build_text_index(df_profiles)
+                    if cache_dir:
+                        _write_index(index, version, cache_dir)
+                else:
+                    index = TextIndex(df_profiles, index.vectorizer, index.matrix)
+                _indexes.clear()  # só a versão corrente fica em memória
+                _indexes[version] = index
+    return index
+
+
+# ==========================================================
+# PUBLIC
+# ==========================================================
+def rank_text_matches(text: str, df_profiles: pd.DataFrame, k: int = 5,
+                      index: TextIndex | None = None) -> List[Dict[str, Any]]:
+    """
+    Os `k` perfis cujas descrições mais se parecem com `text` (ex.: um anúncio
+    de vaga colado pelo gestor).
+
+    Mesmo formato de `rank_job_matches`:
+        {"row": Series, "score": float (cosseno 0-1), "score_pct": int (relativo ao 1º)}
+    Lista vazia se o texto não tiver nenhum termo do vocabulário.
+    """
+    if index is None:
+        index = build_text_index(df_profiles)
+    if not text or not text.strip():
+        return []
+
+    scores = index.scores(text)
+    top = _top_indices(scores, k)
+    if len(top) == 0 or scores[top[0]] <= 0:
+        return []
+    top = top[scores[top] > 0]
+    max_score = float(scores[top[0]])
+    return [
+        {
+            "row": df_profiles.iloc[int(i)],
+            "score": float(scores[i]),
+            "score_pct": _score_pct(float(scores[i]), max_score),
+        }
+        for i in top
+    ]
@@ -1,6 +1,6 @@
 import streamlit as st
-import base64
-import os
+
+from utils.assets import get_asset_registry
 
 # ==========================================================
 # CONFIG
@@ -10,11 +10,7 @@ st.set_page_config(page_title="Job Architecture", layout="wide")
 # ==========================================================
 # LOAD ICON
 # ==========================================================
-def load_icon_png(path):
-    with open(path, "rb") as f:
-        return base64.b64encode(f.read()).decode("utf-8")
-
-icon_b64 = load_icon_png("assets/icons/governance.png")
+icon_b64 = get_asset_registry().b64("assets/icons/governance.png", page="Job Architecture")
 
 # ==========================================================
 # HEADER — EXACTLY SAME VISUAL STANDARD
@@ -1,27 +1,16 @@
 import streamlit as st
-import base64
-import os
-import pandas as pd
+from utils.assets import get_asset_registry
+from utils.data_store import get_data_store
 
 # ==========================================================
 # CONFIG
 # ==========================================================
 st.set_page_config(page_title="Job Families", layout="wide")
 
-# ==========================================================
-# FUNÇÃO PNG
-# ==========================================================
-def load_icon_png(path):
-    if not os.path.exists(path):
-        return ""
-    with open(path, "rb") as f:
-        return base64.b64encode(f.read()).decode("utf-8")
-
 # ==========================================================
 # HEADER SIG
 # ==========================================================
-icon_path = "assets/icons/people_employees.png"
-icon_b64 = load_icon_png(icon_path)
+icon_b64 = get_asset_registry().b64("assets/icons/people_employees.png", page="Job Families")
 
 st.markdown(f"""
 <div style="display:flex; align-items:center; gap:18px; margin-top:12px;">
@@ -67,14 +56,13 @@ st.markdown("""
 # ==========================================================
 # CARREGAR ARQUIVO
 # ==========================================================
-file_path = "data/Job Family.xlsx"
+store = get_data_store()
 
-if not os.path.exists(file_path):
+if "job_family" not in store:
     st.error("Arquivo **'Job Family.xlsx'** não encontrado na pasta `data/`.")
     st.stop()
 
-df = pd.read_excel(file_path)
-df.columns = [str(c).strip() for c in df.columns]
+df = store.job_family
 
 # remove a primeira coluna (sequencial)
 df = df.iloc[:, 1:]
@@ -4,9 +4,9 @@
 # + botões abaixo da coluna GG sem mexer no mapa
 
 import streamlit as st
-import pandas as pd
 import streamlit.components.v1 as components
-from utils.data_loader import load_excel_data
+from utils.assets import get_asset_registry
+from utils.data_store import get_data_store
 
 # ==========================================================
 # CONFIG
@@ -16,13 +16,7 @@ st.set_page_config(page_title="Job Maps", layout="wide")
 # ==========================================================
 # HEADER CLEAN
 # ==========================================================
-import base64
-
-def load_icon_png(path):
-    with open(path, "rb") as f:
-        return base64.b64encode(f.read()).decode("utf-8")
-
-icon_b64 = load_icon_png("assets/icons/globe_trade.png")
+icon_b64 = get_asset_registry().b64("assets/icons/globe_trade.png", page="Job Maps")
 
 st.markdown(f"""
 <div style="display:flex; align-items:center; gap:18px; margin-top:12px;">
@@ -195,10 +189,7 @@ st.markdown(css, unsafe_allow_html=True)
 # ==========================================================
 # CARREGAR DADOS
 # ==========================================================
-data = load_excel_data()
-df = data.get("job_profile", pd.DataFrame())
-
-df = df.copy()
+df = get_data_store().job_profile
 df["Job Family"] = df["Job Family"].astype(str).str.strip()
 df["Sub Job Family"] = df["Sub Job Family"].astype(str).str.strip().replace(
     ['nan','None','<NA>',''], '-'
@@ -2,16 +2,23 @@
 # ==========================================================
 # JOB MATCH — ARQUITETURA PRO (UI + VALIDAÇÃO + CHAMADAS)
 # ==========================================================
-import os
-import base64
 import html
+from concurrent.futures import TimeoutError as FutureTimeoutError
 
 import pandas as pd
 import streamlit as st
 import streamlit.components.v1 as components
 
-from match_engine import compute_job_match
+from match_coalescer import get_match_coalescer
+from match_engine import get_dimension_matrix, get_match_catalogue, rank_job_matches
+from match_global import get_neighbor_index, rank_global_matches
+from match_text import get_text_index, rank_text_matches
+from prerender import start_prerender
 from html_renderer import render_job_description
+from utils.assets import get_asset_registry
+from utils.data_store import get_data_store
+from utils.instrumentation import get_ring_buffer
+from utils.match_cache import get_match_cache
 
 
 # ----------------------------------------------------------
@@ -98,14 +105,7 @@ div.stButton > button:hover {
 # ----------------------------------------------------------
 # HEADER ICON
 # ----------------------------------------------------------
-def load_icon_png(path: str) -> str:
-    if not os.path.exists(path):
-        return ""
-    with open(path, "rb") as f:
-        return base64.b64encode(f.read()).decode("utf-8")
-
-
-page_icon_b64 = load_icon_png("assets/icons/checkmark_success.png")
+page_icon_b64 = get_asset_registry().b64("assets/icons/checkmark_success.png", page="Job Match")
 
 st.markdown(
     f"""
@@ -124,13 +124,25 @@ st.markdown(
 # ----------------------------------------------------------
 # LOAD JOB PROFILE DATA (colunas ORIGINAIS)
 # ----------------------------------------------------------
-@st.cache_data
-def load_job_profiles() -> pd.DataFrame:
-    df = pd.read_excel("data/Job Profile.xlsx").fillna("")
-    return df
+store = get_data_store()
+df_profiles = store.job_profile_filled
+match_catalogue = get_match_catalogue(df_profiles, store.version)
+# perfil esperado de cada Job Profile nas 20 dimensões do formulário
+match_dimensions = get_dimension_matrix(
+    match_catalogue, store.version, store.level_structure, store.career_bands_levels
+)
+# corpo das descrições, aquecido no cache do html_renderer desde o boot
+prerender = start_prerender(store)
+
 
+def describe(match: dict) -> str:
+    """HTML da descrição do perfil casado (corpo do cache, se já aquecido)."""
+    return render_job_description(match["row"], match["score_pct"], store.version)
 
-df_profiles = load_job_profiles()
+# quantos perfis além do melhor são listados abaixo da descrição
+RUNNERS_UP = 3
+# espera máxima pelo lote do coalescer antes de pontuar direto nesta sessão
+MATCH_TIMEOUT_S = 10.0
 
 
 # ----------------------------------------------------------
@@ -205,7 +217,7 @@ st.markdown(
 
 col_jf1, col_jf2 = st.columns(2)
 
-job_families = sorted(df_profiles["Job Family"].dropna().unique().tolist())
+job_families = match_catalogue.families()
 
 with col_jf1:
     job_family = select_with_error(
@@ -218,19 +230,20 @@ with col_jf2:
     if job_family == "Choose option":
         sub_options = []
     else:
-        sub_options = (
-            df_profiles[df_profiles["Job Family"] == job_family]["Sub Job Family"]
-            .dropna()
-            .unique()
-            .tolist()
-        )
+        sub_options = match_catalogue.sub_families(job_family)
 
     sub_job_family = select_with_error(
         "Sub Job Family",
-        ["Choose option"] + sorted(sub_options),
+        ["Choose option"] + sub_options,
         key="sub_job_family",
     )
 
+# modo global: busca o perfil mais próximo em todas as famílias
+search_all = st.checkbox(
+    "Search across all Job Families (ignore the family filter)",
+    key="search_all_families",
+)
+
 # ------------- Strategic Impact & Scope -------------
 st.markdown(
     '<div class="section-title-form">Strategic Impact & Scope</div>'
@@ -586,6 +599,8 @@ if generate:
         "leadership_type",
         "org_influence",
     ]
+    if search_all:
+        select_keys = select_keys[2:]  # família / sub-família viram opcionais
     for k in select_keys:
         if form_values[k] == "Choose option" or form_values[k] == "":
             missing_keys.add(k)
@@ -605,16 +620,161 @@ if generate:
     # se passou, limpa flags
     st.session_state.missing_fields = set()
 
-    # chama motor de match
-    best = compute_job_match(form_values, df_profiles)
+    # chama motor de match (melhor perfil + próximos colocados) — ou reaproveita
+    # o resultado de um formulário idêntico já submetido nesta versão dos dados
+    def run_match():
+        if search_all:
+            ranked = rank_global_matches(
+                form_values, df_profiles, k=RUNNERS_UP + 1,
+                index=get_neighbor_index(match_catalogue, store.version, match_dimensions),
+                dimensions=match_dimensions,
+            )
+        else:
+            # sessões simultâneas caem no mesmo lote de scoring (match_coalescer)
+            try:
+                ranked = get_match_coalescer(match_catalogue, store.version, match_dimensions).rank(
+                    form_values, k=RUNNERS_UP + 1, timeout=MATCH_TIMEOUT_S
+                )
+            except (FutureTimeoutError, RuntimeError):
+                # fila atrasada ou coalescer trocado por outra versão dos dados
+                ranked = rank_job_matches(
+                    form_values, df_profiles, k=RUNNERS_UP + 1,
+                    catalogue=match_catalogue, dimensions=match_dimensions,
+                )
+        html_desc = describe(ranked[0]) if ranked else ""
+        return ranked, html_desc
+
+    ranked, html_desc = get_match_cache().get_or_compute(
+        dict(form_values, search_all=search_all), store.version, run_match, k=RUNNERS_UP + 1
+    )
 
-    if not best:
+    if not ranked:
         st.error("No Job Profiles match the selected Job Family + Sub Job Family.")
     else:
-        row = best["row"]
-        score_pct = best["score_pct"]
-
-        html_desc = render_job_description(row, score_pct)
-
         # descrição única, sem scroll interno, fundo branco (controlado no HTML)
         components.html(html_desc, height=1000, scrolling=False)
+
+        if len(ranked) > 1:
+            st.markdown(
+                '<div class="section-title-form">Other close matches</div>'
+                '<div class="section-divider"></div>',
+                unsafe_allow_html=True,
+            )
+            st.dataframe(
+                pd.DataFrame([
+                    {
+                        "Job Profile": r["row"].get("Job Profile", ""),
+                        "Sub Job Family": r["row"].get("Sub Job Family", ""),
+                        "Global Grade": r["row"].get("Global Grade", ""),
+                        "Full Job Code": r["row"].get("Full Job Code", ""),
+                        "Match (vs. best)": f'{r["score_pct"]}%',
+                        "Score": round(r["score"], 3),
+                    }
+                    for r in ranked[1:]
+                ]),
+                hide_index=True,
+                use_container_width=True,
+            )
+
+
+# ==========================================================
+# MATCH POR TEXTO LIVRE — ANÚNCIO DE VAGA EXISTENTE
+# ==========================================================
+st.markdown(
+    '<div class="section-title-form">Match from an existing job description</div>'
+    '<div class="section-divider"></div>',
+    unsafe_allow_html=True,
+)
+
+job_ad_text = st.text_area(
+    "Paste a job ad or job description",
+    key="job_ad_text",
+    height=180,
+)
+
+text_col, _, _ = st.columns([1, 5, 1])
+with text_col:
+    generate_text = st.button("Find Closest Job Profiles", key="generate_text_match")
+
+if generate_text:
+    text_ranked = rank_text_matches(
+        job_ad_text, df_profiles, k=RUNNERS_UP + 1,
+        index=get_text_index(df_profiles, store.version),
+    )
+    if not text_ranked:
+        st.error("The text has no terms in common with the Job Profile descriptions.")
+    else:
+        best = text_ranked[0]
+        components.html(
+            describe(best),
+            height=1000,
+            scrolling=False,
+        )
+        st.dataframe(
+            pd.DataFrame([
+                {
+                    "Job Profile": r["row"].get("Job Profile", ""),
+                    "Sub Job Family": r["row"].get("Sub Job Family", ""),
+                    "Global Grade": r["row"].get("Global Grade", ""),
+                    "Full Job Code": r["row"].get("Full Job Code", ""),
+                    "Match (vs. best)": f'{r["score_pct"]}%',
+                    "Similarity": round(r["score"], 3),
+                }
+                for r in text_ranked
+            ]),
+            hide_index=True,
+            use_container_width=True,
+        )
+
+
+# ==========================================================
+# ADMIN — TEMPOS POR ETAPA DO MOTOR (MATCH_TIMING=ring)
+# ==========================================================
+timing_buffer = get_ring_buffer()
+if timing_buffer is not None:
+    with st.expander("Match engine timings (admin)"):
+        p = prerender.progress()
+        st.caption(
+            f"Pre-rendered descriptions: {p['done']}/{p['total']} ({p['failed']} failed) "
+            f"in {p['elapsed_s']:.3f}s{'' if p['finished'] else ' — building…'}"
+        )
+        records = timing_buffer.records()
+        if not records:
+            st.caption("No match calls recorded yet.")
+        else:
+            st.dataframe(
+                pd.DataFrame([
+                    {
+                        "Call": r["call"],
+                        "Total (ms)": round(r["total_ms"], 3),
+                        **{
+                            f'{s["stage"]} (ms)': round(s["ms"], 3)
+                            for s in r["stages"]
+                        },
+                        "Candidates": next(
+                            (s["rows"] for s in r["stages"] if s["stage"] == "filter"), None
+                        ),
+                    }
+                    for r in reversed(records)
+                ]),
+                hide_index=True,
+                use_container_width=True,
+            )
+
+        # bytes de ícones/fontes que cada página já aberta neste processo embute no HTML
+        asset_report = get_asset_registry().page_report()
+        if asset_report:
+            st.caption("Embedded assets per page")
+            st.dataframe(
+                pd.DataFrame([
+                    {
+                        "Page": page,
+                        "Assets": r["assets"],
+                        "KB per render": round(r["bytes_per_render"] / 1024, 1),
+                        "KB served": round(r["bytes_served"] / 1024, 1),
+                    }
+                    for page, r in asset_report.items()
+                ]),
+                hide_index=True,
+                use_container_width=True,
+            )
@@ -1,8 +1,8 @@
 # pages/6_Structure_Level.py
 
 import streamlit as st
-import pandas as pd
-from utils.data_loader import load_excel_data
+from utils.assets import get_asset_registry
+from utils.data_store import get_data_store
 
 # ==========================================================
 # CONFIGURAÇÃO DA PÁGINA
@@ -13,13 +13,7 @@ st.set_page_config(page_title="Structure Level", layout="wide")
 # ==========================================================
 # HEADER PADRÃO DO APP NOVO
 # ==========================================================
-import base64
-
-def load_icon_png(path):
-    with open(path, "rb") as f:
-        return base64.b64encode(f.read()).decode("utf-8")
-
-icon_b64 = load_icon_png("assets/icons/process.png")
+icon_b64 = get_asset_registry().b64("assets/icons/process.png", page="Structure Level")
 
 st.markdown(f"""
 <div style="display:flex; align-items:center; gap:18px; margin-top:12px;">
@@ -152,8 +146,7 @@ The **Structure Level** unifies all these paths into a single, coherent organiza
 # ==========================================================
 # CARREGAMENTO DO ARQUIVO (MANTIDO DO JEITO CERTO)
 # ==========================================================
-data = load_excel_data()
-df = data.get("level_structure", pd.DataFrame())
+df = get_data_store().level_structure
 
 if df.empty:
     st.error(
@@ -1,7 +1,8 @@
 import streamlit as st
-import pandas as pd
 import altair as alt
-import os, base64
+
+from utils.assets import get_asset_registry
+from utils.data_store import get_data_store
 
 # ==========================================================
 # PAGE CONFIG
@@ -10,35 +11,14 @@ st.set_page_config(page_title="Dashboard", layout="wide")
 
 
 # ==========================================================
-# SAFE FONT LOADER (SIG FLOW)
+# SAFE FONT LOADER (SIG FLOW) — lidas/codificadas uma vez por processo
 # ==========================================================
-def load_font_base64(path):
-    if not os.path.exists(path):
-        return None
-    with open(path, "rb") as f:
-        return base64.b64encode(f.read()).decode("utf-8")
-
-
-font_regular = load_font_base64("assets/fonts/PP-SIG-Flow-Regular.ttf")
-font_semibold = load_font_base64("assets/fonts/PP-SIG-Flow-Semibold.ttf")
+assets = get_asset_registry()
 
-css_fonts = ""
-
-if font_regular:
-    css_fonts += f"""
-    @font-face {{
-        font-family: 'SIGFlow';
-        src: url(data:font/ttf;base64,{font_regular}) format('truetype');
-        font-weight: 400;
-    }}"""
-
-if font_semibold:
-    css_fonts += f"""
-    @font-face {{
-        font-family: 'SIGFlow';
-        src: url(data:font/ttf;base64,{font_semibold}) format('truetype');
-        font-weight: 600;
-    }}"""
+css_fonts = (
+    assets.font_face("SIGFlow", "assets/fonts/PP-SIG-Flow-Regular.ttf", 400, page="Dashboard") +
+    assets.font_face("SIGFlow", "assets/fonts/PP-SIG-Flow-Semibold.ttf", 600, page="Dashboard")
+)
 
 
 # ==========================================================
@@ -109,13 +89,7 @@ section.main > div {
 # ==========================================================
 # HEADER SIG
 # ==========================================================
-def load_icon_png(path):
-    if not os.path.exists(path):
-        return ""
-    with open(path, "rb") as f:
-        return base64.b64encode(f.read()).decode("utf-8")
-
-icon_b64 = load_icon_png("assets/icons/data_2_perfromance.png")
+icon_b64 = assets.b64("assets/icons/data_2_perfromance.png", page="Dashboard")
 
 st.markdown(f"""
 <div style="display:flex; align-items:center; gap:18px; margin-top:12px;">
@@ -131,7 +105,7 @@ st.markdown(f"""
 # ==========================================================
 # LOAD DATA
 # ==========================================================
-df = pd.read_excel("data/Job Profile.xlsx")
+df = get_data_store().job_profile
 
 COL_FAMILY = "Job Family"
 COL_SUBFAMILY = "Sub Job Family"
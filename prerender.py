@@ -0,0 +1,122 @@
+# prerender.py
+# ==========================================================
+# PRÉ-RENDER DAS DESCRIÇÕES — em segundo plano, desde o boot do app
+#
+# Aquece o cache por perfil do html_renderer (Full Job Code + versão do
+# dataset) com o corpo de todas as descrições, para que o primeiro match de
+# cada perfil na página Job Match já só insira o score. Sem armazenamento
+# próprio: montar os 825 perfis leva ~30 ms, menos do que ler de volta um
+# arquivo por perfil.
+# ==========================================================
+import logging
+import threading
+import time
+from typing import Any, Dict, List
+
+import pandas as pd
+
+from html_renderer import RENDER_CACHE_SIZE, warm_render_cache
+from utils.instrumentation import start_trace
+
+logger = logging.getLogger("prerender")
+
+
+class DescriptionPrerender:
+    """
+    Aquece, numa thread de fundo (`start()`), o cache de descrições do
+    html_renderer para uma versão do dataset.
+
+    Até `RENDER_CACHE_SIZE` perfis: além disso o LRU descartaria os
+    primeiros antes de serem usados. Perfis ainda não aquecidos são
+    renderizados na hora, como antes. `progress()` expõe o andamento e o
+    tempo de build.
+    """
+
+    def __init__(self, df_profiles: pd.DataFrame, version: str):
+        self.version = version
+        self._rows: List[Dict[str, Any]] = df_profiles.head(RENDER_CACHE_SIZE).to_dict("records")
+        self._done = threading.Event()
+        self.rendered = 0
+        self.failed = 0
+        self.started_at: float | None = None
+        self.finished_at: float | None = None
+
+    # ------------------------------------------------------
+    # API
+    # ------------------------------------------------------
+    def start(self) -> "DescriptionPrerender":
+        if self.started_at is None:
+            self.started_at = time.perf_counter()
+            threading.Thread(target=self._run, name="prerender", daemon=True).start()
+        return self
+
+    def wait(self, timeout: float | None = None) -> bool:
+        return self._done.wait(timeout)
+
+    def progress(self) -> Dict[str, Any]:
+        end = self.finished_at or time.perf_counter()
+        return {
+            "version": self.version,
+            "total": len(self._rows),
+            "done": self.rendered + self.failed,
+            "rendered": self.rendered,
+            "failed": self.failed,
+            "finished": self._done.is_set(),
+            "elapsed_s": end - self.started_at if self.started_at else 0.0,
+        }
+
+    # ------------------------------------------------------
+    # BUILD
+    # ------------------------------------------------------
+    def _run(self) -> None:
+        trace = start_trace("prerender", version=self.version)
+        try:
+            for row in self._rows:
+                try:
+                    warm_render_cache(row, self.version)
+                except Exception:
+                    logger.debug("prerender failed for %r", row.get("Full Job Code"), exc_info=True)
+                    self.failed += 1
+                    continue
+                self.rendered += 1
+        finally:
+            self.finished_at = time.perf_counter()
+            self._done.set()
+            p = self.progress()
+            if trace:
+                trace.mark("build", rows=p["done"])
+                trace.finish()
+            logger.info(
+                "prerender %s: %d profiles in %.3fs (%d failed)",
+                self.version, p["total"], p["elapsed_s"], p["failed"],
+            )
+
+
+# ==========================================================
+# INSTÂNCIA DO PROCESSO (uma por versão do dataset)
+# ==========================================================
+_builder: DescriptionPrerender | None = None
+_builder_lock = threading.Lock()
+
+
+def start_prerender(store=None) -> DescriptionPrerender:
+    """
+    Inicia (uma vez por versão do dataset) o aquecimento do cache de
+    descrições.
+
+    Chamado no boot (app.py) e pela página Job Match, caso o usuário abra
+    direto nela; chamadas seguintes só devolvem o builder.
+    """
+    global _builder
+    if store is None:
+        from utils.data_store import get_data_store
+
+        store = get_data_store()
+    builder = _builder
+    if builder is not None and builder.version == store.version:
+        return builder
+    with _builder_lock:
+        if _builder is None or _builder.version != store.version:
+            _builder = DescriptionPrerender(store.job_profile, store.version).start()
+        return _builder
+
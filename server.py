@@ -0,0 +1,298 @@
+# server.py
+# ==========================================================
+# SERVIDOR LOCAL DE MATCH — HTTP/JSON sobre asyncio (só stdlib + match_core)
+#
+#   python server.py [--host 127.0.0.1] [--port 8765] [--workers 4]
+#                    [--executor thread|process] [--scoring dimensions|grade]
+#                    [--coalesce [--window-ms 0]]
+#
+#   GET  /health                         → {"status": "ok", "profiles": N}
+#   POST /match        {"form": {...}}   → {"result": {...} | null}
+#   POST /match/top    {"form": {...}, "k": 5}      → {"results": [...]}
+#   POST /match/batch  {"forms": [...], "k": 1}     → {"results": [[...], ...]}
+#
+# "form" tem as mesmas chaves do formulário do Job Match (ver
+# match_engine.compute_job_match). Conexões HTTP/1.1 ficam abertas
+# (keep-alive) até o cliente mandar "Connection: close". O scoring roda
+# num executor; o event loop só faz I/O. Com --coalesce, os formulários de
+# todas as conexões entram num MatchCoalescer e são pontuados em lotes.
+# O corpo precisa de Content-Length: chunked → 501, tamanho inválido → 400.
+# Linha de requisição ou cabeçalho acima de 64 KiB → 431.
+# ==========================================================
+import argparse
+import asyncio
+import json
+import signal
+import sys
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from http import HTTPStatus
+from typing import Any, Dict, List, Tuple
+
+from match_coalescer import DEFAULT_WINDOW_MS, MatchCoalescer
+from match_core import (
+    DimensionMatrix,
+    MatchCatalogue,
+    load_bundle,
+    profile_record,
+    rank_catalogue,
+)
+
+MAX_BODY_BYTES = 8 * 1024 * 1024
+MAX_BATCH = 10_000
+
+
+class BadRequest(ValueError):
+    """Erro do cliente: vira uma resposta 400 com a mensagem."""
+
+
+# ==========================================================
+# CATÁLOGO + SCORING (roda no executor)
+# ==========================================================
+_catalogue: MatchCatalogue | None = None
+_dimensions: DimensionMatrix | None = None
+
+
+def load_catalogue(scoring: str = "dimensions") -> Tuple[MatchCatalogue, DimensionMatrix | None]:
+    """Bundle pré-compilado se estiver válido; senão lê os workbooks e o regrava."""
+    loaded = load_bundle()
+    if loaded is None or loaded[1] is None:
+        from match_engine import build_dimension_matrix, build_match_catalogue, compile_match_bundle
+        from utils.data_store import build_data_store
+
+        store = build_data_store()
+        catalogue = build_match_catalogue(store.job_profile_filled)
+        dimensions = build_dimension_matrix(catalogue, store.level_structure, store.career_bands_levels)
+        try:
+            compile_match_bundle(catalogue, dimensions)
+        except OSError:
+            pass  # disco read-only: serve a partir da memória mesmo assim
+        loaded = load_bundle(data_dir=None) or (catalogue, dimensions)
+
+    catalogue, dimensions = loaded
+    return catalogue, (dimensions if scoring == "dimensions" else None)
+
+
+def _init_worker(scoring: str) -> None:
+    global _catalogue, _dimensions
+    _catalogue, _dimensions = load_catalogue(scoring)
+
+
+def _ranked_json(ranked: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    return [
+        {**profile_record(r["row"]), "score": r["score"], "score_pct": r["score_pct"]}
+        for r in ranked
+    ]
+
+
+def score_forms(forms: List[Dict[str, Any]], k: int) -> List[List[Dict[str, Any]]]:
+    """Top-k de cada formulário (um item por formulário, lista vazia se não houver perfis)."""
+    return [_ranked_json(rank_catalogue(_catalogue, form, k=k, dimensions=_dimensions)) for form in forms]
+
+
+# ==========================================================
+# VALIDAÇÃO
+# ==========================================================
+REQUIRED_FORM_FIELDS = (
+    "job_family", "sub_job_family",
+    "leadership_type", "org_influence", "org_impact", "span_control", "geo_scope",
+)
+
+
+def _form(value: Any) -> Dict[str, Any]:
+    if not isinstance(value, dict):
+        raise BadRequest("'form' must be a JSON object")
+    missing = [f for f in REQUIRED_FORM_FIELDS if f not in value]
+    if missing:
+        raise BadRequest(f"missing form fields: {', '.join(missing)}")
+    wrong = [f for f in REQUIRED_FORM_FIELDS if not isinstance(value[f], str)]
+    if wrong:
+        raise BadRequest(f"form fields must be strings: {', '.join(wrong)}")
+    form = dict(value)
+    for key in ("kpis_selected", "competencies_selected"):
+        selected = form.get(key, [])
+        if isinstance(selected, str):
+            selected = [s.strip() for s in selected.split(",") if s.strip()]
+        if not isinstance(selected, list) or not all(isinstance(s, str) for s in selected):
+            raise BadRequest(f"'{key}' must be a list of strings or a comma-separated string")
+        form[key] = selected
+    return form
+
+
+def _k(payload: Dict[str, Any], default: int) -> int:
+    k = payload.get("k", default)
+    if not isinstance(k, int) or isinstance(k, bool) or not 1 <= k <= 100:
+        raise BadRequest("'k' must be an integer between 1 and 100")
+    return k
+
+
+# ==========================================================
+# HTTP
+# ==========================================================
+class MatchServer:
+    def __init__(self, executor: Executor, profiles: int, coalescer: MatchCoalescer | None = None):
+        self.executor = executor
+        self.profiles = profiles
+        self.coalescer = coalescer
+
+    async def _score(self, forms: List[Dict[str, Any]], k: int) -> List[List[Dict[str, Any]]]:
+        if self.coalescer is not None:
+            futures = [asyncio.wrap_future(self.coalescer.submit(form, k)) for form in forms]
+            return [_ranked_json(ranked) for ranked in await asyncio.gather(*futures)]
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, score_forms, forms, k)
+
+    async def route(self, method: str, path: str, payload: Any) -> Tuple[int, Dict[str, Any]]:
+        path = path.split("?", 1)[0].rstrip("/") or "/"
+        if method == "GET" and path == "/health":
+            return HTTPStatus.OK, {"status": "ok", "profiles": self.profiles}
+        if method != "POST" or path not in ("/match", "/match/top", "/match/batch"):
+            return HTTPStatus.NOT_FOUND, {"error": f"no route for {method} {path}"}
+        if not isinstance(payload, dict):
+            raise BadRequest("request body must be a JSON object")
+
+        if path == "/match":
+            (ranked,) = await self._score([_form(payload.get("form"))], 1)
+            return HTTPStatus.OK, {"result": ranked[0] if ranked else None}
+        if path == "/match/top":
+            (ranked,) = await self._score([_form(payload.get("form"))], _k(payload, 5))
+            return HTTPStatus.OK, {"results": ranked}
+
+        forms = payload.get("forms")
+        if not isinstance(forms, list) or not forms:
+            raise BadRequest("'forms' must be a non-empty list")
+        if len(forms) > MAX_BATCH:
+            raise BadRequest(f"at most {MAX_BATCH} forms per batch")
+        results = await self._score([_form(f) for f in forms], _k(payload, 1))
+        return HTTPStatus.OK, {"results": results}
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                try:
+                    method, target, version = request_line.decode("latin-1").split()
+                except ValueError:
+                    await self._send(writer, HTTPStatus.BAD_REQUEST, {"error": "malformed request line"}, False)
+                    break
+
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                connection = headers.get("connection", "").lower()
+                keep_alive = connection != "close" if version == "HTTP/1.1" else connection == "keep-alive"
+
+                # sem um tamanho confiável não há como achar o fim do corpo: responde e fecha
+                encoding = headers.get("transfer-encoding", "").lower()
+                if encoding and encoding != "identity":
+                    await self._send(writer, HTTPStatus.NOT_IMPLEMENTED,
+                                     {"error": f"Transfer-Encoding {encoding!r} not supported; send Content-Length"},
+                                     False)
+                    break
+                raw_length = headers.get("content-length", "") or "0"
+                if not (raw_length.isascii() and raw_length.isdigit()):
+                    await self._send(writer, HTTPStatus.BAD_REQUEST, {"error": "invalid Content-Length"}, False)
+                    break
+                length = int(raw_length)
+                if length > MAX_BODY_BYTES:
+                    await self._send(writer, HTTPStatus.REQUEST_ENTITY_TOO_LARGE, {"error": "body too large"}, False)
+                    break
+                body = await reader.readexactly(length) if length else b""
+
+                try:
+                    payload = json.loads(body) if body else None
+                    status, response = await self.route(method, target, payload)
+                except (BadRequest, json.JSONDecodeError, UnicodeDecodeError) as exc:
+                    status, response = HTTPStatus.BAD_REQUEST, {"error": str(exc)}
+                except Exception as exc:  # erro no scoring: 500, conexão segue viva
+                    status, response = HTTPStatus.INTERNAL_SERVER_ERROR, {"error": repr(exc)}
+
+                await self._send(writer, status, response, keep_alive)
+                if not keep_alive:
+                    break
+        except ValueError:
+            # linha de requisição ou de cabeçalho além do limite do StreamReader (64 KiB)
+            try:
+                await self._send(writer, HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE,
+                                 {"error": "request line or header too long"}, False)
+            except ConnectionError:
+                pass
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    @staticmethod
+    async def _send(writer: asyncio.StreamWriter, status: int, payload: Dict[str, Any],
+                    keep_alive: bool) -> None:
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        head = (
+            f"HTTP/1.1 {int(status)} {HTTPStatus(status).phrase}\r\n"
+            "Content-Type: application/json; charset=utf-8\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+        ).encode("latin-1")
+        writer.write(head + body)
+        await writer.drain()
+
+
+def make_executor(kind: str, workers: int, scoring: str) -> Executor:
+    """Executor com o catálogo carregado em cada worker (uma vez)."""
+    if kind == "process":
+        return ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(scoring,))
+    _init_worker(scoring)  # threads compartilham o catálogo do processo
+    return ThreadPoolExecutor(max_workers=workers, thread_name_prefix="match")
+
+
+async def serve(host: str, port: int, executor: Executor, profiles: int,
+                coalescer: MatchCoalescer | None = None) -> None:
+    app = MatchServer(executor, profiles, coalescer)
+    server = await asyncio.start_server(app.handle, host, port)
+    bound = server.sockets[0].getsockname()
+    print(f"listening on http://{bound[0]}:{bound[1]}", flush=True)
+
+    # SIGTERM encerra como o Ctrl+C: fecha o socket e depois o executor
+    stop = asyncio.Event()
+    try:
+        asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, stop.set)
+    except (NotImplementedError, RuntimeError):
+        pass  # Windows: só Ctrl+C
+    async with server:
+        await stop.wait()
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Local Job Match HTTP server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765, help="0 picks a free port")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--executor", choices=["thread", "process"], default="thread")
+    parser.add_argument("--scoring", choices=["dimensions", "grade"], default="dimensions")
+    parser.add_argument("--coalesce", action="store_true",
+                        help="score concurrent requests in micro-batches (match_coalescer)")
+    parser.add_argument("--window-ms", type=float, default=DEFAULT_WINDOW_MS,
+                        help="with --coalesce: extra wait for requests to join a batch")
+    args = parser.parse_args(argv)
+
+    catalogue, dimensions = load_catalogue(args.scoring)  # garante o bundle antes dos workers
+    executor = make_executor(args.executor, args.workers, args.scoring)
+    coalescer = MatchCoalescer(catalogue, dimensions, window_ms=args.window_ms) if args.coalesce else None
+    try:
+        asyncio.run(serve(args.host, args.port, executor, len(catalogue), coalescer))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if coalescer is not None:
+            coalescer.close()
+        executor.shutdown(cancel_futures=True)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
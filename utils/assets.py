@@ -0,0 +1,161 @@
+# utils/assets.py
+# -*- coding: utf-8 -*-
+
+import base64
+import hashlib
+import mimetypes
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Optional
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+
+# tipos que o mimetypes do sistema nem sempre conhece
+_MIME_TYPES = {
+    ".png": "image/png",
+    ".svg": "image/svg+xml",
+    ".otf": "font/otf",
+    ".ttf": "font/ttf",
+    ".woff": "font/woff",
+    ".woff2": "font/woff2",
+}
+_FONT_FORMATS = {".otf": "opentype", ".ttf": "truetype", ".woff": "woff", ".woff2": "woff2"}
+
+
+@dataclass(frozen=True)
+class Asset:
+    """Arquivo de assets/ lido uma vez: bytes, hash do conteúdo e base64."""
+
+    path: str      # relativo à raiz do repositório, como nas páginas
+    mime: str
+    data: bytes
+    digest: str    # sha256 do conteúdo (hex)
+    b64: str
+
+    @property
+    def data_uri(self) -> str:
+        return f"data:{self.mime};base64,{self.b64}"
+
+    @property
+    def text(self) -> str:
+        return self.data.decode("utf-8")
+
+
+# ==========================================================
+# REGISTRO DO PROCESSO
+# ==========================================================
+class AssetRegistry:
+    """
+    Ícones, SVGs e fontes servidos da memória.
+
+    Cada arquivo é lido, codificado em base64 e tem o hash calculado uma vez
+    por processo (não a cada rerun do Streamlit); arquivos com o mesmo
+    conteúdo dividem o mesmo base64. Com `page=...`, conta os bytes que a
+    página embute no HTML: `page_report()` dá os bytes de um render e o
+    total servido desde que o processo subiu.
+    """
+
+    def __init__(self, root: Path = ROOT_DIR):
+        self.root = Path(root)
+        self._assets: Dict[str, Optional[Asset]] = {}
+        self._b64_by_digest: Dict[str, str] = {}
+        self._pages: Dict[str, Dict[str, int]] = {}
+        self._served: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def get(self, path: str, page: Optional[str] = None) -> Optional[Asset]:
+        """Asset em `path` (relativo à raiz do repo) ou None se o arquivo não existir."""
+        try:
+            asset = self._assets[path]
+        except KeyError:
+            asset = self._load(path)
+        if asset is not None and page is not None:
+            self._track(page, asset)
+        return asset
+
+    def b64(self, path: str, page: Optional[str] = None) -> str:
+        """Conteúdo em base64 ("" se o arquivo não existir), como os antigos `load_icon_png`."""
+        asset = self.get(path, page)
+        return asset.b64 if asset else ""
+
+    def data_uri(self, path: str, page: Optional[str] = None) -> str:
+        asset = self.get(path, page)
+        return asset.data_uri if asset else ""
+
+    def svg(self, path: str, page: Optional[str] = None) -> str:
+        """Markup do SVG ("" se o arquivo não existir)."""
+        asset = self.get(path, page)
+        return asset.text if asset else ""
+
+    def font_face(self, family: str, path: str, weight: int = 400, page: Optional[str] = None) -> str:
+        """Regra @font-face com a fonte embutida; "" se o arquivo não existir."""
+        asset = self.get(path, page)
+        if asset is None:
+            return ""
+        fmt = _FONT_FORMATS.get(Path(path).suffix.lower(), "opentype")
+        return f"""
+    @font-face {{
+        font-family: '{family}';
+        src: url({asset.data_uri}) format('{fmt}');
+        font-weight: {weight};
+    }}"""
+
+    # ------------------------------------------------------
+    # RELATÓRIO
+    # ------------------------------------------------------
+    def page_report(self) -> Dict[str, Dict[str, int]]:
+        """Por página: nº de assets, bytes embutidos por render e total servido."""
+        with self._lock:
+            return {
+                page: {
+                    "assets": len(assets),
+                    "bytes_per_render": sum(assets.values()),
+                    "bytes_served": self._served[page],
+                }
+                for page, assets in sorted(self._pages.items())
+            }
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            loaded = [a for a in self._assets.values() if a is not None]
+            return {
+                "files": len(loaded),
+                "missing": len(self._assets) - len(loaded),
+                "unique_contents": len(self._b64_by_digest),
+                "raw_bytes": sum(len(a.data) for a in loaded),
+            }
+
+    # ------------------------------------------------------
+    # INTERNOS
+    # ------------------------------------------------------
+    def _load(self, path: str) -> Optional[Asset]:
+        with self._lock:
+            if path in self._assets:  # outra thread carregou enquanto esperávamos
+                return self._assets[path]
+            file = self.root / path
+            if not file.is_file():
+                self._assets[path] = None
+                return None
+            data = file.read_bytes()
+            digest = hashlib.sha256(data).hexdigest()
+            b64 = self._b64_by_digest.get(digest)
+            if b64 is None:
+                b64 = self._b64_by_digest[digest] = base64.b64encode(data).decode("utf-8")
+            suffix = file.suffix.lower()
+            mime = _MIME_TYPES.get(suffix) or mimetypes.guess_type(file.name)[0] or "application/octet-stream"
+            asset = self._assets[path] = Asset(path=path, mime=mime, data=data, digest=digest, b64=b64)
+            return asset
+
+    def _track(self, page: str, asset: Asset) -> None:
+        with self._lock:
+            self._pages.setdefault(page, {})[asset.path] = len(asset.b64)
+            self._served[page] = self._served.get(page, 0) + len(asset.b64)
+
+
+_registry = AssetRegistry()
+
+
+def get_asset_registry() -> AssetRegistry:
+    """Registro de assets compartilhado por todas as páginas e sessões."""
+    return _registry
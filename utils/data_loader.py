@@ -1,6 +1,14 @@
 # utils/data_loader.py
 # -*- coding: utf-8 -*-
 
+import hashlib
+import json
+import os
+import pickle
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from collections.abc import Callable, Iterator, Mapping
+from itertools import chain, islice
 from pathlib import Path
 import pandas as pd
 
@@ -14,22 +22,380 @@ DATA_FILES = {
     "qualifications": "Qualifications.xlsx",
 }
 
+# Snapshots binários (um por workbook) — ficam fora do git, em <raiz>/.cache
+SNAPSHOT_DIR = Path(__file__).parents[1] / ".cache" / "snapshots"
+SNAPSHOT_FORMAT = 1
 
-def load_excel_data(data_dir: Path | None = None) -> dict:
+# Abaixo deste volume de .xlsx a parsear, subir processos custa mais que o parse
+PARALLEL_MIN_BYTES = 2 * 1024 * 1024
+
+
+# ==========================================================
+# SNAPSHOTS
+# ==========================================================
+def _file_sha256(path: Path) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _snapshot_paths(path: Path, snapshot_dir: Path) -> tuple[Path, Path]:
+    # hash do caminho absoluto: workbooks homônimos em data_dirs diferentes
+    # não disputam o mesmo snapshot
+    source = hashlib.sha256(str(path.resolve()).encode("utf-8")).hexdigest()[:12]
+    stem = f"{path.name}.{source}.snapshot"
+    return snapshot_dir / (stem + ".pkl"), snapshot_dir / (stem + ".json")
+
+
+def write_atomic(target: Path, payload: bytes) -> None:
+    """Grava `payload` num temporário ao lado de `target` e o renomeia por cima (leitores nunca veem meio arquivo)."""
+    tmp = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+    with open(tmp, "wb") as f:
+        f.write(payload)
+    os.replace(tmp, target)
+
+
+def _read_snapshot(path: Path, snapshot_dir: Path) -> pd.DataFrame | None:
+    """
+    Devolve o DataFrame do snapshot se ele ainda corresponde ao .xlsx.
+
+    - tamanho + mtime iguais ao manifesto → snapshot válido, sem ler o .xlsx;
+    - tamanho igual mas mtime diferente (ex.: `git checkout`, cópia) → compara
+      o sha256 do conteúdo e, se bater, só atualiza o manifesto.
+    """
+    data_file, meta_file = _snapshot_paths(path, snapshot_dir)
+    try:
+        meta = json.loads(meta_file.read_text(encoding="utf-8"))
+        st = path.stat()
+        if meta.get("format") != SNAPSHOT_FORMAT or meta.get("size") != st.st_size:
+            return None
+
+        if meta.get("mtime_ns") != st.st_mtime_ns:
+            if meta.get("sha256") != _file_sha256(path):
+                return None
+            meta["mtime_ns"] = st.st_mtime_ns
+            write_atomic(meta_file, json.dumps(meta).encode("utf-8"))
+
+        with open(data_file, "rb") as f:
+            return pickle.load(f)
+    except (OSError, ValueError, pickle.UnpicklingError, EOFError, AttributeError):
+        return None
+
+
+def _write_snapshot(path: Path, df: pd.DataFrame, snapshot_dir: Path) -> None:
+    """Grava snapshot + manifesto; falhas de escrita (disco read-only) são ignoradas."""
+    data_file, meta_file = _snapshot_paths(path, snapshot_dir)
+    try:
+        st = path.stat()
+        meta = {
+            "format": SNAPSHOT_FORMAT,
+            "source": path.name,
+            "size": st.st_size,
+            "mtime_ns": st.st_mtime_ns,
+            "sha256": _file_sha256(path),
+        }
+        snapshot_dir.mkdir(parents=True, exist_ok=True)
+        write_atomic(data_file, pickle.dumps(df, protocol=pickle.HIGHEST_PROTOCOL))
+        # manifesto por último: só vale depois que o snapshot existe por inteiro
+        write_atomic(meta_file, json.dumps(meta).encode("utf-8"))
+    except OSError:
+        pass
+
+
+def read_workbook(
+    path: Path,
+    snapshot_dir: Path | None = SNAPSHOT_DIR,
+    columns: list[str] | None = None,
+) -> pd.DataFrame:
+    """
+    Lê um .xlsx passando pelo snapshot binário.
+
+    Com `snapshot_dir=None` o snapshot é ignorado e o arquivo é sempre
+    parseado via `pd.read_excel`. `columns` restringe o resultado a um
+    subconjunto de colunas (na ordem pedida).
+    """
+    if snapshot_dir is None:
+        return pd.read_excel(path, usecols=columns)[columns] if columns else pd.read_excel(path)
+
+    df = _read_snapshot(path, snapshot_dir)
+    if df is None:
+        df = pd.read_excel(path)
+        _write_snapshot(path, df, snapshot_dir)
+    return df[columns] if columns else df
+
+
+# ==========================================================
+# CARGA PREGUIÇOSA
+# ==========================================================
+class LazyExcelData(Mapping):
+    """
+    Mapping { chave: DataFrame } que só lê um workbook quando a chave é
+    acessada pela primeira vez; o resultado fica memorizado por chave.
+
+    - `keys` limita as chaves disponíveis (padrão: todas de DATA_FILES cujo
+      arquivo existe);
+    - `columns` = { chave: [colunas] } restringe as colunas de uma chave;
+    - `prepare` é aplicado uma vez a cada DataFrame recém-carregado.
+
+    Verificar `chave in data` ou iterar as chaves não dispara leitura.
+    """
+
+    def __init__(
+        self,
+        data_dir: Path | None = None,
+        snapshot_dir: Path | None = SNAPSHOT_DIR,
+        keys: list[str] | None = None,
+        columns: dict | None = None,
+        prepare: Callable[[pd.DataFrame], pd.DataFrame] | None = None,
+    ):
+        if data_dir is None:
+            data_dir = Path(__file__).parents[1] / "data"
+
+        self._paths = {
+            key: data_dir / filename
+            for key, filename in DATA_FILES.items()
+            if (keys is None or key in keys) and (data_dir / filename).exists()
+        }
+        self._snapshot_dir = snapshot_dir
+        self._columns = columns or {}
+        self._prepare = prepare
+        self._frames: dict = {}
+        self._locks = {key: threading.Lock() for key in self._paths}
+
+    def __getitem__(self, key: str) -> pd.DataFrame:
+        df = self._frames.get(key)
+        if df is not None:
+            return df
+        if key not in self._paths:
+            raise KeyError(key)
+
+        with self._locks[key]:
+            if key not in self._frames:
+                self._set(key, read_workbook(self._paths[key], self._snapshot_dir, self._columns.get(key)))
+            return self._frames[key]
+
+    def _set(self, key: str, df: pd.DataFrame) -> None:
+        if self._prepare is not None:
+            df = self._prepare(df)
+        self._frames[key] = df
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._paths
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._paths)
+
+    def __len__(self) -> int:
+        return len(self._paths)
+
+    def is_loaded(self, key: str) -> bool:
+        return key in self._frames
+
+    def preload(self, workers: int | None = 1) -> None:
+        """
+        Carrega todas as chaves ainda não lidas.
+
+        Snapshots válidos são lidos aqui mesmo; os workbooks que precisam de
+        parse vão para um pool de `workers` processos (None = um por CPU).
+        Com um único arquivo pendente, ou menos de PARALLEL_MIN_BYTES de .xlsx,
+        o parse é serial — subir o pool custaria mais do que ganharia.
+        """
+        pending = [key for key in self._paths if key not in self._frames]
+
+        if self._snapshot_dir is not None:
+            for key in list(pending):
+                df = _read_snapshot(self._paths[key], self._snapshot_dir)
+                if df is not None:
+                    columns = self._columns.get(key)
+                    with self._locks[key]:
+                        if key not in self._frames:
+                            self._set(key, df[columns] if columns else df)
+                    pending.remove(key)
+
+        workers = workers or os.cpu_count() or 1
+        total_bytes = sum(self._paths[key].stat().st_size for key in pending)
+        if workers < 2 or len(pending) < 2 or total_bytes < PARALLEL_MIN_BYTES:
+            for key in pending:
+                self[key]
+            return
+
+        # maiores primeiro: o arquivo mais lento não fica para o fim da fila
+        pending.sort(key=lambda k: self._paths[k].stat().st_size, reverse=True)
+        with ProcessPoolExecutor(max_workers=min(workers, len(pending))) as pool:
+            futures = {
+                key: pool.submit(read_workbook, self._paths[key], self._snapshot_dir, self._columns.get(key))
+                for key in pending
+            }
+            for key, future in futures.items():
+                df = future.result()
+                with self._locks[key]:
+                    if key not in self._frames:
+                        self._set(key, df)
+
+
+# ==========================================================
+# LEITURA EM STREAMING (workbooks muito grandes)
+# ==========================================================
+# textos que pd.read_excel trata como NaN por padrão
+_NA_STRINGS = frozenset({
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan", "1.#IND",
+    "1.#QNAN", "<NA>", "N/A", "NA", "NULL", "NaN", "None", "n/a", "nan", "null",
+})
+
+
+def _convert_cell(value):
+    # mesmas regras do leitor openpyxl do pandas: float inteiro vira int, "#N/A" vira NaN
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    if isinstance(value, str) and value in _NA_STRINGS:
+        return None
+    return value
+
+
+def _coerce_numeric(batch: pd.DataFrame) -> pd.DataFrame:
+    # como o parser do pandas: coluna só com números/textos numéricos ("09") vira numérica
+    for col in batch.columns:
+        values = batch[col]
+        if pd.api.types.is_numeric_dtype(values) or not values.notna().any():
+            continue
+        try:
+            batch[col] = pd.to_numeric(values)
+        except (ValueError, TypeError):
+            pass
+    return batch
+
+
+def _fit(values, width: int, index: list[int] | None) -> tuple:
+    values = tuple(values[:width]) + (None,) * (width - len(values))
+    return tuple(values[i] for i in index) if index is not None else values
+
+
+def _header_names(values: tuple) -> list[str]:
+    # replica os nomes gerados por pd.read_excel ("Unnamed: i", "Col.1", ...)
+    values = list(values)
+    while values and values[-1] in (None, ""):
+        values.pop()
+    names, seen = [], {}
+    for i, value in enumerate(values):
+        name = f"Unnamed: {i}" if value is None or value == "" else str(value)
+        if name in seen:
+            seen[name] += 1
+            name = f"{name}.{seen[name]}"
+        else:
+            seen[name] = 0
+        names.append(name)
+    return names
+
+
+def iter_excel_batches(
+    source: str | Path,
+    batch_size: int = 1000,
+    columns: list[str] | None = None,
+    dtypes: dict | None = None,
+    data_dir: Path | None = None,
+) -> Iterator[pd.DataFrame]:
+    """
+    Lê um workbook em lotes de até `batch_size` linhas, sem materializar a
+    planilha inteira (openpyxl em modo read-only).
+
+    - `source` é uma chave de DATA_FILES ou o caminho de um .xlsx;
+    - `columns` restringe (e ordena) as colunas de cada lote;
+    - `dtypes` = { coluna: dtype } é aplicado a cada lote, garantindo tipos
+      estáveis entre lotes (ex.: {"Global Grade": "Int64"}).
+
+    A concatenação dos lotes equivale a `pd.read_excel(path)`; o pico de
+    memória fica limitado a um lote, independente do tamanho do arquivo.
+    """
+    from openpyxl import load_workbook
+
+    if isinstance(source, str) and source in DATA_FILES:
+        source = (data_dir or Path(__file__).parents[1] / "data") / DATA_FILES[source]
+
+    wb = load_workbook(source, read_only=True, data_only=True)
+    try:
+        def trimmed():
+            # células vazias no fim da linha não contam para a largura (como no pandas)
+            for row in wb.worksheets[0].iter_rows(values_only=True):
+                values = [_convert_cell(v) for v in row]
+                while values and values[-1] is None:
+                    values.pop()
+                yield values
+
+        rows = trimmed()
+        header = next(rows, None)
+        if header is None:
+            return
+
+        # largura = maior linha entre o cabeçalho e o primeiro lote; colunas que
+        # só aparecem depois disso são descartadas
+        first = list(islice(rows, batch_size))
+        width = max([len(header)] + [len(r) for r in first])
+        names = _header_names(tuple(header) + (None,) * (width - len(header)))
+        names += [f"Unnamed: {i}" for i in range(len(names), width)]
+
+        if columns is not None:
+            missing = set(columns) - set(names)
+            if missing:
+                raise ValueError(f"Missing columns in {Path(source).name}: {', '.join(sorted(missing))}")
+            index = [names.index(c) for c in columns]
+            names = list(columns)
+        else:
+            index = None
+
+        def records():
+            blank = []  # linhas vazias só contam se houver dados depois (como no pandas)
+            for values in chain(first, rows):
+                if not values:
+                    blank.append(())
+                    continue
+                for b in blank:
+                    yield _fit(b, width, index)
+                blank = []
+                yield _fit(values, width, index)
+
+        it = records()
+        while True:
+            chunk = list(islice(it, batch_size))
+            if not chunk:
+                break
+            batch = _coerce_numeric(pd.DataFrame.from_records(chunk, columns=names))
+            if dtypes:
+                batch = batch.astype({c: t for c, t in dtypes.items() if c in batch.columns})
+            yield batch
+    finally:
+        wb.close()
+
+
+# ==========================================================
+# API PÚBLICA
+# ==========================================================
+def load_excel_data(
+    data_dir: Path | None = None,
+    snapshot_dir: Path | None = SNAPSHOT_DIR,
+    keys: list[str] | None = None,
+    columns: dict | None = None,
+    lazy: bool = False,
+    workers: int | None = 1,
+) -> Mapping:
     """
     Carrega os arquivos .xlsx configurados em DATA_FILES a partir da pasta `data`
     e devolve um dicionário: { chave: DataFrame }.
 
     - Ignora silenciosamente arquivos que não existirem.
     - Permite passar um data_dir customizado, mas por padrão usa <raiz>/data.
+    - Cada workbook é convertido uma única vez num snapshot binário (SNAPSHOT_DIR);
+      as cargas seguintes leem o snapshot e só voltam ao .xlsx quando o arquivo
+      muda (tamanho, mtime ou conteúdo). `snapshot_dir=None` força o parse.
+    - `keys` carrega só as chaves pedidas; `columns` = { chave: [colunas] }
+      restringe as colunas de cada chave.
+    - `lazy=True` devolve um LazyExcelData: nada é lido até a chave ser acessada.
+    - `workers` > 1 (ou None = um por CPU) parseia os workbooks num pool de
+      processos; entradas pequenas continuam seriais (ver LazyExcelData.preload).
     """
-    if data_dir is None:
-        data_dir = Path(__file__).parents[1] / "data"
-
-    data = {}
-    for key, filename in DATA_FILES.items():
-        path = data_dir / filename
-        if path.exists():
-            data[key] = pd.read_excel(path)
-
-    return data
+    data = LazyExcelData(data_dir, snapshot_dir, keys=keys, columns=columns)
+    if lazy:
+        return data
+    data.preload(workers)
+    return {key: data[key] for key in data}
@@ -0,0 +1,141 @@
+# utils/data_store.py
+# -*- coding: utf-8 -*-
+
+import hashlib
+import threading
+from collections.abc import Mapping
+from functools import cached_property
+from pathlib import Path
+import pandas as pd
+
+from utils.data_loader import DATA_FILES, LazyExcelData
+
+DATA_DIR = Path(__file__).parents[1] / "data"
+
+
+def _stat_signature(data_dir: Path) -> tuple:
+    """(nome, tamanho, mtime) de cada workbook — barato o bastante para todo rerun."""
+    sig = []
+    for filename in DATA_FILES.values():
+        path = data_dir / filename
+        try:
+            st = path.stat()
+            sig.append((filename, st.st_size, st.st_mtime_ns))
+        except OSError:
+            sig.append((filename, None, None))
+    return tuple(sig)
+
+
+def _content_version(data_dir: Path) -> str:
+    """Hash do conteúdo de todos os workbooks: identifica a versão do dataset."""
+    h = hashlib.sha256()
+    for filename in DATA_FILES.values():
+        path = data_dir / filename
+        h.update(filename.encode("utf-8"))
+        if path.exists():
+            h.update(path.read_bytes())
+    return h.hexdigest()[:16]
+
+
+# ==========================================================
+# DATASTORE
+# ==========================================================
+class DataStore:
+    """
+    Conjunto imutável dos DataFrames de data/, compartilhado pelo processo.
+
+    Os workbooks são lidos sob demanda: uma página que só usa
+    `level_structure` nunca paga o parse dos demais.
+
+    Cada acesso devolve uma cópia rasa (`copy(deep=False)`): não copia dados,
+    mas garante que colunas adicionadas/alteradas por uma página nunca vazem
+    para as outras sessões.
+    """
+
+    def __init__(self, frames: Mapping, version: str, signature: tuple = ()):
+        self._frames = frames
+        self.version = version
+        self.signature = signature
+
+    def frame(self, key: str) -> pd.DataFrame:
+        """DataFrame de `key` (ver DATA_FILES); vazio se o arquivo não existir."""
+        df = self._frames.get(key)
+        if df is None:
+            return pd.DataFrame()
+        return df.copy(deep=False)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._frames
+
+    # ------------------------------------------------------
+    # Frames tipados usados pelas páginas
+    # ------------------------------------------------------
+    @property
+    def job_profile(self) -> pd.DataFrame:
+        return self.frame("job_profile")
+
+    @cached_property
+    def _job_profile_filled(self) -> pd.DataFrame:
+        return self._frames.get("job_profile", pd.DataFrame()).fillna("")
+
+    @property
+    def job_profile_filled(self) -> pd.DataFrame:
+        """Job Profile com textos vazios no lugar de NaN (formato do motor de match)."""
+        return self._job_profile_filled.copy(deep=False)
+
+    @property
+    def job_family(self) -> pd.DataFrame:
+        return self.frame("job_family")
+
+    @property
+    def level_structure(self) -> pd.DataFrame:
+        return self.frame("level_structure")
+
+    @property
+    def career_bands_levels(self) -> pd.DataFrame:
+        return self.frame("career_bands_levels")
+
+    @property
+    def qualifications(self) -> pd.DataFrame:
+        return self.frame("qualifications")
+
+    @property
+    def gi_position_descriptions(self) -> pd.DataFrame:
+        return self.frame("gi_position_descriptions")
+
+
+def _strip_columns(df: pd.DataFrame) -> pd.DataFrame:
+    df.columns = [str(c).strip() for c in df.columns]
+    return df
+
+
+def build_data_store(data_dir: Path | None = None) -> DataStore:
+    data_dir = data_dir or DATA_DIR
+    signature = _stat_signature(data_dir)
+    frames = LazyExcelData(data_dir, prepare=_strip_columns)
+    return DataStore(frames, _content_version(data_dir), signature)
+
+
+# ==========================================================
+# INSTÂNCIA ÚNICA DO PROCESSO
+# ==========================================================
+_store: DataStore | None = None
+_store_lock = threading.Lock()
+
+
+def get_data_store() -> DataStore:
+    """
+    DataStore compartilhado por todas as páginas e sessões do processo.
+
+    É reconstruído apenas quando algum workbook de data/ muda no disco.
+    """
+    global _store
+    signature = _stat_signature(DATA_DIR)
+    store = _store
+    if store is not None and store.signature == signature:
+        return store
+
+    with _store_lock:
+        if _store is None or _store.signature != signature:
+            _store = build_data_store(DATA_DIR)
+        return _store
@@ -0,0 +1,96 @@
+# utils/icons.py
+# -*- coding: utf-8 -*-
+
+import re
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+
+from utils.assets import get_asset_registry
+
+SIG_ICONS_DIR = "assets/icons/sig"
+
+_XML_DECL = re.compile(r"<\?xml[^>]*\?>\s*")
+_SVG_ROOT = re.compile(r"<svg\b([^>]*)>(.*)</svg>", re.S)
+_SIZE_ATTR = re.compile(r'\s(width|height)="([^"]*)"')
+_DROP_ATTR = re.compile(r'\s(?:width|height|xmlns(?::\w+)?)="[^"]*"')
+
+
+# ==========================================================
+# LEITURA (uma vez por arquivo, por processo)
+# ==========================================================
+@lru_cache(maxsize=None)
+def load_svg(svg_name: str) -> str:
+    """Markup do SVG de assets/icons/sig (sem a declaração XML); "" se não existir."""
+    return _XML_DECL.sub("", get_asset_registry().svg(f"{SIG_ICONS_DIR}/{svg_name}")).strip()
+
+
+@lru_cache(maxsize=None)
+def _symbol_parts(svg_name: str) -> Optional[Tuple[str, str, Dict[str, str]]]:
+    """(atributos do <symbol>, conteúdo, width/height originais) do SVG."""
+    match = _SVG_ROOT.search(load_svg(svg_name))
+    if match is None:
+        return None
+    attrs, body = match.groups()
+    size = dict(_SIZE_ATTR.findall(attrs))
+    return _DROP_ATTR.sub("", attrs), body.strip(), size
+
+
+def symbol_id(svg_name: str) -> str:
+    return "icon-" + re.sub(r"[^\w-]", "_", svg_name.rsplit(".", 1)[0])
+
+
+# ==========================================================
+# SPRITE POR DOCUMENTO
+# ==========================================================
+class IconSprite:
+    """
+    Ícones de um documento HTML como sprite SVG.
+
+    `use(arquivo)` devolve um `<svg><use href="#icon-…"/></svg>` pequeno e
+    registra o ícone; `sheet()` devolve o bloco oculto com cada ícone usado
+    uma única vez como `<symbol>` (vai em qualquer ponto do mesmo documento).
+    `report()` compara o tamanho com a versão que repete o SVG inteiro em
+    cada uso.
+    """
+
+    def __init__(self):
+        self._symbols: Dict[str, str] = {}
+        self.uses = 0
+        self.inline_bytes = 0
+        self.use_bytes = 0
+
+    def use(self, svg_name: str) -> str:
+        parts = _symbol_parts(svg_name)
+        if parts is None:
+            return ""
+        attrs, body, size = parts
+        sid = symbol_id(svg_name)
+        if sid not in self._symbols:
+            self._symbols[sid] = f'<symbol id="{sid}"{attrs}>{body}</symbol>'
+
+        size_attrs = "".join(f' {k}="{size[k]}"' for k in ("width", "height") if k in size)
+        markup = f'<svg{size_attrs} aria-hidden="true"><use href="#{sid}"/></svg>'
+        self.uses += 1
+        self.inline_bytes += len(load_svg(svg_name).encode("utf-8"))
+        self.use_bytes += len(markup.encode("utf-8"))
+        return markup
+
+    def sheet(self) -> str:
+        """Bloco oculto com os <symbol>. Sem display:none — clipPath dentro dele deixaria de valer."""
+        if not self._symbols:
+            return ""
+        return (
+            '<svg xmlns="http://www.w3.org/2000/svg" aria-hidden="true" '
+            'style="position:absolute;width:0;height:0;overflow:hidden">'
+            + "".join(self._symbols.values()) + "</svg>"
+        )
+
+    def report(self) -> Dict[str, int]:
+        sprite_bytes = len(self.sheet().encode("utf-8")) + self.use_bytes
+        return {
+            "uses": self.uses,
+            "symbols": len(self._symbols),
+            "inline_bytes": self.inline_bytes,
+            "sprite_bytes": sprite_bytes,
+            "saved_bytes": self.inline_bytes - sprite_bytes,
+        }
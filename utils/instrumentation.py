@@ -0,0 +1,169 @@
+# utils/instrumentation.py
+# -*- coding: utf-8 -*-
+
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger("match_engine.timing")
+
+
+# ==========================================================
+# TRACE — TEMPOS POR ETAPA DE UMA CHAMADA
+# ==========================================================
+class Trace:
+    """
+    Tempo de parede de cada etapa de uma chamada (ex.: rank_job_matches).
+
+    `mark(etapa, rows)` fecha a etapa corrente: o tempo é contado desde o
+    mark anterior (ou do início). `finish()` entrega o registro aos sinks.
+    """
+
+    __slots__ = ("name", "meta", "stages", "_t0", "_last")
+
+    def __init__(self, name: str, meta: Dict[str, Any]):
+        self.name = name
+        self.meta = meta
+        self.stages: List[Dict[str, Any]] = []
+        self._t0 = self._last = time.perf_counter()
+
+    def mark(self, stage: str, rows: Optional[int] = None) -> None:
+        now = time.perf_counter()
+        self.stages.append({"stage": stage, "ms": (now - self._last) * 1000, "rows": rows})
+        self._last = now
+
+    def finish(self) -> None:
+        record = {
+            "ts": time.time(),
+            "call": self.name,
+            "total_ms": (time.perf_counter() - self._t0) * 1000,
+            "stages": self.stages,
+            **self.meta,
+        }
+        for sink in list(_sinks):
+            try:
+                sink.emit(record)
+            except Exception:
+                # instrumentação nunca derruba o match
+                logger.debug("timing sink %r failed", sink, exc_info=True)
+
+
+def start_trace(name: str, **meta: Any) -> Optional[Trace]:
+    """
+    Trace para uma chamada, ou None se nenhum sink estiver ativo.
+
+    Uso no código instrumentado (custo desligado = um `if`):
+        trace = start_trace("rank_job_matches")
+        ...
+        if trace: trace.mark("score", rows=n)
+    """
+    if not _sinks:
+        return None
+    return Trace(name, meta)
+
+
+# ==========================================================
+# SINKS
+# ==========================================================
+class LoggerSink:
+    """Uma linha de log por chamada (logger "match_engine.timing")."""
+
+    def __init__(self, log: logging.Logger = logger, level: int = logging.INFO):
+        self.log = log
+        self.level = level
+
+    def emit(self, record: Dict[str, Any]) -> None:
+        if self.log.isEnabledFor(self.level):
+            stages = " ".join(
+                f"{s['stage']}={s['ms']:.3f}ms" + (f"/{s['rows']}" if s["rows"] is not None else "")
+                for s in record["stages"]
+            )
+            self.log.log(self.level, "%s total=%.3fms %s", record["call"], record["total_ms"], stages)
+
+
+class RingBufferSink:
+    """Últimas `maxlen` chamadas em memória (painel de admin)."""
+
+    def __init__(self, maxlen: int = 500):
+        self._records: deque = deque(maxlen=maxlen)
+
+    def emit(self, record: Dict[str, Any]) -> None:
+        self._records.append(record)  # deque.append é atômico
+
+    def records(self) -> List[Dict[str, Any]]:
+        return list(self._records)
+
+    def clear(self) -> None:
+        self._records.clear()
+
+
+class JsonLinesSink:
+    """Um objeto JSON por linha, anexado a `path`."""
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+
+    def emit(self, record: Dict[str, Any]) -> None:
+        line = json.dumps(record, ensure_ascii=False, default=str) + "\n"
+        with self._lock:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line)
+
+
+# ==========================================================
+# REGISTRO DE SINKS
+# ==========================================================
+_sinks: List[Any] = []
+_sinks_lock = threading.Lock()
+
+
+def add_sink(sink: Any) -> Any:
+    """Ativa um sink (qualquer objeto com `emit(record)`); devolve o próprio sink."""
+    with _sinks_lock:
+        if sink not in _sinks:
+            _sinks.append(sink)
+    return sink
+
+
+def remove_sink(sink: Any) -> None:
+    with _sinks_lock:
+        if sink in _sinks:
+            _sinks.remove(sink)
+
+
+def get_ring_buffer() -> Optional[RingBufferSink]:
+    """O primeiro RingBufferSink ativo, se houver (usado pelo painel de admin)."""
+    for sink in _sinks:
+        if isinstance(sink, RingBufferSink):
+            return sink
+    return None
+
+
+def configure_from_env(value: Optional[str] = None) -> None:
+    """
+    Ativa sinks a partir de MATCH_TIMING, separados por vírgula:
+        log            → LoggerSink
+        ring[:N]       → RingBufferSink(N)
+        jsonl:<path>   → JsonLinesSink(path)
+    Vazio/ausente → instrumentação desligada.
+    """
+    value = os.environ.get("MATCH_TIMING", "") if value is None else value
+    for spec in filter(None, (s.strip() for s in value.split(","))):
+        kind, _, arg = spec.partition(":")
+        if kind == "log":
+            add_sink(LoggerSink())
+        elif kind == "ring":
+            add_sink(RingBufferSink(int(arg) if arg else 500))
+        elif kind == "jsonl" and arg:
+            add_sink(JsonLinesSink(arg))
+        else:
+            logger.warning("MATCH_TIMING: unknown sink %r ignored", spec)
+
+
+configure_from_env()
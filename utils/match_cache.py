@@ -0,0 +1,104 @@
+# utils/match_cache.py
+# -*- coding: utf-8 -*-
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Tuple
+
+# formulários distintos guardados por processo
+DEFAULT_MAXSIZE = 256
+
+
+def form_signature(form_inputs: Dict[str, Any], version: str, k: int = 1) -> str:
+    """
+    Hash canônico do formulário + versão do dataset.
+
+    Chaves em ordem alfabética e multiselects ordenados/sem repetição: a ordem
+    em que o usuário clicou nos KPIs não muda o match, então não muda a chave.
+    """
+    canonical = {}
+    for key, value in form_inputs.items():
+        if isinstance(value, (list, tuple, set)):
+            canonical[key] = sorted({str(v) for v in value})
+        else:
+            canonical[key] = str(value)
+    payload = json.dumps([canonical, version, k], sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+# ==========================================================
+# CACHE LRU
+# ==========================================================
+class MatchResultCache:
+    """
+    LRU limitado de (ranking, HTML renderizado) por assinatura de formulário.
+
+    Compartilhado entre sessões: os valores guardados não devem ser alterados
+    por quem os recebe. Contadores de hits/misses/evictions em `stats()`.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[str, Tuple[List[Dict[str, Any]], str]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_or_compute(
+        self,
+        form_inputs: Dict[str, Any],
+        version: str,
+        compute: Callable[[], Tuple[List[Dict[str, Any]], str]],
+        k: int = 1,
+    ) -> Tuple[List[Dict[str, Any]], str]:
+        """(ranking, html) do cache; senão chama `compute()` e guarda o resultado."""
+        key = form_signature(form_inputs, version, k)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry
+            self.misses += 1
+
+        # calcula fora do lock: um match lento não bloqueia as outras sessões
+        entry = compute()
+
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return entry
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+
+# ==========================================================
+# INSTÂNCIA ÚNICA DO PROCESSO
+# ==========================================================
+_cache = MatchResultCache()
+
+
+def get_match_cache() -> MatchResultCache:
+    """Cache de resultados do Job Match compartilhado por todas as sessões."""
+    return _cache